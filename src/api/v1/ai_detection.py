@@ -2,7 +2,7 @@
 AI Detection API endpoints with limits tracking.
 """
 
-from typing import Annotated
+from typing import Annotated, AsyncIterator
 
 from dishka import FromDishka
 from dishka.integrations.fastapi import DishkaRoute
@@ -31,6 +31,8 @@ from src.services.url_detection_service import URLDetectionService
 
 logger = get_logger(__name__)
 
+_UPLOAD_CHUNK_SIZE = 1024 * 1024
+
 router = APIRouter(
     prefix="/ai-detection",
     route_class=DishkaRoute,
@@ -58,6 +60,12 @@ def _map_detection_source_to_schema(source: DetectionSource) -> DetectionSourceS
     return mapping[source]
 
 
+async def _iter_upload(file: UploadFile) -> AsyncIterator[bytes]:
+    """Read an upload in fixed-size chunks instead of one large bytes object."""
+    while chunk := await file.read(_UPLOAD_CHUNK_SIZE):
+        yield chunk
+
+
 class AIDetectionWithLimitsResponse(AIDetectionResponse):
     """Extended response with user limits."""
     limits: UserLimitsResponse
@@ -270,15 +278,10 @@ async def detect_from_file(
             language_effective=lang_ctx.effective,
         )
 
-        # Read file content
-        file_content = await file.read()
-
-        if not file_content:
-            raise ValueError("Uploaded file is empty")
-
-        # Detect AI text from file (includes limit checking and history tracking)
+        # Detect AI text from file (includes limit checking and history tracking);
+        # the upload is streamed to disk chunk by chunk
         result_dto, limits_dto = await service.detect_from_file(
-            file_content=file_content,
+            file_content=_iter_upload(file),
             file_name=file.filename or "unknown",
             content_type=file.content_type or "application/octet-stream",
             user_id=current_user.id,
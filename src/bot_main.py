@@ -34,6 +34,9 @@ async def main():
     """Main entry point for the Telegram bot."""
     logger.info("telegram_bot_starting", app_name=config.APP_NAME)
 
+    if config.ASYNCIO_EAGER_TASKS:
+        asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
+
     container = make_async_container(AppProvider(), context={Config: config})
     redis_connection: Redis | None = None
 
@@ -46,8 +49,10 @@ async def main():
         session_maker = await container.get(async_sessionmaker[AsyncSession])
         gemini_svc = await container.get(GeminiTextExtractor)
         ml_svc = await container.get(AIDetectionModelService)
+        await ml_svc.warmup()
         norm_svc = await container.get(TextNormalizationService)
         newspaper_svc = await container.get(NewspaperService)
+        await newspaper_svc.warmup()
 
         redis_connection = await create_redis_client()
         redis_client: RedisClient | None = RedisClient(redis_connection)
@@ -9,17 +9,29 @@ load_dotenv()
 class Config(BaseSettings):
     APP_NAME: str = "Testing"
     DEBUG: bool = False
+    # Run new tasks eagerly until their first suspension (Python 3.12+), so
+    # cache hits and other non-blocking paths skip a loop round-trip.
+    ASYNCIO_EAGER_TASKS: bool = True
     DB_USER: str
     DB_PASSWORD: str
     DB_NAME: str
     DB_HOST: str
     DB_PORT: int = 5432
+    # Connections each process keeps open (max_overflow is 0). The bot holds
+    # a session across a whole detection, so keep this at or above the
+    # number of detections it should run concurrently.
+    DB_POOL_SIZE: int = Field(default=5, ge=1)
 
     # JWT Configuration
     SECRET_KEY: str
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
     REFRESH_TOKEN_EXPIRE_DAYS: int = 7
+    # In-process cache of bearer token -> authenticated user (0 disables);
+    # rejections (401/403) are cached for the shorter negative TTL
+    AUTH_CACHE_TTL_SECONDS: int = 60
+    AUTH_CACHE_NEGATIVE_TTL_SECONDS: int = 5
+    AUTH_CACHE_SIZE: int = 10_000
     EMAIL_VERIFICATION_TOKEN_EXPIRE_HOURS: int = 48
     PASSWORD_RESET_TOKEN_EXPIRE_HOURS: int = 24
     # Registration: DNS check that the domain exists and can receive mail (email-validator).
@@ -7,6 +7,25 @@ class GeminiConfig(BaseSettings):
     GEMINI_MODEL: str = "gemini-2.0-flash-exp"
     MAX_FILE_SIZE_MB: int = 20
     ALLOWED_FILE_EXTENSIONS: List[str]
+    # Directory for spooled uploads; point at a tmpfs (e.g. /dev/shm) to keep
+    # them in RAM. None = the system default temp dir.
+    UPLOAD_TEMP_DIR: str | None = None
+    # Upper bound on waiting for an uploaded file to leave PROCESSING state.
+    FILE_PROCESSING_TIMEOUT_SECONDS: float = 60.0
+    # Concurrent Gemini extraction jobs per process, and a requests-per-minute
+    # budget shared by upload/generate calls (0 = no per-minute cap).
+    GEMINI_MAX_CONCURRENCY: int = 2
+    GEMINI_REQUESTS_PER_MINUTE: int = 0
+    # Extracted texts kept in-process, keyed by file content hash (0 = off).
+    TEXT_CACHE_SIZE: int = 128
+
+    @field_validator("UPLOAD_TEMP_DIR", mode="before")
+    @classmethod
+    def _empty_temp_dir_is_default(cls, value):
+        # "UPLOAD_TEMP_DIR=" in .env means the system temp dir, not the CWD.
+        if isinstance(value, str) and not value.strip():
+            return None
+        return value
 
     class Config:
         env_file = ".env"
@@ -7,15 +7,29 @@ timestamps, and context information for better observability.
 
 from __future__ import annotations
 
+import json
 import logging
 import sys
 from pathlib import Path
 from typing import Any
 
 import structlog
+from pydantic_core import PydanticSerializationError, to_json
 from structlog.types import FilteringBoundLogger
 
 
+def _dumps(event_dict: dict[str, Any], default: Any = None, **_: Any) -> str:
+    """JSON-encode a log event with pydantic-core (Rust) instead of stdlib json.
+
+    pydantic-core rejects strings with lone surrogates and non-UTF-8 bytes;
+    such events go through stdlib json so logging never raises.
+    """
+    try:
+        return to_json(event_dict, fallback=default).decode()
+    except PydanticSerializationError:
+        return json.dumps(event_dict, default=default)
+
+
 def setup_logging(level: str = "INFO", log_file: str | None = None, json_logs: bool = True) -> None:
     """
     Configure structured logging for the application.
@@ -41,6 +55,9 @@ def setup_logging(level: str = "INFO", log_file: str | None = None, json_logs: b
     logging.getLogger("sqlalchemy.engine").setLevel(logging.WARNING)
 
     processors = [
+        # Drop events below the configured level before any other processor
+        # (contextvars merge, timestamping, rendering) does work on them.
+        structlog.stdlib.filter_by_level,
         structlog.contextvars.merge_contextvars,
         structlog.stdlib.add_log_level,
         structlog.stdlib.add_logger_name,
@@ -52,7 +69,7 @@ def setup_logging(level: str = "INFO", log_file: str | None = None, json_logs: b
     ]
 
     if json_logs:
-        processors.append(structlog.processors.JSONRenderer())
+        processors.append(structlog.processors.JSONRenderer(serializer=_dumps))
     else:
         processors.append(structlog.dev.ConsoleRenderer())
 
@@ -19,6 +19,18 @@ class RedisConfig(BaseSettings):
     RATE_LIMIT_ENABLED: bool = True
     RATE_LIMIT_PER_MINUTE: int = 10
     RATE_LIMIT_PER_HOUR: int = 100
+    # Opt-in sliding-log limiter (smoother, no 2x burst at window edges)
+    RATE_LIMIT_SLIDING_WINDOW: bool = False
+
+    # Max seconds an "over quota" verdict is served from Redis before
+    # re-checking user_limits in Postgres
+    LIMIT_CACHE_TTL_SECONDS: int = 60
+
+    # Extracted articles are shared across users/workers for this long;
+    # 0 disables the article cache
+    ARTICLE_CACHE_TTL_SECONDS: int = 3600
+    # Single-flight lock held while one worker downloads a URL
+    ARTICLE_FETCH_LOCK_SECONDS: int = 30
 
     class Config:
         env_file = ".env"
@@ -17,6 +17,9 @@ from src.core.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Reject tokens missing these claims before any further claim checks
+_ACCESS_TOKEN_DECODE_OPTIONS = {"require": ["exp", "sub"]}
+
 
 def hash_password(password: str) -> str:
     """
@@ -104,6 +107,12 @@ def generate_refresh_token() -> str:
     """
     Generate a cryptographically secure random refresh token.
 
+    Randomness is drawn per call on purpose. A pre-filled ``os.urandom`` pool
+    would be copied into every forked worker (uvicorn/gunicorn), handing out
+    identical tokens across processes, and it keeps future secrets resident
+    in memory. ``token_urlsafe`` is a single getrandom(2) call plus C-level
+    base64, far below the cost of the INSERT that stores the token.
+
     Returns:
         URL-safe random token string
     """
@@ -126,7 +135,16 @@ def decode_access_token(token: str, config: Config) -> Dict[str, Any]:
         jwt.InvalidTokenError: If token is invalid
     """
     try:
-        payload = jwt.decode(token, config.SECRET_KEY, algorithms=[config.ALGORITHM])
+        # Cheap syntactic check: a compact JWS always has exactly three parts
+        if token.count(".") != 2:
+            raise jwt.DecodeError("Not enough or too many segments")
+
+        payload = jwt.decode(
+            token,
+            config.SECRET_KEY,
+            algorithms=[config.ALGORITHM],
+            options=_ACCESS_TOKEN_DECODE_OPTIONS,
+        )
 
         if payload.get("type") != "access":
             logger.warning("invalid_token_type", token_type=payload.get("type"))
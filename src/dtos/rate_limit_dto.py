@@ -14,7 +14,7 @@ class RateLimitPeriod(str, Enum):
     DAY = "day"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class RateLimitInfo:
     """Rate limit information."""
     limit: int
@@ -23,7 +23,7 @@ class RateLimitInfo:
     period: RateLimitPeriod
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class RateLimitStatus:
     """Complete rate limit status for a user."""
     user_id: str
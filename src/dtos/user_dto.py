@@ -5,7 +5,7 @@ DTOs are used to transfer data between service layer and other layers.
 They are simple dataclasses without validation logic.
 """
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from datetime import datetime
 from typing import Optional
 
@@ -60,9 +60,14 @@ class RefreshTokenDTO:
     ip_address: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AuthenticatedUserDTO:
-    """DTO for authenticated user with context information."""
+    """
+    DTO for authenticated user with context information.
+
+    Built from a trusted DB row on every authenticated request and shared
+    through the auth cache, hence slotted and immutable.
+    """
     id: str  # ULID
     username: str
     email: str
@@ -71,4 +76,4 @@ class AuthenticatedUserDTO:
     created_at: datetime
     updated_at: datetime
     has_password: bool = False
-    auth_providers: list[str] = field(default_factory=list)
+    auth_providers: tuple[str, ...] = ()
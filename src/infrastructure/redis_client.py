@@ -2,7 +2,7 @@
 Redis client abstraction for clean architecture.
 """
 
-from typing import Optional
+from typing import Any, Optional, Sequence
 from datetime import datetime, timedelta, timezone
 
 import redis.asyncio as redis
@@ -25,6 +25,7 @@ class RedisClient:
             redis_instance: Redis connection instance
         """
         self._redis = redis_instance
+        self._scripts: dict[str, Any] = {}
 
     async def get(self, key: str) -> Optional[str]:
         """
@@ -42,11 +43,28 @@ class RedisClient:
             logger.error(f"redis_get_error: {e}", key=key)
             raise
 
+    async def mget(self, *keys: str) -> list[Optional[str]]:
+        """
+        Get several values from Redis in one round-trip.
+
+        Args:
+            keys: Redis keys
+
+        Returns:
+            Values in key order (None for missing keys)
+        """
+        try:
+            return await self._redis.mget(keys)
+        except Exception as e:
+            logger.error(f"redis_mget_error: {e}", keys=keys)
+            raise
+
     async def set(
             self,
             key: str,
             value: str,
-            expire: Optional[int] = None
+            expire: Optional[int] = None,
+            nx: bool = False,
     ) -> bool:
         """
         Set value in Redis.
@@ -55,12 +73,13 @@ class RedisClient:
             key: Redis key
             value: Value to store
             expire: Optional expiration time in seconds
+            nx: Only set the key if it does not already exist
 
         Returns:
-            True if successful
+            True if successful (False when nx is set and the key exists)
         """
         try:
-            return await self._redis.set(key, value, ex=expire)
+            return bool(await self._redis.set(key, value, ex=expire, nx=nx))
         except Exception as e:
             logger.error(f"redis_set_error: {e}", key=key)
             raise
@@ -130,6 +149,64 @@ class RedisClient:
             logger.error(f"redis_delete_error: {e}", keys=keys)
             raise
 
+    async def unlink_matching(self, pattern: str, count: int = 500) -> int:
+        """
+        Remove every key matching *pattern*.
+
+        Keys are discovered with SCAN (non-blocking, cursor based) and removed
+        with UNLINK in a single pipelined burst, so memory is reclaimed in the
+        background instead of blocking Redis.
+
+        Args:
+            pattern: Glob-style SCAN MATCH pattern
+            count: SCAN batch size hint
+
+        Returns:
+            Number of keys unlinked
+        """
+        try:
+            pipe = self._redis.pipeline(transaction=False)
+            queued = 0
+            async for key in self._redis.scan_iter(match=pattern, count=count):
+                pipe.unlink(key)
+                queued += 1
+            if not queued:
+                return 0
+            return sum(await pipe.execute())
+        except Exception as e:
+            logger.error(f"redis_unlink_error: {e}", pattern=pattern)
+            raise
+
+    async def run_script(
+            self,
+            script: str,
+            keys: Sequence[str],
+            args: Sequence[Any],
+    ) -> Any:
+        """
+        Execute a Lua script atomically.
+
+        Scripts are registered once per client and invoked via EVALSHA;
+        redis-py reloads the script transparently on NOSCRIPT.
+
+        Args:
+            script: Lua source
+            keys: KEYS passed to the script
+            args: ARGV passed to the script
+
+        Returns:
+            Script result
+        """
+        try:
+            runner = self._scripts.get(script)
+            if runner is None:
+                runner = self._redis.register_script(script)
+                self._scripts[script] = runner
+            return await runner(keys=list(keys), args=list(args))
+        except Exception as e:
+            logger.error(f"redis_script_error: {e}", keys=keys)
+            raise
+
     async def ping(self) -> bool:
         """
         Ping Redis to check connection.
@@ -41,6 +41,7 @@ class DatabaseProvider(Provider):
         return create_async_engine(
             config.db_url,
             echo=False,
+            pool_size=config.DB_POOL_SIZE,
             pool_pre_ping=True,
             pool_recycle=3600,
             pool_timeout=20,
@@ -8,6 +8,8 @@ from dishka import Provider, Scope, provide
 from redis.asyncio import Redis
 
 from src.infrastructure.redis_client import RedisClient, create_redis_client
+from src.repositories.article_cache_repository import ArticleCacheRepository
+from src.repositories.limit_cache_repository import LimitCacheRepository
 from src.repositories.rate_limiter_repository import RateLimiterRepository
 from src.services.rate_limiter_service import RateLimiterService
 
@@ -57,6 +59,36 @@ class RedisProvider(Provider):
         """
         return RateLimiterRepository(redis_client)
 
+    @provide(scope=Scope.REQUEST)
+    def get_limit_cache_repository(
+            self, redis_client: RedisClient
+    ) -> LimitCacheRepository:
+        """
+        Provide cache of over-quota verdicts for user limits.
+
+        Args:
+            redis_client: Redis client instance
+
+        Returns:
+            LimitCacheRepository instance
+        """
+        return LimitCacheRepository(redis_client)
+
+    @provide(scope=Scope.REQUEST)
+    def get_article_cache_repository(
+            self, redis_client: RedisClient
+    ) -> ArticleCacheRepository:
+        """
+        Provide shared cache of extracted URL articles.
+
+        Args:
+            redis_client: Redis client instance
+
+        Returns:
+            ArticleCacheRepository instance
+        """
+        return ArticleCacheRepository(redis_client)
+
     @provide(scope=Scope.REQUEST)
     def get_rate_limiter_service(
             self, repository: RateLimiterRepository
@@ -2,11 +2,15 @@
 Service provider for dependency injection.
 """
 
+from typing import AsyncIterable
+
 from dishka import Provider, Scope, provide
 
 from src.core.config import Config
 from src.repositories.auth_repository import AuthRepository
 from src.repositories.ai_detection_repository import AIDetectionRepository
+from src.repositories.article_cache_repository import ArticleCacheRepository
+from src.repositories.limit_cache_repository import LimitCacheRepository
 from src.repositories.subscription_repository import SubscriptionRepository
 from src.services.auth_service import AuthService
 from src.services.google_oauth_client import GoogleOAuthClient
@@ -48,14 +52,22 @@ class ServiceProvider(Provider):
         return GeminiTextExtractor()
 
     @provide(scope=Scope.APP)
-    def get_ml_model_service(self) -> AIDetectionModelService:
+    async def get_ml_model_service(self) -> AsyncIterable[AIDetectionModelService]:
         """ML microservice client for AI text detection inference."""
-        return AIDetectionModelService()
+        service = AIDetectionModelService()
+        try:
+            yield service
+        finally:
+            await service.close()
 
     @provide(scope=Scope.APP)
-    def get_newspaper_service(self) -> NewspaperService:
+    async def get_newspaper_service(self) -> AsyncIterable[NewspaperService]:
         """URL article extraction: httpx download + newspaper4k + BeautifulSoup fallbacks."""
-        return NewspaperService()
+        service = NewspaperService()
+        try:
+            yield service
+        finally:
+            await service.close()
 
     @provide(scope=Scope.APP)
     def get_normalization_service(self) -> TextNormalizationService:
@@ -71,12 +83,14 @@ class ServiceProvider(Provider):
         ml_model_service: AIDetectionModelService,
         ai_detection_repository: AIDetectionRepository,
         normalization_service: TextNormalizationService,
+        limit_cache: LimitCacheRepository,
     ) -> AIDetectionService:
         return AIDetectionService(
             gemini_service,
             ml_model_service,
             ai_detection_repository,
             normalization_service,
+            limit_cache,
         )
 
     @provide(scope=Scope.REQUEST)
@@ -86,12 +100,14 @@ class ServiceProvider(Provider):
         ml_model_service: AIDetectionModelService,
         ai_detection_repository: AIDetectionRepository,
         normalization_service: TextNormalizationService,
+        article_cache: ArticleCacheRepository,
     ) -> URLDetectionService:
         return URLDetectionService(
             newspaper_service,
             ml_model_service,
             ai_detection_repository,
             normalization_service,
+            article_cache,
         )
 
     @provide(scope=Scope.REQUEST)
@@ -115,5 +131,8 @@ class ServiceProvider(Provider):
         subscription_repo: SubscriptionRepository,
         ai_detection_repo: AIDetectionRepository,
         auth_repo: AuthRepository,
+        limit_cache: LimitCacheRepository,
     ) -> StripeService:
-        return StripeService(config, subscription_repo, ai_detection_repo, auth_repo)
\ No newline at end of file
+        return StripeService(
+            config, subscription_repo, ai_detection_repo, auth_repo, limit_cache
+        )
\ No newline at end of file
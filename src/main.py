@@ -22,6 +22,8 @@ from src.core.config import config, Config
 from src.core.logging import get_logger, setup_logging
 from src.db.database import check_db_connection
 from src.ioc import AppProvider
+from src.services.ml_model_service import AIDetectionModelService
+from src.services.newspaper_service import NewspaperService
 from fastapi.middleware.cors import CORSMiddleware
 
 setup_logging(
@@ -37,6 +39,9 @@ async def lifespan(app: FastAPI):
     """FastAPI application lifecycle - HTTP API only."""
     logger.info("application_startup", app_name=config.APP_NAME)
 
+    if config.ASYNCIO_EAGER_TASKS:
+        asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
+
     try:
         container = app.state.dishka_container
         engine = await container.get(AsyncEngine)
@@ -46,6 +51,12 @@ async def lifespan(app: FastAPI):
 
         logger.info("startup_database_connected")
 
+        ml_model_service = await container.get(AIDetectionModelService)
+        await ml_model_service.warmup()
+
+        newspaper_service = await container.get(NewspaperService)
+        await newspaper_service.warmup()
+
     except Exception as exc:
         logger.error(
             "startup_failed",
@@ -57,6 +68,7 @@ async def lifespan(app: FastAPI):
 
     yield
 
+    await app.state.dishka_container.close()
     logger.info("application_shutdown", app_name=config.APP_NAME)
 
 
@@ -5,7 +5,7 @@ AI Detection repository for database operations.
 from datetime import datetime, timezone, timedelta
 from typing import Optional, List
 
-from sqlalchemy import select, func, and_
+from sqlalchemy import select, func, and_, case, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.models.ai_detection import AIDetectionHistory, UserLimit
@@ -132,21 +132,44 @@ class AIDetectionRepository:
         """
         Increment usage counters for user.
 
+        Window resets and the increment are folded into one
+        ``UPDATE ... RETURNING`` so concurrent requests can't lose updates and
+        the common path is a single round-trip.
+
         Args:
             user_id: User ID
 
         Returns:
             Updated UserLimit object
         """
-        user_limit = await self.get_or_create_user_limit(user_id)
-        user_limit = await self.check_and_reset_limits(user_limit)
-
-        user_limit.daily_used += 1
-        user_limit.monthly_used += 1
-        user_limit.total_requests += 1
+        now = datetime.now(timezone.utc)
+        daily_expired = UserLimit.daily_reset_at <= now
+        monthly_expired = UserLimit.monthly_reset_at <= now
+        stmt = (
+            update(UserLimit)
+            .where(UserLimit.user_id == user_id)
+            .values(
+                daily_used=case((daily_expired, 1), else_=UserLimit.daily_used + 1),
+                daily_reset_at=case(
+                    (daily_expired, now + timedelta(days=1)),
+                    else_=UserLimit.daily_reset_at,
+                ),
+                monthly_used=case((monthly_expired, 1), else_=UserLimit.monthly_used + 1),
+                monthly_reset_at=case(
+                    (monthly_expired, now + timedelta(days=30)),
+                    else_=UserLimit.monthly_reset_at,
+                ),
+                total_requests=UserLimit.total_requests + 1,
+            )
+            .returning(UserLimit)
+            .execution_options(synchronize_session=False, populate_existing=True)
+        )
 
-        await self.session.flush()
-        await self.session.refresh(user_limit)
+        user_limit = await self.session.scalar(stmt)
+        if user_limit is None:
+            # First request ever for this user: create the row, then increment.
+            await self.get_or_create_user_limit(user_id)
+            user_limit = await self.session.scalar(stmt)
 
         logger.info(
             "usage_incremented",
@@ -0,0 +1,115 @@
+"""
+Article cache repository for Redis operations.
+
+Caches extracted articles by URL so the same page requested by several
+users (or API workers) is downloaded and parsed once per TTL. A short
+``SET NX`` lock lets one worker fetch a URL while the others wait for the
+cached result instead of downloading it in parallel.
+"""
+
+import hashlib
+import uuid
+from dataclasses import asdict
+from typing import Optional
+
+from pydantic_core import from_json, to_json
+
+from src.core.logging import get_logger
+from src.core.redis_config import redis_config
+from src.dtos.ai_detection_dto import NewspaperFetchResultDTO
+from src.infrastructure.redis_client import RedisClient
+
+logger = get_logger(__name__)
+
+# Delete the lock only if it still holds our token, atomically: a lock that
+# expired and was taken by another worker must not be released by us.
+_RELEASE_LOCK_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+
+class ArticleCacheRepository:
+    """Repository for cached URL extraction results in Redis."""
+
+    def __init__(self, redis_client: RedisClient):
+        """
+        Initialize article cache repository.
+
+        Args:
+            redis_client: Redis client instance
+        """
+        self.redis = redis_client
+
+    @staticmethod
+    def _digest(url: str) -> str:
+        return hashlib.sha1(url.encode()).hexdigest()
+
+    @classmethod
+    def _key(cls, url: str) -> str:
+        return f"article:v1:{cls._digest(url)}"
+
+    @classmethod
+    def _lock_key(cls, url: str) -> str:
+        return f"article:lock:{cls._digest(url)}"
+
+    async def get(self, url: str) -> Optional[NewspaperFetchResultDTO]:
+        """
+        Return the cached article for *url*, if any.
+
+        Redis errors and undecodable entries are treated as a cache miss.
+        """
+        try:
+            cached = await self.redis.get(self._key(url))
+        except Exception:
+            return None
+        if not cached:
+            return None
+        try:
+            return NewspaperFetchResultDTO(**from_json(cached))
+        except (ValueError, TypeError) as e:
+            logger.warning("article_cache_decode_failed", url=url, error=str(e))
+            return None
+
+    async def set(self, article: NewspaperFetchResultDTO, url: str) -> None:
+        """Cache *article* under *url* for ARTICLE_CACHE_TTL_SECONDS."""
+        ttl = redis_config.ARTICLE_CACHE_TTL_SECONDS
+        if ttl <= 0:
+            return
+        try:
+            await self.redis.set(
+                self._key(url), to_json(asdict(article)).decode(), expire=ttl
+            )
+        except Exception as e:
+            logger.warning("article_cache_write_failed", url=url, error=str(e))
+
+    async def acquire_lock(self, url: str) -> Optional[str]:
+        """
+        Try to become the single fetcher for *url*.
+
+        Returns:
+            Lock token to pass to release_lock, or None if another worker
+            holds the lock. Redis errors grant the lock (fetch proceeds).
+        """
+        token = uuid.uuid4().hex
+        try:
+            acquired = await self.redis.set(
+                self._lock_key(url),
+                token,
+                expire=redis_config.ARTICLE_FETCH_LOCK_SECONDS,
+                nx=True,
+            )
+        except Exception:
+            return token
+        return token if acquired else None
+
+    async def release_lock(self, url: str, token: str) -> None:
+        """Drop the fetch lock if this worker still owns it."""
+        try:
+            await self.redis.run_script(
+                _RELEASE_LOCK_SCRIPT, keys=[self._lock_key(url)], args=[token]
+            )
+        except Exception as e:
+            logger.warning("article_cache_unlock_failed", url=url, error=str(e))
@@ -8,12 +8,35 @@ import re
 from datetime import datetime, timedelta, timezone
 from typing import Optional
 
-from sqlalchemy import func, select, update
+from sqlalchemy import bindparam, func, insert, lambda_stmt, select, update
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.models.auth import User, RefreshToken, RegistrationToken, PasswordResetToken, OAuthAccount
 
 
+# Hot lookups hit on every login / token refresh. Built once as lambda
+# statements with explicit bind parameters so the compiled form is cached and
+# reused regardless of the concrete value passed in.
+_USER_BY_USERNAME = lambda_stmt(
+    lambda: select(User).where(User.username == bindparam("username"))
+)
+_USER_BY_EMAIL = lambda_stmt(
+    lambda: select(User).where(User.email == bindparam("email"))
+)
+_USER_BY_ID = lambda_stmt(lambda: select(User).where(User.id == bindparam("user_id")))
+
+
+def _duplicate_user_field(exc: IntegrityError) -> Optional[str]:
+    """Name the users column whose unique index *exc* violated, if any."""
+    cause = getattr(exc.orig, "__cause__", None)
+    detail = getattr(cause, "constraint_name", None) or str(exc.orig)
+    for field in ("username", "email"):
+        if f"ix_users_{field}" in detail or f"users_{field}_key" in detail:
+            return field
+    return None
+
+
 class AuthRepository:
     """Repository for authentication-related database operations."""
 
@@ -30,9 +53,7 @@ class AuthRepository:
         Returns:
             User object or None if not found
         """
-        result = await self.session.execute(
-            select(User).where(User.username == username)
-        )
+        result = await self.session.execute(_USER_BY_USERNAME, {"username": username})
         return result.scalar_one_or_none()
 
     async def get_user_by_email(self, email: str) -> Optional[User]:
@@ -45,9 +66,7 @@ class AuthRepository:
         Returns:
             User object or None if not found
         """
-        result = await self.session.execute(
-            select(User).where(User.email == email)
-        )
+        result = await self.session.execute(_USER_BY_EMAIL, {"email": email})
         return result.scalar_one_or_none()
 
     async def get_user_by_email_case_insensitive(self, email: str) -> Optional[User]:
@@ -77,6 +96,9 @@ class AuthRepository:
 
         Returns:
             Created User object
+
+        Raises:
+            ValueError: If the username or email is already taken
         """
         user = User(
             username=username,
@@ -86,8 +108,18 @@ class AuthRepository:
             is_verified=is_verified,
         )
 
-        self.session.add(user)
-        await self.session.flush()
+        # The unique indexes are the uniqueness check: no pre-SELECTs, and no
+        # check-then-insert race. The savepoint keeps the outer transaction
+        # usable if the INSERT is rejected.
+        try:
+            async with self.session.begin_nested():
+                self.session.add(user)
+                await self.session.flush()
+        except IntegrityError as e:
+            field = _duplicate_user_field(e)
+            if field is None:
+                raise
+            raise ValueError(f"{field.capitalize()} already exists") from e
         await self.session.refresh(user)
         return user
 
@@ -112,20 +144,21 @@ class AuthRepository:
         Returns:
             Created RefreshToken object
         """
-        refresh_token = RefreshToken(
-            token=token,
-            user_id=user_id,
-            expires_at=datetime.now(timezone.utc) + timedelta(days=expires_days),
-            user_agent=user_agent,
-            ip_address=ip_address,
-            is_revoked=False
+        # Single INSERT ... RETURNING: the ULID is generated client-side and
+        # created_at/updated_at come back with the row, so no flush + refresh.
+        return await self.session.scalar(
+            insert(RefreshToken)
+            .values(
+                token=token,
+                user_id=user_id,
+                expires_at=datetime.now(timezone.utc) + timedelta(days=expires_days),
+                user_agent=user_agent,
+                ip_address=ip_address,
+                is_revoked=False,
+            )
+            .returning(RefreshToken)
         )
 
-        self.session.add(refresh_token)
-        await self.session.flush()
-        await self.session.refresh(refresh_token)
-        return refresh_token
-
     async def get_valid_refresh_token_by_value(
         self, token: str
     ) -> Optional[RefreshToken]:
@@ -157,9 +190,7 @@ class AuthRepository:
         Returns:
             User object or None if not found
         """
-        result = await self.session.execute(
-            select(User).where(User.id == user_id)
-        )
+        result = await self.session.execute(_USER_BY_ID, {"user_id": user_id})
         return result.scalar_one_or_none()
 
     async def create_email_verification_token(
@@ -227,16 +258,21 @@ class AuthRepository:
         user_id: str,
         token: str,
         expires_at: datetime,
-    ) -> Optional[User]:
-        """Store a short-lived connection token on the user row."""
-        user = await self.get_user_by_id(user_id)
-        if not user:
-            return None
-        user.telegram_connect_token = token
-        user.telegram_connect_token_expires_at = expires_at
-        await self.session.flush()
-        await self.session.refresh(user)
-        return user
+    ) -> bool:
+        """Store a short-lived connection token on the user row.
+
+        Returns False when no user matched *user_id*.
+        """
+        result = await self.session.execute(
+            update(User)
+            .where(User.id == user_id)
+            .values(
+                telegram_connect_token=token,
+                telegram_connect_token_expires_at=expires_at,
+            )
+            .returning(User.id)
+        )
+        return result.scalar_one_or_none() is not None
 
     async def get_user_by_telegram_token(self, token: str) -> Optional[User]:
         """Return the user that owns *token* if it hasn't expired yet."""
@@ -255,67 +291,88 @@ class AuthRepository:
         )
         return result.scalar_one_or_none()
 
-    async def connect_telegram_account(self, user_id: str, chat_id: str) -> Optional[User]:
+    async def connect_telegram_account(self, user_id: str, chat_id: str) -> bool:
         """Bind *chat_id* to the user and clear the one-time token."""
-        user = await self.get_user_by_id(user_id)
-        if not user:
-            return None
-        user.telegram_chat_id = chat_id
-        user.telegram_connect_token = None
-        user.telegram_connect_token_expires_at = None
-        await self.session.flush()
-        await self.session.refresh(user)
-        return user
+        result = await self.session.execute(
+            update(User)
+            .where(User.id == user_id)
+            .values(
+                telegram_chat_id=chat_id,
+                telegram_connect_token=None,
+                telegram_connect_token_expires_at=None,
+            )
+            .returning(User.id)
+        )
+        return result.scalar_one_or_none() is not None
 
-    async def disconnect_telegram(self, user_id: str) -> Optional[User]:
-        """Remove the Telegram binding for *user_id*."""
-        user = await self.get_user_by_id(user_id)
-        if not user:
+    async def disconnect_telegram(self, user_id: str) -> None:
+        """
+        Remove the Telegram binding for *user_id*.
+
+        Issued as a single ``UPDATE ... RETURNING id`` so the clear costs one
+        round-trip; the returned id doubles as the existence check.
+        """
+        result = await self.session.execute(
+            update(User)
+            .where(User.id == user_id)
+            .values(
+                telegram_chat_id=None,
+                telegram_connect_token=None,
+                telegram_connect_token_expires_at=None,
+            )
+            .returning(User.id)
+            .execution_options(synchronize_session=False)
+        )
+        if result.scalar_one_or_none() is None:
             raise ValueError("User not found")
-        user.telegram_chat_id = None
-        user.telegram_connect_token = None
-        user.telegram_connect_token_expires_at = None
-        await self.session.flush()
-        await self.session.refresh(user)
-        return user
 
-    async def set_telegram_detection_language(
-        self, user_id: str, lang: str
-    ) -> Optional[User]:
+    async def set_telegram_detection_language(self, user_id: str, lang: str) -> bool:
         """Persist ML detection language for Telegram: ru, kk, or auto."""
-        user = await self.get_user_by_id(user_id)
-        if not user:
-            return None
-        user.telegram_detection_language = lang
-        await self.session.flush()
-        await self.session.refresh(user)
-        return user
+        result = await self.session.execute(
+            update(User)
+            .where(User.id == user_id)
+            .values(telegram_detection_language=lang)
+            .returning(User.id)
+        )
+        return result.scalar_one_or_none() is not None
 
-    async def set_telegram_ui_locale(self, user_id: str, locale: str) -> Optional[User]:
+    async def set_telegram_ui_locale(self, user_id: str, locale: str) -> bool:
         """Persist UI locale for Telegram bot: ru, kk, or en."""
-        user = await self.get_user_by_id(user_id)
-        if not user:
-            return None
-        user.telegram_ui_locale = locale
-        await self.session.flush()
-        await self.session.refresh(user)
-        return user
+        result = await self.session.execute(
+            update(User)
+            .where(User.id == user_id)
+            .values(telegram_ui_locale=locale)
+            .returning(User.id)
+        )
+        return result.scalar_one_or_none() is not None
 
     async def ensure_telegram_ui_locale_from_client(
-        self, user_id: str, telegram_language_code: str | None
-    ) -> None:
+        self, user: User, telegram_language_code: str | None
+    ) -> User:
         """
         If telegram_ui_locale is unset, set it once from Telegram's language_code.
 
-        Mapping: ru -> ru; kk/kz -> kk; else en.
+        Mapping: ru -> ru; kk/kz -> kk; else en. Works on the already-loaded
+        row: when a locale is stored (the common case) no statement is sent;
+        otherwise the ``IS NULL``-guarded UPDATE also refreshes *user* in the
+        session, so callers don't need to re-select it.
+
+        Returns:
+            The same *user*, with telegram_ui_locale populated
         """
-        user = await self.get_user_by_id(user_id)
-        if not user or user.telegram_ui_locale is not None:
-            return
-        user.telegram_ui_locale = map_telegram_language_code_to_ui_locale(
-            telegram_language_code
+        if user.telegram_ui_locale is not None:
+            return user
+        await self.session.execute(
+            update(User)
+            .where(User.id == user.id, User.telegram_ui_locale.is_(None))
+            .values(
+                telegram_ui_locale=map_telegram_language_code_to_ui_locale(
+                    telegram_language_code
+                )
+            )
+            .execution_options(synchronize_session="fetch")
         )
-        await self.session.flush()
+        return user
 
     # ── Password reset ─────────────────────────────────────────────────────
 
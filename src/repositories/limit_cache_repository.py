@@ -0,0 +1,73 @@
+"""
+Limit cache repository for Redis operations.
+
+Caches "quota exhausted" verdicts from the user_limits table so repeated
+requests from a user who is already over their daily/monthly quota are
+rejected without a database round-trip. Postgres stays the source of truth:
+only the negative answer is cached, and only briefly.
+"""
+
+from datetime import datetime, timezone
+from typing import Optional
+
+from src.core.logging import get_logger
+from src.core.redis_config import redis_config
+from src.infrastructure.redis_client import RedisClient
+
+logger = get_logger(__name__)
+
+
+class LimitCacheRepository:
+    """Repository for cached user-limit verdicts in Redis."""
+
+    def __init__(self, redis_client: RedisClient):
+        """
+        Initialize limit cache repository.
+
+        Args:
+            redis_client: Redis client instance
+        """
+        self.redis = redis_client
+
+    @staticmethod
+    def _key(user_id: str) -> str:
+        return f"user_limit:exhausted:{user_id}"
+
+    async def get_exhausted(self, user_id: str) -> Optional[str]:
+        """
+        Return the cached rejection message if the user is known to be over quota.
+
+        Redis errors are treated as a cache miss.
+        """
+        try:
+            cached = await self.redis.get(self._key(user_id))
+        except Exception:
+            return None
+        if isinstance(cached, bytes):
+            return cached.decode()
+        return cached
+
+    async def mark_exhausted(
+        self, user_id: str, message: str, reset_at: datetime
+    ) -> None:
+        """
+        Cache the rejection until *reset_at*, capped at LIMIT_CACHE_TTL_SECONDS.
+
+        The cap bounds how long a plan upgrade can go unnoticed if the
+        explicit invalidation is missed.
+        """
+        remaining = int((reset_at - datetime.now(timezone.utc)).total_seconds())
+        ttl = min(remaining, redis_config.LIMIT_CACHE_TTL_SECONDS)
+        if ttl <= 0:
+            return
+        try:
+            await self.redis.set(self._key(user_id), message, expire=ttl)
+        except Exception as e:
+            logger.warning("limit_cache_write_failed", user_id=user_id, error=str(e))
+
+    async def invalidate(self, user_id: str) -> None:
+        """Drop the cached verdict (call after limits change)."""
+        try:
+            await self.redis.delete(self._key(user_id))
+        except Exception as e:
+            logger.warning("limit_cache_invalidate_failed", user_id=user_id, error=str(e))
@@ -2,8 +2,10 @@
 Rate limiter repository for Redis operations.
 """
 
+import time
+import uuid
 from datetime import datetime, timedelta, timezone
-from typing import Tuple
+from typing import Optional, Tuple
 
 from src.core.logging import get_logger
 from src.core.redis_config import redis_config
@@ -12,6 +14,72 @@ from src.infrastructure.redis_client import RedisClient
 
 logger = get_logger(__name__)
 
+# Sliding-log limiter: trim both logs to their windows, reject if either is
+# full, otherwise record the request in both — atomically, in one round-trip.
+# Also returns each log's oldest score so callers know when a slot frees up.
+# KEYS[1]=minute log, KEYS[2]=hour log;
+# ARGV: now_ms, minute_window_ms, hour_window_ms, minute_limit, hour_limit,
+# unique member.
+_SLIDING_WINDOW_SCRIPT = """
+local now = tonumber(ARGV[1])
+local counts = {}
+for i = 1, 2 do
+    redis.call('ZREMRANGEBYSCORE', KEYS[i], '-inf', '(' .. (now - tonumber(ARGV[i + 1])))
+    counts[i] = redis.call('ZCARD', KEYS[i])
+end
+local allowed = 0
+if counts[1] < tonumber(ARGV[4]) and counts[2] < tonumber(ARGV[5]) then
+    allowed = 1
+    for i = 1, 2 do
+        redis.call('ZADD', KEYS[i], now, ARGV[6])
+        redis.call('EXPIRE', KEYS[i], math.ceil(tonumber(ARGV[i + 1]) / 1000) + 10)
+        counts[i] = counts[i] + 1
+    end
+end
+local oldest = {}
+for i = 1, 2 do
+    local head = redis.call('ZRANGE', KEYS[i], 0, 0, 'WITHSCORES')
+    oldest[i] = head[2] and tonumber(head[2]) or now
+end
+return {allowed, counts[1], counts[2], oldest[1], oldest[2]}
+"""
+
+# Read-only view of the sliding logs: entries still inside each window and
+# the oldest one's score. KEYS/ARGV[1..3] as above.
+_SLIDING_STATUS_SCRIPT = """
+local now = tonumber(ARGV[1])
+local result = {}
+for i = 1, 2 do
+    local low = now - tonumber(ARGV[i + 1])
+    result[i] = redis.call('ZCOUNT', KEYS[i], low, '+inf')
+    local head = redis.call('ZRANGEBYSCORE', KEYS[i], low, '+inf', 'WITHSCORES', 'LIMIT', 0, 1)
+    result[i + 2] = head[2] and tonumber(head[2]) or now
+end
+return result
+"""
+
+
+# Fixed-window limiter: read both counters, reject if either is at its limit,
+# otherwise increment both — atomically, in one round-trip.
+# KEYS[1]=minute key, KEYS[2]=hour key;
+# ARGV: minute_limit, hour_limit, minute_ttl, hour_ttl.
+_FIXED_WINDOW_SCRIPT = """
+local m = tonumber(redis.call('GET', KEYS[1]) or '0')
+local h = tonumber(redis.call('GET', KEYS[2]) or '0')
+if m >= tonumber(ARGV[1]) or h >= tonumber(ARGV[2]) then
+    return {0, m, h}
+end
+m = redis.call('INCR', KEYS[1])
+if m == 1 then
+    redis.call('EXPIRE', KEYS[1], ARGV[3])
+end
+h = redis.call('INCR', KEYS[2])
+if h == 1 then
+    redis.call('EXPIRE', KEYS[2], ARGV[4])
+end
+return {1, m, h}
+"""
+
 
 class RateLimiterRepository:
     """Repository for rate limiting operations using Redis."""
@@ -25,18 +93,24 @@ class RateLimiterRepository:
         """
         self.redis = redis_client
 
-    def _get_rate_limit_key(self, user_id: str, period: RateLimitPeriod) -> str:
+    def _get_rate_limit_key(
+            self,
+            user_id: str,
+            period: RateLimitPeriod,
+            now: Optional[datetime] = None
+    ) -> str:
         """
         Generate Redis key for rate limiting.
 
         Args:
             user_id: User identifier
             period: Time period
+            now: Reference time (defaults to the current UTC time)
 
         Returns:
             Redis key
         """
-        now = datetime.now(timezone.utc)
+        now = now or datetime.now(timezone.utc)
 
         if period == RateLimitPeriod.MINUTE:
             time_window = now.strftime("%Y%m%d%H%M")
@@ -82,17 +156,22 @@ class RateLimiterRepository:
             # Could add daily limit to config
             return redis_config.RATE_LIMIT_PER_HOUR * 24
 
-    def _get_reset_time(self, period: RateLimitPeriod) -> datetime:
+    def _get_reset_time(
+            self,
+            period: RateLimitPeriod,
+            now: Optional[datetime] = None
+    ) -> datetime:
         """
         Get reset time for rate limit period.
 
         Args:
             period: Time period
+            now: Reference time (defaults to the current UTC time)
 
         Returns:
             Reset datetime
         """
-        now = datetime.now(timezone.utc)
+        now = now or datetime.now(timezone.utc)
 
         if period == RateLimitPeriod.MINUTE:
             # Reset at next minute
@@ -104,84 +183,176 @@ class RateLimiterRepository:
             # Reset at next day
             return (now + timedelta(days=1)).replace(hour=0, minute=0, second=0, microsecond=0)
 
-    async def check_rate_limit(
+    async def check_and_increment(
             self,
-            user_id: str,
-            period: RateLimitPeriod
-    ) -> Tuple[bool, RateLimitInfo]:
+            user_id: str
+    ) -> Tuple[bool, RateLimitStatus]:
         """
-        Check if user has exceeded rate limit for period.
+        Atomically check the minute and hour windows and count the request.
+
+        Both counters are incremented only when both are under their limit,
+        so concurrent requests cannot over-admit.
 
         Args:
             user_id: User identifier
-            period: Time period to check
 
         Returns:
-            Tuple of (is_allowed, rate_limit_info)
+            Tuple of (is_allowed, status after the check)
         """
-        key = self._get_rate_limit_key(user_id, period)
-        limit = self._get_limit_for_period(period)
-
-        # Get current count
-        current_str = await self.redis.get(key)
-        current = int(current_str) if current_str else 0
-
-        # Check if limit exceeded
-        is_allowed = current < limit
-        remaining = max(0, limit - current)
-        reset_at = self._get_reset_time(period)
+        # One clock read keeps keys and reset times on the same window
+        now = datetime.now(timezone.utc)
+        periods = (RateLimitPeriod.MINUTE, RateLimitPeriod.HOUR)
+        limits = [self._get_limit_for_period(p) for p in periods]
 
-        rate_limit_info = RateLimitInfo(
-            limit=limit,
-            remaining=remaining,
-            reset_at=reset_at,
-            period=period
+        allowed, *counts = await self.redis.run_script(
+            _FIXED_WINDOW_SCRIPT,
+            keys=[self._get_rate_limit_key(user_id, p, now) for p in periods],
+            args=[*limits, *(self._get_ttl_for_period(p) for p in periods)],
+        )
+        is_allowed = bool(int(allowed))
+        counts = [int(c) for c in counts]
+
+        minute_info, hour_info = (
+            RateLimitInfo(
+                limit=limit,
+                remaining=max(0, limit - count),
+                reset_at=self._get_reset_time(period, now),
+                period=period
+            )
+            for period, limit, count in zip(periods, limits, counts)
         )
 
         logger.debug(
             "rate_limit_checked",
             user_id=user_id,
-            period=period.value,
-            current=current,
-            limit=limit,
+            minute_count=counts[0],
+            hour_count=counts[1],
             is_allowed=is_allowed
         )
 
-        return is_allowed, rate_limit_info
+        return is_allowed, RateLimitStatus(
+            user_id=user_id,
+            is_allowed=is_allowed,
+            minute_limit=minute_info,
+            hour_limit=hour_info
+        )
+
+    def _get_sliding_keys(self, user_id: str, windows_ms: list[int]) -> list[str]:
+        """Redis keys of the user's sliding logs, one per window."""
+        return [
+            f"rate_limit:{user_id}:sliding:{window_ms // 1000}"
+            for window_ms in windows_ms
+        ]
+
+    def _build_sliding_status(
+            self,
+            user_id: str,
+            is_allowed: bool,
+            counts: list[int],
+            oldest_ms: list[int],
+            windows_ms: list[int],
+            limits: list[int]
+    ) -> RateLimitStatus:
+        """Turn per-log counts and oldest scores into a RateLimitStatus."""
+        minute_info, hour_info = (
+            RateLimitInfo(
+                limit=limit,
+                remaining=max(0, limit - count),
+                reset_at=datetime.fromtimestamp(
+                    (oldest + window_ms) / 1000, tz=timezone.utc
+                ),
+                period=period
+            )
+            for period, limit, count, oldest, window_ms in zip(
+                (RateLimitPeriod.MINUTE, RateLimitPeriod.HOUR),
+                limits, counts, oldest_ms, windows_ms
+            )
+        )
+        return RateLimitStatus(
+            user_id=user_id,
+            is_allowed=is_allowed,
+            minute_limit=minute_info,
+            hour_limit=hour_info
+        )
 
-    async def increment_rate_limit(self, user_id: str, period: RateLimitPeriod) -> int:
+    async def check_and_increment_sliding(
+            self,
+            user_id: str
+    ) -> Tuple[bool, RateLimitStatus]:
         """
-        Increment rate limit counter for user and period.
+        Sliding-log variant of check_and_increment.
+
+        Unlike the fixed-window counters this never admits a 2x burst across
+        a window boundary. The request is recorded in both logs only when
+        both admit it, and each ``reset_at`` is when that log's oldest entry
+        leaves the window.
 
         Args:
             user_id: User identifier
-            period: Time period
 
         Returns:
-            New count after increment
+            Tuple of (is_allowed, status after the check)
         """
-        key = self._get_rate_limit_key(user_id, period)
-        ttl_seconds = self._get_ttl_for_period(period)
-
-        # Increment counter
-        count = await self.redis.incr(key)
-
-        # Set expiration if this is the first increment
-        if count == 1:
-            await self.redis.expire(key, ttl_seconds)
+        periods = (RateLimitPeriod.MINUTE, RateLimitPeriod.HOUR)
+        windows_ms = [self._get_ttl_for_period(p) * 1000 for p in periods]
+        limits = [self._get_limit_for_period(p) for p in periods]
+        now_ms = time.time_ns() // 1_000_000
+        member = f"{now_ms}:{uuid.uuid4().hex}"
+
+        allowed, *rest = await self.redis.run_script(
+            _SLIDING_WINDOW_SCRIPT,
+            keys=self._get_sliding_keys(user_id, windows_ms),
+            args=[now_ms, *windows_ms, *limits, member],
+        )
+        is_allowed = bool(int(allowed))
+        counts = [int(c) for c in rest[:2]]
+        oldest_ms = [int(o) for o in rest[2:]]
 
         logger.debug(
-            "rate_limit_incremented",
+            "rate_limit_sliding_checked",
             user_id=user_id,
-            period=period.value,
-            count=count
+            minute_count=counts[0],
+            hour_count=counts[1],
+            is_allowed=is_allowed
+        )
+
+        status = self._build_sliding_status(
+            user_id, is_allowed, counts, oldest_ms, windows_ms, limits
+        )
+        return is_allowed, status
+
+    async def get_sliding_rate_limit_status(self, user_id: str) -> RateLimitStatus:
+        """
+        Get rate limit status from the sliding logs without recording a request.
+
+        Args:
+            user_id: User identifier
+
+        Returns:
+            RateLimitStatus with all period information
+        """
+        periods = (RateLimitPeriod.MINUTE, RateLimitPeriod.HOUR)
+        windows_ms = [self._get_ttl_for_period(p) * 1000 for p in periods]
+        limits = [self._get_limit_for_period(p) for p in periods]
+        now_ms = time.time_ns() // 1_000_000
+
+        result = await self.redis.run_script(
+            _SLIDING_STATUS_SCRIPT,
+            keys=self._get_sliding_keys(user_id, windows_ms),
+            args=[now_ms, *windows_ms],
         )
+        counts = [int(c) for c in result[:2]]
+        oldest_ms = [int(o) for o in result[2:]]
 
-        return count
+        # User is allowed only if both limits pass
+        is_allowed = all(count < limit for count, limit in zip(counts, limits))
+        return self._build_sliding_status(
+            user_id, is_allowed, counts, oldest_ms, windows_ms, limits
+        )
 
     async def get_rate_limit_status(self, user_id: str) -> RateLimitStatus:
         """
-        Get complete rate limit status for user.
+        Get complete rate limit status for user from the fixed-window counters.
 
         Args:
             user_id: User identifier
@@ -189,16 +360,26 @@ class RateLimiterRepository:
         Returns:
             RateLimitStatus with all period information
         """
-        # Check both minute and hour limits
-        minute_allowed, minute_info = await self.check_rate_limit(
-            user_id, RateLimitPeriod.MINUTE
+        # Read both counters in one MGET, against one clock reading
+        now = datetime.now(timezone.utc)
+        periods = (RateLimitPeriod.MINUTE, RateLimitPeriod.HOUR)
+        limits = [self._get_limit_for_period(p) for p in periods]
+        values = await self.redis.mget(
+            *(self._get_rate_limit_key(user_id, p, now) for p in periods)
         )
-        hour_allowed, hour_info = await self.check_rate_limit(
-            user_id, RateLimitPeriod.HOUR
+
+        minute_info, hour_info = (
+            RateLimitInfo(
+                limit=limit,
+                remaining=max(0, limit - (int(value) if value else 0)),
+                reset_at=self._get_reset_time(period, now),
+                period=period
+            )
+            for period, limit, value in zip(periods, limits, values)
         )
 
         # User is allowed only if both limits pass
-        is_allowed = minute_allowed and hour_allowed
+        is_allowed = minute_info.remaining > 0 and hour_info.remaining > 0
 
         return RateLimitStatus(
             user_id=user_id,
@@ -214,14 +395,9 @@ class RateLimiterRepository:
         Args:
             user_id: User identifier
         """
-        # Generate all possible keys for current time windows
-        keys_to_delete = [
-            self._get_rate_limit_key(user_id, RateLimitPeriod.MINUTE),
-            self._get_rate_limit_key(user_id, RateLimitPeriod.HOUR),
-            self._get_rate_limit_key(user_id, RateLimitPeriod.DAY),
-        ]
-
-        deleted = await self.redis.delete(*keys_to_delete)
+        # Sweep every window (including still-live previous ones) and the
+        # sliding logs for this user rather than guessing the current keys.
+        deleted = await self.redis.unlink_matching(f"rate_limit:{user_id}:*")
 
         logger.info(
             "rate_limits_reset",
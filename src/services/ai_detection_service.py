@@ -2,10 +2,12 @@
 AI Detection service layer with limits and history tracking.
 """
 
+import asyncio
 import os
 import tempfile
 import time
 from dataclasses import asdict
+from typing import AsyncIterable, AsyncIterator
 
 from src.api.v1.schemas.detection_language import (
     DetectionLanguageContext,
@@ -19,12 +21,31 @@ from src.dtos.ai_detection_dto import (
 )
 from src.dtos.limits_dto import UserLimitDTO
 from src.repositories.ai_detection_repository import AIDetectionRepository
+from src.repositories.limit_cache_repository import LimitCacheRepository
 from src.services.gemini_service import GeminiTextExtractor
 from src.services.ml_model_service import AIDetectionModelService
+from src.services.shared.admission import detection_admission
 from src.services.text_normalization_service import TextNormalizationService
 
 logger = get_logger(__name__)
 
+FileContent = bytes | AsyncIterable[bytes]
+
+_MAX_FILE_BYTES: int = gemini_config.MAX_FILE_SIZE_MB * 1024 * 1024
+_ALLOWED_EXTENSIONS: frozenset[str] = frozenset(
+    e.lower() for e in gemini_config.ALLOWED_FILE_EXTENSIONS
+)
+
+async def _iter_chunks(content: FileContent) -> AsyncIterator[bytes]:
+    """Yield non-empty chunks from in-memory bytes or an async byte stream."""
+    if isinstance(content, (bytes, bytearray, memoryview)):
+        if content:
+            yield content
+        return
+    async for chunk in content:
+        if chunk:
+            yield chunk
+
 
 class AIDetectionService:
     """Service for AI text detection with limits and history."""
@@ -35,11 +56,13 @@ class AIDetectionService:
         ml_model_service: AIDetectionModelService,
         ai_detection_repository: AIDetectionRepository,
         normalization_service: TextNormalizationService,
+        limit_cache: LimitCacheRepository | None = None,
     ):
         self.gemini_service = gemini_service
         self.ml_model_service = ml_model_service
         self.ai_detection_repository = ai_detection_repository
         self.normalization_service = normalization_service
+        self.limit_cache = limit_cache
 
     async def check_user_limits(self, user_id: str) -> UserLimitDTO:
         """
@@ -54,6 +77,11 @@ class AIDetectionService:
         Raises:
             ValueError: If user has exceeded limits
         """
+        if self.limit_cache:
+            cached = await self.limit_cache.get_exhausted(user_id)
+            if cached:
+                raise ValueError(cached)
+
         can_request, user_limit = await self.ai_detection_repository.can_make_request(user_id)
 
         limit_dto = UserLimitDTO.from_model(user_limit)
@@ -67,11 +95,19 @@ class AIDetectionService:
                 monthly_used=user_limit.monthly_used,
                 monthly_limit=user_limit.monthly_limit
             )
-            raise ValueError(
+            message = (
                 f"Request limit exceeded. "
                 f"Daily: {user_limit.daily_used}/{user_limit.daily_limit}, "
                 f"Monthly: {user_limit.monthly_used}/{user_limit.monthly_limit}"
             )
+            if self.limit_cache:
+                # Serve repeats from Redis until the blocking window resets.
+                if user_limit.monthly_used >= user_limit.monthly_limit:
+                    reset_at = user_limit.monthly_reset_at
+                else:
+                    reset_at = user_limit.daily_reset_at
+                await self.limit_cache.mark_exhausted(user_id, message, reset_at)
+            raise ValueError(message)
 
         return limit_dto
 
@@ -96,7 +132,17 @@ class AIDetectionService:
         Raises:
             ValueError: If text is invalid or limits exceeded
         """
-        start_time = time.time()
+        async with detection_admission.admit(user_id):
+            return await self._detect_from_text(text, user_id, language=language)
+
+    async def _detect_from_text(
+        self,
+        text: str,
+        user_id: str,
+        *,
+        language: DetectionLanguageContext,
+    ) -> tuple[AIDetectionResultDTO, UserLimitDTO]:
+        start_ns = time.perf_counter_ns()
 
         # Normalize
         norm = self.normalization_service.normalize(text, source_format="text")
@@ -105,14 +151,6 @@ class AIDetectionService:
         # Resolve auto language from normalized text
         language = resolve_effective_language(normalized_text, language)
 
-        logger.info(
-            "detecting_from_text",
-            text_length=len(normalized_text),
-            user_id=user_id,
-            language_requested=language.requested,
-            language_effective=language.effective,
-        )
-
         # Check limits
         await self.check_user_limits(user_id)
 
@@ -121,21 +159,24 @@ class AIDetectionService:
             raise ValueError("Text is too short or invalid. Minimum 50 characters required.")
 
         try:
-            result, confidence = await self.ml_model_service.detect_ai_text(
+            result, confidence = await self.ml_model_service.submit(
                 normalized_text, language=language.effective
             )
 
-            processing_time_ms = int((time.time() - start_time) * 1000)
+            processing_time_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
+            text_length = norm.metadata.normalized_char_count
+            word_count = len(normalized_text.split())
+            preview = normalized_text[:500]
 
             detection_result = AIDetectionResultDTO(
                 result=result,
                 confidence=confidence,
-                text_preview=normalized_text[:200],
+                text_preview=preview[:200],
                 source=DetectionSource.TEXT,
                 file_name=None,
                 metadata={
-                    "text_length": len(normalized_text),
-                    "word_count": len(normalized_text.split()),
+                    "text_length": text_length,
+                    "word_count": word_count,
                     "processing_time_ms": processing_time_ms,
                     "language_requested": language.requested,
                     "language_effective": language.effective,
@@ -151,9 +192,9 @@ class AIDetectionService:
                 source="text",
                 result=result.value,
                 confidence=confidence,
-                text_preview=norm.raw_text[:500],
-                text_length=len(normalized_text),
-                word_count=len(normalized_text.split()),
+                text_preview=preview,
+                text_length=text_length,
+                word_count=word_count,
                 processing_time_ms=processing_time_ms
             )
 
@@ -162,6 +203,9 @@ class AIDetectionService:
                 user_id=user_id,
                 result=result.value,
                 confidence=confidence,
+                text_length=text_length,
+                language_requested=language.requested,
+                language_effective=language.effective,
                 processing_time_ms=processing_time_ms
             )
 
@@ -179,7 +223,7 @@ class AIDetectionService:
 
     async def detect_from_file(
         self,
-        file_content: bytes,
+        file_content: FileContent,
         file_name: str,
         content_type: str,
         user_id: str,
@@ -190,7 +234,8 @@ class AIDetectionService:
         Detect AI-generated text from uploaded file.
 
         Args:
-            file_content: File content as bytes
+            file_content: File content as bytes, or an async stream of chunks
+                (streamed straight to a temp file without buffering in RAM)
             file_name: Original file name
             content_type: MIME type of the file
             user_id: User ID
@@ -202,37 +247,49 @@ class AIDetectionService:
         Raises:
             ValueError: If file is invalid or limits exceeded
         """
-        start_time = time.time()
+        async with detection_admission.admit(user_id):
+            return await self._detect_from_file(
+                file_content, file_name, content_type, user_id, language=language
+            )
 
-        logger.info(
-            "detecting_from_file",
-            file_name=file_name,
-            content_type=content_type,
-            file_size=len(file_content),
-            user_id=user_id,
-            language_requested=language.requested,
-            language_effective=language.effective,
-        )
+    async def _detect_from_file(
+        self,
+        file_content: FileContent,
+        file_name: str,
+        content_type: str,
+        user_id: str,
+        *,
+        language: DetectionLanguageContext,
+    ) -> tuple[AIDetectionResultDTO, UserLimitDTO]:
+        start_ns = time.perf_counter_ns()
 
         # Check limits
         await self.check_user_limits(user_id)
 
-        # Validate file
-        self._validate_file(file_name, file_content)
+        # Validate file type; size is enforced while streaming to disk
+        self._validate_file(file_name)
 
         temp_path = None
         try:
-            temp_path = await self._save_temp_file(file_content, file_name)
-
-            logger.info("extracting_text_from_file", file_name=file_name, user_id=user_id)
-            extracted_text, structured_blocks = await self.gemini_service.extract_text_from_file(
-                temp_path, file_name, content_type=content_type
-            )
+            if isinstance(file_content, bytes):
+                # Already in memory (e.g. Telegram downloads): extract directly
+                # and skip the temp-file write/read round-trip.
+                file_size = self._check_file_size(len(file_content))
+                extracted_text, structured_blocks = await self.gemini_service.extract_text_from_bytes(
+                    file_content, file_name, content_type=content_type
+                )
+            else:
+                temp_path, file_size = await self._save_temp_file(file_content, file_name)
+                extracted_text, structured_blocks = await self.gemini_service.extract_text_from_file(
+                    temp_path, file_name, content_type=content_type
+                )
 
-            # Normalize extracted text
+            # Normalize extracted text. Whole documents can run to megabytes
+            # of text, so this CPU-bound pass runs off the event loop.
             file_ext = os.path.splitext(file_name)[1].lower().lstrip(".")
             source_fmt = file_ext if file_ext else "text"
-            norm = self.normalization_service.normalize(
+            norm = await asyncio.to_thread(
+                self.normalization_service.normalize,
                 extracted_text,
                 source_format=source_fmt,
                 structured_blocks=structured_blocks or None,
@@ -247,30 +304,26 @@ class AIDetectionService:
 
             language = resolve_effective_language(normalized_text, language)
 
-            logger.info(
-                "file_language_resolved",
-                file_name=file_name,
-                language_requested=language.requested,
-                language_effective=language.effective,
-            )
-
-            result, confidence = await self.ml_model_service.detect_ai_text(
+            result, confidence = await self.ml_model_service.submit(
                 normalized_text, language=language.effective
             )
 
-            processing_time_ms = int((time.time() - start_time) * 1000)
+            processing_time_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
+            text_length = norm.metadata.normalized_char_count
+            word_count = len(normalized_text.split())
+            preview = normalized_text[:500]
 
             detection_result = AIDetectionResultDTO(
                 result=result,
                 confidence=confidence,
-                text_preview=normalized_text[:200],
+                text_preview=preview[:200],
                 source=DetectionSource.FILE,
                 file_name=file_name,
                 metadata={
-                    "file_size": len(file_content),
+                    "file_size": file_size,
                     "content_type": content_type,
-                    "extracted_text_length": len(normalized_text),
-                    "word_count": len(normalized_text.split()),
+                    "extracted_text_length": text_length,
+                    "word_count": word_count,
                     "processing_time_ms": processing_time_ms,
                     "language_requested": language.requested,
                     "language_effective": language.effective,
@@ -286,11 +339,11 @@ class AIDetectionService:
                 source="file",
                 result=result.value,
                 confidence=confidence,
-                text_preview=norm.raw_text[:500],
-                text_length=len(normalized_text),
-                word_count=len(normalized_text.split()),
+                text_preview=preview,
+                text_length=text_length,
+                word_count=word_count,
                 file_name=file_name,
-                file_size=len(file_content),
+                file_size=file_size,
                 content_type=content_type,
                 processing_time_ms=processing_time_ms
             )
@@ -298,9 +351,13 @@ class AIDetectionService:
             logger.info(
                 "detection_from_file_complete",
                 file_name=file_name,
+                content_type=content_type,
+                file_size=file_size,
                 user_id=user_id,
                 result=result.value,
                 confidence=confidence,
+                language_requested=language.requested,
+                language_effective=language.effective,
                 processing_time_ms=processing_time_ms
             )
 
@@ -354,17 +411,11 @@ class AIDetectionService:
         user_limit = await self.ai_detection_repository.check_and_reset_limits(user_limit)
         return UserLimitDTO.from_model(user_limit)
 
-    def _validate_file(self, file_name: str, file_content: bytes):
-        """Validate uploaded file."""
-        file_size_mb = len(file_content) / (1024 * 1024)
-        if file_size_mb > gemini_config.MAX_FILE_SIZE_MB:
-            raise ValueError(
-                f"File size ({file_size_mb:.2f}MB) exceeds maximum "
-                f"allowed size ({gemini_config.MAX_FILE_SIZE_MB}MB)"
-            )
-
-        file_ext = os.path.splitext(file_name)[1].lower()
-        if file_ext not in gemini_config.ALLOWED_FILE_EXTENSIONS:
+    def _validate_file(self, file_name: str):
+        """Validate uploaded file name/extension."""
+        _, dot, ext = file_name.rpartition(".")
+        file_ext = "." + ext.lower() if dot else ""
+        if file_ext not in _ALLOWED_EXTENSIONS:
             raise ValueError(
                 f"File type '{file_ext}' not allowed. "
                 f"Allowed types: {', '.join(gemini_config.ALLOWED_FILE_EXTENSIONS)}"
@@ -373,21 +424,59 @@ class AIDetectionService:
         logger.debug(
             "file_validation_passed",
             file_name=file_name,
-            file_size_mb=round(file_size_mb, 2),
             file_extension=file_ext
         )
 
-    async def _save_temp_file(self, file_content: bytes, file_name: str) -> str:
-        """Save file content to temporary file."""
+    def _check_file_size(self, file_size: int) -> int:
+        """Reject empty or oversized content; return the size unchanged."""
+        if file_size > _MAX_FILE_BYTES:
+            raise ValueError(
+                f"File size ({file_size / (1024 * 1024):.2f}MB) exceeds maximum "
+                f"allowed size ({gemini_config.MAX_FILE_SIZE_MB}MB)"
+            )
+        if not file_size:
+            raise ValueError("Uploaded file is empty")
+        return file_size
+
+    async def _save_temp_file(
+        self, file_content: FileContent, file_name: str
+    ) -> tuple[str, int]:
+        """
+        Stream file content to a temporary file.
+
+        The size limit is enforced with a running counter: nothing more is
+        written once an upload crosses the limit, and the rest is only
+        counted so the error can report the actual size.
+
+        Returns:
+            Tuple of (temp_path, file_size_bytes)
+        """
         _, ext = os.path.splitext(file_name)
-        temp_file = tempfile.NamedTemporaryFile(delete=False, suffix=ext)
-        temp_file.write(file_content)
+        temp_file = tempfile.NamedTemporaryFile(
+            delete=False, suffix=ext, dir=gemini_config.UPLOAD_TEMP_DIR
+        )
+        file_size = 0
+        chunks = _iter_chunks(file_content)
+        try:
+            async for chunk in chunks:
+                file_size += len(chunk)
+                if file_size > _MAX_FILE_BYTES:
+                    async for rest in chunks:
+                        file_size += len(rest)
+                    break
+                await asyncio.to_thread(temp_file.write, chunk)
+            self._check_file_size(file_size)
+        except BaseException:
+            temp_file.close()
+            os.unlink(temp_file.name)
+            raise
         temp_file.close()
 
         logger.debug(
             "temp_file_created",
             file_name=file_name,
+            file_size=file_size,
             temp_path=temp_file.name
         )
 
-        return temp_file.name
\ No newline at end of file
+        return temp_file.name, file_size
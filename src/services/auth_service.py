@@ -46,6 +46,7 @@ from src.models.auth import User
 from src.repositories.auth_repository import AuthRepository
 from src.services.email_service import EmailService
 from src.services.google_oauth_client import GoogleOAuthClient, GoogleOAuthProfile
+from src.services.shared.auth_cache import invalidate_cached_user
 
 logger = get_logger(__name__)
 
@@ -66,6 +67,11 @@ class AuthService:
         self.config = config
         self.email_service = email_service
         self.google_oauth_client = google_oauth_client
+        self._telegram_url_prefix: Optional[str] = (
+            f"https://t.me/{config.TELEGRAM_BOT_USERNAME}?start="
+            if config.TELEGRAM_BOT_USERNAME
+            else None
+        )
 
     async def register_user(
         self,
@@ -83,12 +89,8 @@ class AuthService:
                 self.config.EMAIL_DNS_VALIDATION_TIMEOUT,
             )
 
-        if await self.auth_repository.get_user_by_username(user_data.username):
-            raise ValueError("Username already exists")
-        if await self.auth_repository.get_user_by_email(email):
-            raise ValueError("Email already exists")
-
-        hashed_password = hash_password(user_data.password)
+        # bcrypt releases the GIL, so a worker thread keeps the event loop free.
+        hashed_password = await asyncio.to_thread(hash_password, user_data.password)
         user = await self.auth_repository.create_user(
             username=user_data.username,
             email=email,
@@ -115,7 +117,9 @@ class AuthService:
         else:
             user = await self.auth_repository.get_user_by_username(login)
 
-        if not user or not verify_password(login_data.password, user.hashed_password):
+        if not user or not await asyncio.to_thread(
+            verify_password, login_data.password, user.hashed_password
+        ):
             raise ValueError("Invalid credentials")
         if not user.is_active:
             raise ValueError("Account is inactive")
@@ -255,6 +259,7 @@ class AuthService:
                     provider_user_id=profile.sub,
                     email=profile.email,
                 )
+                invalidate_cached_user(existing_user.id)
             if profile.email_verified and not existing_user.is_verified:
                 await self.auth_repository.set_user_verified(existing_user.id)
             user = await self.auth_repository.get_user_by_id(existing_user.id)
@@ -373,13 +378,14 @@ class AuthService:
         if row.expires_at <= now:
             raise PasswordResetError(RESET_TOKEN_EXPIRED, "This reset link has expired")
         validate_password_strength(new_password)
-        hashed = hash_password(new_password)
+        hashed = await asyncio.to_thread(hash_password, new_password)
         await self.auth_repository.update_user_password_hash(row.user_id, hashed)
         await self.auth_repository.mark_password_reset_token_used(row.id)
         await self.auth_repository.invalidate_unused_password_reset_tokens_for_user(
             row.user_id
         )
         await self.auth_repository.revoke_all_refresh_tokens_for_user(row.user_id)
+        invalidate_cached_user(row.user_id)
         logger.info("password_reset_completed", user_id=row.user_id)
 
     # ── Telegram ────────────────────────────────────────────────────────────
@@ -391,23 +397,25 @@ class AuthService:
         The token is stored on the user row and expires after
         ``TELEGRAM_CONNECT_TOKEN_TTL_MINUTES`` minutes.
         """
-        if not self.config.TELEGRAM_BOT_USERNAME:
+        if self._telegram_url_prefix is None:
             raise ValueError("Telegram bot is not configured")
 
-        token = secrets.token_hex(16)
+        # 128 bits in 22 chars; the URL-safe alphabet is exactly what Telegram
+        # allows in a /start payload ([A-Za-z0-9_-], max 64).
+        token = secrets.token_urlsafe(16)
         expires_at = datetime.now(timezone.utc) + timedelta(
             minutes=self.config.TELEGRAM_CONNECT_TOKEN_TTL_MINUTES
         )
 
-        user = await self.auth_repository.update_telegram_connect_token(
+        updated = await self.auth_repository.update_telegram_connect_token(
             user_id=user_id,
             token=token,
             expires_at=expires_at,
         )
-        if not user:
+        if not updated:
             raise ValueError("User not found")
 
-        bot_url = f"https://t.me/{self.config.TELEGRAM_BOT_USERNAME}?start={token}"
+        bot_url = self._telegram_url_prefix + token
         logger.info("telegram_connection_url_generated", user_id=user_id)
         return TelegramConnectDTO(bot_url=bot_url)
 
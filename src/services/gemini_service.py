@@ -9,12 +9,20 @@ Gemini multimodal `generate_content` accepts only a limited set of document MIME
 """
 
 import asyncio
+import hashlib
+import io
+import itertools
 import mimetypes
 import os
+import random
+import time
+from collections import OrderedDict
 from pathlib import Path
+from typing import IO
 
 import google.generativeai as genai
 from docx import Document as DocxDocument
+from google.api_core.exceptions import ResourceExhausted
 from google.generativeai.types import HarmBlockThreshold, HarmCategory
 from lxml import html as lxml_html
 from pptx import Presentation
@@ -68,11 +76,55 @@ def _resolve_upload_mime_type(file_name: str, content_type: str | None) -> str:
     )
 
 
+# Status poll schedule while Gemini processes an upload: fast first checks,
+# then a flat 3s interval.
+_POLL_DELAYS_HEAD: tuple[float, ...] = (0.2, 0.3, 0.5, 1.0, 1.0, 2.0)
+_POLL_DELAY_MAX = 3.0
+
+
+def _poll_delays():
+    return itertools.chain(_POLL_DELAYS_HEAD, itertools.repeat(_POLL_DELAY_MAX))
+
+
+# Waits before retrying a generate call that Gemini rejected with 429.
+_RATE_LIMIT_BACKOFF: tuple[float, ...] = (1.0, 2.0, 4.0)
+
+
+class _RequestRateLimiter:
+    """Token bucket spacing Gemini requests to a per-minute budget (0 = unlimited)."""
+
+    def __init__(self, per_minute: int):
+        self._interval = 60.0 / per_minute if per_minute > 0 else 0.0
+        self._capacity = float(max(1, per_minute))
+        self._tokens = self._capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        if not self._interval:
+            return
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(
+                    self._capacity, self._tokens + (now - self._updated) / self._interval
+                )
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) * self._interval)
+
+
 _ExtractionResult = tuple[str, list[StructuredBlock]]
 
+# Either a filesystem path or an in-memory binary stream (python-docx,
+# python-pptx and genai.upload_file accept both).
+_FileSource = str | IO[bytes]
 
-def _extract_docx_text(path: str) -> _ExtractionResult:
-    doc = DocxDocument(path)
+
+def _extract_docx_text(source: _FileSource) -> _ExtractionResult:
+    doc = DocxDocument(source)
     text_parts: list[str] = []
     blocks: list[StructuredBlock] = []
 
@@ -105,8 +157,8 @@ def _extract_docx_text(path: str) -> _ExtractionResult:
     return "\n".join(text_parts), blocks
 
 
-def _extract_pptx_text(path: str) -> _ExtractionResult:
-    prs = Presentation(path)
+def _extract_pptx_text(source: _FileSource) -> _ExtractionResult:
+    prs = Presentation(source)
     text_parts: list[str] = []
     blocks: list[StructuredBlock] = []
 
@@ -163,8 +215,8 @@ def _extract_pptx_text(path: str) -> _ExtractionResult:
 _HTML_STRIP_TAGS = frozenset({"script", "style", "noscript", "nav"})
 
 
-def _extract_txt_or_html(path: str, ext: str) -> _ExtractionResult:
-    raw = Path(path).read_bytes()
+def _extract_txt_or_html(source: _FileSource, ext: str) -> _ExtractionResult:
+    raw = Path(source).read_bytes() if isinstance(source, str) else source.read()
     if ext == ".html":
         tree = lxml_html.fromstring(raw)
         for tag_name in _HTML_STRIP_TAGS:
@@ -175,13 +227,25 @@ def _extract_txt_or_html(path: str, ext: str) -> _ExtractionResult:
     return raw.decode("utf-8", errors="replace"), []
 
 
-def _extract_text_locally(file_path: str, ext: str) -> _ExtractionResult:
+def _content_digest(source: _FileSource) -> bytes:
+    """SHA-256 of the file contents; a stream is rewound to where it was."""
+    if isinstance(source, str):
+        with open(source, "rb") as f:
+            return hashlib.file_digest(f, "sha256").digest()
+    pos = source.tell()
+    try:
+        return hashlib.file_digest(source, "sha256").digest()
+    finally:
+        source.seek(pos)
+
+
+def _extract_text_locally(source: _FileSource, ext: str) -> _ExtractionResult:
     if ext == ".docx":
-        return _extract_docx_text(file_path)
+        return _extract_docx_text(source)
     if ext == ".pptx":
-        return _extract_pptx_text(file_path)
+        return _extract_pptx_text(source)
     if ext in (".txt", ".html"):
-        return _extract_txt_or_html(file_path, ext)
+        return _extract_txt_or_html(source, ext)
     raise ValueError(f"Local extraction not implemented for {ext!r}")
 
 
@@ -198,6 +262,11 @@ class GeminiTextExtractor:
             HarmCategory.HARM_CATEGORY_SEXUALLY_EXPLICIT: HarmBlockThreshold.BLOCK_NONE,
             HarmCategory.HARM_CATEGORY_DANGEROUS_CONTENT: HarmBlockThreshold.BLOCK_NONE,
         }
+        # Strong refs to fire-and-forget cleanup tasks so they aren't GC'd mid-flight.
+        self._cleanup_tasks: set[asyncio.Task[None]] = set()
+        self._slots = asyncio.Semaphore(max(1, gemini_config.GEMINI_MAX_CONCURRENCY))
+        self._rate = _RequestRateLimiter(gemini_config.GEMINI_REQUESTS_PER_MINUTE)
+        self._text_cache: OrderedDict[tuple[str, bytes], _ExtractionResult] = OrderedDict()
 
     async def extract_text_from_file(
         self,
@@ -222,6 +291,55 @@ class GeminiTextExtractor:
             RuntimeError: If text extraction fails.
             ValueError:   If the format is unsupported (``.doc``).
         """
+        return await self._extract(file_path, file_name, content_type)
+
+    async def extract_text_from_bytes(
+        self,
+        data: bytes,
+        file_name: str,
+        content_type: str | None = None,
+    ) -> tuple[str, list[StructuredBlock]]:
+        """Same as :meth:`extract_text_from_file` for content already in memory.
+
+        Local parsers and the Gemini upload read straight from a ``BytesIO``,
+        so no temporary file is written.
+        """
+        return await self._extract(io.BytesIO(data), file_name, content_type)
+
+    async def _extract(
+        self,
+        source: _FileSource,
+        file_name: str,
+        content_type: str | None,
+    ) -> tuple[str, list[StructuredBlock]]:
+        """Serve repeat uploads of identical content from an in-process LRU."""
+        if not gemini_config.TEXT_CACHE_SIZE:
+            return await self._extract_uncached(source, file_name, content_type)
+
+        ext = os.path.splitext(file_name)[1].lower()
+        key = (ext, await asyncio.to_thread(_content_digest, source))
+        cached = self._text_cache.get(key)
+        if cached is not None:
+            self._text_cache.move_to_end(key)
+            logger.info(
+                "text_extraction_cache_hit",
+                file_name=file_name,
+                text_length=len(cached[0]),
+            )
+            return cached[0], list(cached[1])
+
+        text, blocks = await self._extract_uncached(source, file_name, content_type)
+        self._text_cache[key] = (text, list(blocks))
+        if len(self._text_cache) > gemini_config.TEXT_CACHE_SIZE:
+            self._text_cache.popitem(last=False)
+        return text, blocks
+
+    async def _extract_uncached(
+        self,
+        source: _FileSource,
+        file_name: str,
+        content_type: str | None,
+    ) -> tuple[str, list[StructuredBlock]]:
         ext = os.path.splitext(file_name)[1].lower()
 
         if ext == ".doc":
@@ -238,7 +356,7 @@ class GeminiTextExtractor:
                     extension=ext,
                 )
                 text, blocks = await asyncio.to_thread(
-                    _extract_text_locally, file_path, ext,
+                    _extract_text_locally, source, ext,
                 )
                 text = (text or "").strip()
                 if not text:
@@ -270,13 +388,6 @@ class GeminiTextExtractor:
                 mime_type=mime_type,
             )
 
-            # Upload file to Gemini
-            uploaded_file = genai.upload_file(file_path, mime_type=mime_type)
-
-            # Wait for file processing
-            logger.info("waiting_for_file_processing", file_name=file_name)
-            await self._wait_for_file_processing(uploaded_file.name)
-
             # Extract text using Gemini
             extraction_prompt = """
             Extract all text content from this document. 
@@ -293,10 +404,21 @@ class GeminiTextExtractor:
             Return only the extracted text.
             """
 
-            response = self.model.generate_content(
-                contents=[extraction_prompt, uploaded_file],
-                safety_settings=self.safety_settings,
-            )
+            # One slot covers upload, processing and generation.
+            async with self._slots:
+                # Upload file to Gemini
+                await self._rate.acquire()
+                uploaded_file = await asyncio.to_thread(
+                    genai.upload_file, source, mime_type=mime_type
+                )
+
+                # Wait for file processing
+                logger.info("waiting_for_file_processing", file_name=file_name)
+                await self._wait_for_file_processing(uploaded_file.name)
+
+                response = await self._generate_with_backoff(
+                    [extraction_prompt, uploaded_file], file_name
+                )
 
             text = self.extract_text_safe(response)
             if not text or not text.strip():
@@ -323,39 +445,76 @@ class GeminiTextExtractor:
             raise RuntimeError(f"Failed to extract text from file: {str(e)}")
 
         finally:
-            # Clean up uploaded file from Gemini
+            # Clean up uploaded file from Gemini off the request path
             if uploaded_file:
-                try:
-                    genai.delete_file(uploaded_file.name)
-                    logger.debug("gemini_file_deleted", file_name=file_name)
-                except Exception as e:
-                    logger.warning(
-                        "failed_to_delete_gemini_file",
-                        file_name=file_name,
-                        error=str(e)
-                    )
+                task = asyncio.create_task(
+                    self._delete_uploaded_file(uploaded_file.name, file_name)
+                )
+                self._cleanup_tasks.add(task)
+                task.add_done_callback(self._cleanup_tasks.discard)
 
-    async def _wait_for_file_processing(self, file_name: str, max_retries: int = 10, retry_delay: int = 5):
+    async def _generate_with_backoff(self, contents: list, file_name: str):
+        """Call generate_content, backing off and retrying on HTTP 429."""
+        for attempt, delay in enumerate((*_RATE_LIMIT_BACKOFF, None), start=1):
+            await self._rate.acquire()
+            try:
+                return await self.model.generate_content_async(
+                    contents=contents,
+                    safety_settings=self.safety_settings,
+                )
+            except ResourceExhausted:
+                if delay is None:
+                    raise
+                logger.warning(
+                    "gemini_rate_limited",
+                    file_name=file_name,
+                    attempt=attempt,
+                    retry_in=delay,
+                )
+                await asyncio.sleep(delay + random.uniform(0, delay * 0.1))
+
+    @staticmethod
+    async def _delete_uploaded_file(gemini_name: str, file_name: str) -> None:
+        try:
+            await asyncio.to_thread(genai.delete_file, gemini_name)
+            logger.debug("gemini_file_deleted", file_name=file_name)
+        except Exception as e:
+            logger.warning(
+                "failed_to_delete_gemini_file",
+                file_name=file_name,
+                error=str(e)
+            )
+
+    async def _wait_for_file_processing(
+        self, file_name: str, timeout: float | None = None
+    ):
         """
         Wait for uploaded file to be processed by Gemini.
 
+        Polls quickly at first so small files return almost immediately, then
+        backs off to a 3s cap (with jitter) until *timeout* has elapsed.
+
         Args:
             file_name: Name of the uploaded file in Gemini
-            max_retries: Maximum number of retries
-            retry_delay: Delay between retries in seconds
+            timeout: Total seconds to wait; defaults to
+                FILE_PROCESSING_TIMEOUT_SECONDS
 
         Raises:
             Exception: If file processing times out
         """
-        for attempt in range(max_retries):
+        if timeout is None:
+            timeout = gemini_config.FILE_PROCESSING_TIMEOUT_SECONDS
+        deadline = time.monotonic() + timeout
+
+        for attempt, delay in enumerate(_poll_delays(), start=1):
             try:
-                file_info = genai.get_file(file_name)
+                file_info = await asyncio.to_thread(genai.get_file, file_name)
                 # State 2 = PROCESSED, State 1 = PENDING
                 if file_info.state == 2:
                     logger.debug(
                         "file_processing_complete",
                         file_name=file_name,
-                        attempt=attempt + 1
+                        attempt=attempt
                     )
                     return
 
@@ -363,21 +522,24 @@ class GeminiTextExtractor:
                     "file_processing_pending",
                     file_name=file_name,
                     state=file_info.state,
-                    attempt=attempt + 1,
-                    retry_in=retry_delay
+                    attempt=attempt,
+                    retry_in=delay
                 )
-                await asyncio.sleep(retry_delay)
 
             except Exception as e:
                 logger.warning(
                     "error_checking_file_status",
                     file_name=file_name,
-                    attempt=attempt + 1,
+                    attempt=attempt,
                     error=str(e)
                 )
-                await asyncio.sleep(retry_delay)
 
-        raise Exception(f"File processing timed out after {max_retries * retry_delay} seconds")
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            await asyncio.sleep(min(remaining, delay + random.uniform(0, delay * 0.1)))
+
+        raise Exception(f"File processing timed out after {timeout:g} seconds")
 
     @staticmethod
     def extract_text_safe(response) -> str | None:
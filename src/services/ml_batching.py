@@ -0,0 +1,132 @@
+"""
+Micro-batching dispatcher for ML detection calls.
+
+Concurrent detection requests arriving within a short window are collected
+into one batch and handed to a single batch callable; each caller gets its
+own result back through a future. Identical texts inside a batch are only
+sent once. The batch callable may return an exception in place of a result
+to fail just that text.
+"""
+
+import asyncio
+from typing import Awaitable, Callable, Generic, Sequence, TypeVar
+
+from src.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+R = TypeVar("R")
+
+BatchFn = Callable[[Sequence[str]], Awaitable[Sequence[R | BaseException]]]
+
+
+class MlBatchingDispatcher(Generic[R]):
+    """Coalesce concurrent single-text calls into batched calls."""
+
+    def __init__(
+        self,
+        batch_fn: BatchFn[R],
+        *,
+        max_batch_size: int = 16,
+        window_ms: float = 25.0,
+    ):
+        """
+        Initialize dispatcher.
+
+        Args:
+            batch_fn: Coroutine taking a list of texts, returning one result
+                (or exception) per text
+            max_batch_size: Upper bound on texts per batch
+            window_ms: How long to wait for more requests after the first one
+        """
+        self._batch_fn = batch_fn
+        self._max_batch_size = max(1, max_batch_size)
+        self._window = max(0.0, window_ms) / 1000.0
+        self._queue: asyncio.Queue[tuple[str, asyncio.Future[R]]] | None = None
+        self._worker: asyncio.Task[None] | None = None
+
+    async def submit(self, text: str) -> R:
+        """
+        Queue *text* for the next batch and wait for its result.
+
+        Args:
+            text: Text to analyze
+
+        Returns:
+            Result produced by the batch callable for this text
+        """
+        if self._worker is None or self._worker.done():
+            self._queue = asyncio.Queue()
+            self._worker = asyncio.create_task(self._run())
+        future: asyncio.Future[R] = asyncio.get_running_loop().create_future()
+        await self._queue.put((text, future))
+        return await future
+
+    async def _collect(self) -> list[tuple[str, asyncio.Future[R]]]:
+        """Block for the first item, then drain until the window or size cap."""
+        assert self._queue is not None
+        batch = [await self._queue.get()]
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self._window
+        while len(batch) < self._max_batch_size:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+            except asyncio.TimeoutError:
+                break
+        return batch
+
+    async def _run(self) -> None:
+        while True:
+            batch = await self._collect()
+            pending = [(text, fut) for text, fut in batch if not fut.cancelled()]
+            if not pending:
+                continue
+
+            unique = list(dict.fromkeys(text for text, _ in pending))
+            try:
+                results = await self._batch_fn(unique)
+                if len(results) != len(unique):
+                    raise RuntimeError(
+                        f"batch returned {len(results)} results for {len(unique)} texts"
+                    )
+            except Exception as e:
+                # Fail this batch only; the worker keeps serving later callers.
+                logger.error(
+                    "ml_batch_failed",
+                    batch_size=len(pending),
+                    error=str(e),
+                    error_type=type(e).__name__,
+                )
+                for _, fut in pending:
+                    if not fut.done():
+                        fut.set_exception(e)
+                continue
+
+            by_text = dict(zip(unique, results))
+            for text, fut in pending:
+                if fut.done():
+                    continue
+                result = by_text[text]
+                if isinstance(result, BaseException):
+                    fut.set_exception(result)
+                else:
+                    fut.set_result(result)
+
+            logger.debug(
+                "ml_batch_dispatched",
+                batch_size=len(pending),
+                unique_texts=len(unique),
+            )
+
+    async def close(self) -> None:
+        """Stop the background worker."""
+        if self._worker is not None:
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+            self._worker = None
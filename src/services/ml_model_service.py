@@ -6,26 +6,176 @@ whether text is AI-generated or human-written.
 Routes to Russian (ML_API_URL) or Kazakh (ML_API_URL_KK) backends by language.
 """
 
+import asyncio
+import hashlib
 import os
-from typing import Any, Iterable, Literal, Tuple
+from collections import OrderedDict
+from functools import partial
+from typing import Any, Literal, Sequence, Tuple
 
 import httpx
+from pydantic import (
+    AliasChoices,
+    AliasPath,
+    BaseModel,
+    ConfigDict,
+    Field,
+    ValidationError,
+    field_validator,
+)
+from pydantic_core import from_json, to_json
 
 from src.core.logging import get_logger
 from src.dtos.ai_detection_dto import DetectionResult
+from src.services.ml_batching import MlBatchingDispatcher
 
 logger = get_logger(__name__)
 
 ML_API_URL = os.getenv("ML_API_URL", "http://ml-api:8000").rstrip("/")
 ML_API_URL_KK = os.getenv("ML_API_URL_KK", "http://ml-api:8000").strip().rstrip("/")
+# Max in-flight requests per ML backend; extra callers queue here instead of
+# piling up on the model server.
+ML_API_MAX_CONCURRENCY = max(1, int(os.getenv("ML_API_MAX_CONCURRENCY", "4")))
+# Micro-batching window for concurrent detection calls; 0 disables batching.
+ML_BATCH_WINDOW_MS = max(0.0, float(os.getenv("ML_BATCH_WINDOW_MS", "0")))
+ML_BATCH_MAX_SIZE = max(1, int(os.getenv("ML_BATCH_MAX_SIZE", "16")))
+# Path of a batch endpoint on the ML API taking {"texts": [...]}; when unset
+# (or the backend answers 404/405) batches fan out as single /detection calls.
+ML_API_BATCH_PATH = os.getenv("ML_API_BATCH_PATH", "").strip()
+# Send one dummy detection per backend at startup so the first user request
+# doesn't pay for connection setup and the model server's cold start.
+ML_WARMUP_ON_STARTUP = os.getenv("ML_WARMUP_ON_STARTUP", "true").lower() in ("1", "true", "yes")
+
+# In-process LRU of recent (language, text) -> result; 0 disables the cache.
+ML_RESULT_CACHE_SIZE = max(0, int(os.getenv("ML_RESULT_CACHE_SIZE", "1024")))
+
+# Split texts longer than this many characters into overlapping windows that
+# are scored separately and aggregated; 0 sends every text whole.
+ML_CHUNK_CHARS = max(0, int(os.getenv("ML_CHUNK_CHARS", "0")))
+ML_CHUNK_OVERLAP_CHARS = max(0, int(os.getenv("ML_CHUNK_OVERLAP_CHARS", "200")))
+
+# Request/response bodies go through pydantic-core's JSON codec, which is
+# considerably faster than the stdlib json module on long texts.
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+_WARMUP_TEXT = "Warmup request for the detection model. " * 13
 
 DetectionMlLanguage = Literal["ru", "kk"]
 
+_LABEL_MAP: dict[str, DetectionResult] = {
+    "ai": DetectionResult.AI_GENERATED,
+    "ai_generated": DetectionResult.AI_GENERATED,
+    "artificial": DetectionResult.AI_GENERATED,
+    "human": DetectionResult.HUMAN_WRITTEN,
+    "human_written": DetectionResult.HUMAN_WRITTEN,
+    "mixed": DetectionResult.UNCERTAIN,
+    "uncertain": DetectionResult.UNCERTAIN,
+}
+
 
 class KazakhMlApiUnavailableError(RuntimeError):
     """Raised when Kazakh (kk) detection is requested but ML_API_URL_KK is unset."""
 
 
+class _BatchEndpointUnavailable(Exception):
+    """The ML backend has no batch endpoint (HTTP 404/405)."""
+
+
+class _BatchResponseInvalid(Exception):
+    """The batch endpoint answered with a body that cannot be used."""
+
+
+class _MlVerdict(BaseModel):
+    """
+    One ML API verdict.
+
+    The aliases cover the field names the supported ML backends use; the
+    payload is validated in a single pass instead of probing keys by hand.
+    """
+
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
+    label: str | None = Field(
+        None,
+        validation_alias=AliasChoices(
+            "label", "result", "prediction", "predicted_label", AliasPath("output", "label")
+        ),
+    )
+    ai_probability: float | None = Field(
+        None,
+        validation_alias=AliasChoices(
+            "ai_probability", "probability", "ai_prob", "score", "prob",
+            "predicted_probability",
+        ),
+    )
+    certainty: float | None = Field(
+        None,
+        validation_alias=AliasChoices("certainty", "confidence", "score", "certainty_score"),
+    )
+    # Only logged; any value the backend sends is accepted as-is.
+    model_used: Any = Field(
+        None, validation_alias=AliasChoices("model", "model_used", "modelName")
+    )
+
+    @field_validator("label", mode="before")
+    @classmethod
+    def _lenient_label(cls, value: Any) -> str | None:
+        """A non-string label is ignored; the verdict falls back to ai_probability."""
+        return value if isinstance(value, str) else None
+
+    @field_validator("ai_probability", "certainty", mode="before")
+    @classmethod
+    def _lenient_float(cls, value: Any) -> float | None:
+        """An unusable number is dropped field by field, not for the whole verdict."""
+        if value is None or isinstance(value, bool):
+            return None
+        try:
+            return float(value)
+        except (TypeError, ValueError):
+            return None
+
+
+def _split_windows(text: str, size: int, overlap: int) -> list[str]:
+    """Cut *text* into windows of about *size* chars, breaking on whitespace."""
+    overlap = min(overlap, size // 2)
+    windows: list[str] = []
+    start = 0
+    n = len(text)
+    while start < n:
+        end = min(start + size, n)
+        if end < n:
+            # Back off to the last whitespace so words aren't split. The
+            # cut must lie past start + overlap, or the next window would
+            # begin where this one did.
+            cut = text.rfind(" ", start + max(size // 2, overlap + 1), end)
+            if cut != -1:
+                end = cut
+        windows.append(text[start:end])
+        if end >= n:
+            break
+        start = max(end - overlap, start + 1)
+    return windows
+
+
+def _aggregate_windows(
+    outcomes: Sequence[Tuple[DetectionResult, float]], weights: Sequence[int]
+) -> Tuple[DetectionResult, float]:
+    """Length-weighted majority vote; confidence averaged over the winning label."""
+    votes: dict[DetectionResult, int] = {}
+    for (result, _), w in zip(outcomes, weights):
+        votes[result] = votes.get(result, 0) + w
+    ranked = sorted(votes.items(), key=lambda kv: kv[1], reverse=True)
+    if len(ranked) > 1 and ranked[0][1] == ranked[1][1]:
+        winner = DetectionResult.UNCERTAIN
+    else:
+        winner = ranked[0][0]
+    picked = [(c, w) for (r, c), w in zip(outcomes, weights) if r == winner]
+    if not picked:
+        return winner, 0.0
+    total = sum(w for _, w in picked)
+    return winner, round(sum(c * w for c, w in picked) / total, 3)
+
+
 class AIDetectionModelService:
     """Service for AI text detection via ML microservice."""
 
@@ -34,6 +184,14 @@ class AIDetectionModelService:
         self._ru_url = ML_API_URL
         self._kk_url = ML_API_URL_KK or ""
         self._clients: dict[DetectionMlLanguage, httpx.AsyncClient] = {}
+        self._inflight: dict[DetectionMlLanguage, asyncio.Semaphore] = {}
+        self._result_cache: OrderedDict[
+            tuple[DetectionMlLanguage, bytes], Tuple[DetectionResult, float]
+        ] = OrderedDict()
+        self._batchers: dict[
+            DetectionMlLanguage, MlBatchingDispatcher[Tuple[DetectionResult, float]]
+        ] = {}
+        self._batch_unsupported: set[DetectionMlLanguage] = set()
         self._init_client("ru", self._ru_url)
         if self._kk_url:
             self._init_client("kk", self._kk_url)
@@ -41,10 +199,20 @@ class AIDetectionModelService:
             "ai_detection_model_initialized",
             ru_base=self._ru_url,
             kk_configured=bool(self._kk_url),
+            max_concurrency=ML_API_MAX_CONCURRENCY,
+            batch_window_ms=ML_BATCH_WINDOW_MS,
         )
 
     def _init_client(self, lang: DetectionMlLanguage, base_url: str) -> None:
-        self._clients[lang] = httpx.AsyncClient(base_url=base_url, timeout=30.0)
+        self._clients[lang] = httpx.AsyncClient(
+            base_url=base_url,
+            timeout=30.0,
+            limits=httpx.Limits(
+                max_connections=ML_API_MAX_CONCURRENCY,
+                max_keepalive_connections=ML_API_MAX_CONCURRENCY,
+            ),
+        )
+        self._inflight[lang] = asyncio.Semaphore(ML_API_MAX_CONCURRENCY)
 
     def _client_for(self, language: DetectionMlLanguage) -> httpx.AsyncClient:
         if language == "kk":
@@ -57,6 +225,191 @@ class AIDetectionModelService:
                 self._init_client("kk", self._kk_url)
         return self._clients[language]
 
+    async def warmup(self) -> None:
+        """
+        Prime every configured ML backend with one full-size dummy request.
+
+        Failures are logged and swallowed: an unavailable ML API must not
+        block application startup.
+        """
+        if not ML_WARMUP_ON_STARTUP:
+            return
+        await asyncio.gather(*(self._warmup_one(lang) for lang in list(self._clients)))
+
+    async def _warmup_one(self, language: DetectionMlLanguage) -> None:
+        try:
+            await self.detect_ai_text(_WARMUP_TEXT, language=language)
+            logger.info("ml_warmup_complete", ml_language=language)
+        except Exception as e:
+            logger.warning(
+                "ml_warmup_failed",
+                ml_language=language,
+                error=str(e),
+                error_type=type(e).__name__,
+            )
+
+    async def submit(
+        self,
+        text: str,
+        *,
+        language: DetectionMlLanguage = "ru",
+    ) -> Tuple[DetectionResult, float]:
+        """
+        Detect AI text, reusing cached results and batching when enabled.
+
+        The ML verdict is a pure function of (language, text), so recent
+        results are served from an in-process LRU keyed by a BLAKE2 digest
+        of the text. On a miss, with ML_BATCH_WINDOW_MS > 0 the call joins a
+        per-language micro-batch (see MlBatchingDispatcher); otherwise it is
+        a plain detect_ai_text. Texts longer than ML_CHUNK_CHARS are scored
+        window by window and the verdicts aggregated.
+        """
+        if not ML_RESULT_CACHE_SIZE:
+            return await self._dispatch(text, language)
+
+        key = (language, hashlib.blake2b(text.encode(), digest_size=16).digest())
+        cached = self._result_cache.get(key)
+        if cached is not None:
+            self._result_cache.move_to_end(key)
+            logger.info("ml_result_cache_hit", text_length=len(text), ml_language=language)
+            return cached
+
+        outcome = await self._dispatch(text, language)
+        # (UNCERTAIN, 0.0) is also the fallback for unparseable responses;
+        # don't pin it in the cache.
+        if outcome != (DetectionResult.UNCERTAIN, 0.0):
+            self._result_cache[key] = outcome
+            if len(self._result_cache) > ML_RESULT_CACHE_SIZE:
+                self._result_cache.popitem(last=False)
+        return outcome
+
+    async def _dispatch(
+        self, text: str, language: DetectionMlLanguage
+    ) -> Tuple[DetectionResult, float]:
+        if not ML_CHUNK_CHARS or len(text) <= ML_CHUNK_CHARS:
+            return await self._dispatch_one(text, language)
+
+        windows = _split_windows(text, ML_CHUNK_CHARS, ML_CHUNK_OVERLAP_CHARS)
+        outcomes = await asyncio.gather(
+            *(self._dispatch_one(w, language) for w in windows)
+        )
+        result, confidence = _aggregate_windows(outcomes, [len(w) for w in windows])
+        logger.info(
+            "detection_chunks_aggregated",
+            text_length=len(text),
+            chunks=len(windows),
+            result=result.value,
+            confidence=confidence,
+            ml_language=language,
+        )
+        return result, confidence
+
+    async def _dispatch_one(
+        self, text: str, language: DetectionMlLanguage
+    ) -> Tuple[DetectionResult, float]:
+        if ML_BATCH_WINDOW_MS <= 0:
+            return await self.detect_ai_text(text, language=language)
+        self._client_for(language)
+        batcher = self._batchers.get(language)
+        if batcher is None:
+            batcher = MlBatchingDispatcher(
+                partial(self.detect_ai_text_batch, language=language),
+                max_batch_size=ML_BATCH_MAX_SIZE,
+                window_ms=ML_BATCH_WINDOW_MS,
+            )
+            self._batchers[language] = batcher
+        return await batcher.submit(text)
+
+    async def detect_ai_text_batch(
+        self,
+        texts: Sequence[str],
+        *,
+        language: DetectionMlLanguage = "ru",
+    ) -> list[Tuple[DetectionResult, float] | BaseException]:
+        """
+        Detect a batch of texts against one backend.
+
+        With ML_API_BATCH_PATH set the whole batch goes out as one request;
+        otherwise, when that request fails, or once the backend reports no
+        batch endpoint, it is fanned out as single requests under the
+        per-backend in-flight limit.
+
+        Args:
+            texts: Texts to analyze
+            language: ML backend selector: ru or kk
+
+        Returns:
+            One (DetectionResult, confidence_score) per input text, in order;
+            a text whose single request failed gets its exception instead
+        """
+        if ML_API_BATCH_PATH and language not in self._batch_unsupported:
+            try:
+                return await self._post_batch(texts, language)
+            except _BatchEndpointUnavailable as e:
+                self._batch_unsupported.add(language)
+                logger.warning(
+                    "ml_batch_endpoint_unavailable",
+                    ml_language=language,
+                    reason=str(e),
+                )
+            except (httpx.HTTPError, _BatchResponseInvalid) as e:
+                logger.warning(
+                    "ml_batch_request_failed",
+                    ml_language=language,
+                    error=str(e),
+                    error_type=type(e).__name__,
+                )
+
+        return list(
+            await asyncio.gather(
+                *(self.detect_ai_text(text, language=language) for text in texts),
+                return_exceptions=True,
+            )
+        )
+
+    async def _post_batch(
+        self, texts: Sequence[str], language: DetectionMlLanguage
+    ) -> list[Tuple[DetectionResult, float]]:
+        client = self._client_for(language)
+        logger.info("analyzing_text_batch", batch_size=len(texts), ml_language=language)
+
+        async with self._inflight[language]:
+            response = await client.post(
+                ML_API_BATCH_PATH,
+                content=to_json({"texts": list(texts), "language": language}),
+                headers=_JSON_HEADERS,
+            )
+        if response.status_code in (404, 405):
+            raise _BatchEndpointUnavailable(f"HTTP {response.status_code}")
+        response.raise_for_status()
+
+        try:
+            data = from_json(response.content)
+        except ValueError:
+            raise _BatchResponseInvalid("response is not JSON")
+        if isinstance(data, dict):
+            data = data.get("data", data)
+        if isinstance(data, dict):
+            data = data.get("results")
+        if not isinstance(data, list) or len(data) != len(texts):
+            raise _BatchResponseInvalid("response does not match the request")
+
+        outcomes: list[Tuple[DetectionResult, float]] = []
+        for item, text in zip(data, texts):
+            try:
+                outcomes.append(
+                    self._parse_detection(item, text_length=len(text), language=language)
+                )
+            except Exception as e:
+                logger.error(
+                    "detection_failed",
+                    error=str(e),
+                    error_type=type(e).__name__,
+                    ml_language=language,
+                )
+                outcomes.append((DetectionResult.UNCERTAIN, 0.0))
+        return outcomes
+
     async def detect_ai_text(
         self,
         text: str,
@@ -78,15 +431,17 @@ class AIDetectionModelService:
         try:
             logger.info("analyzing_text", text_length=len(text), ml_language=language)
 
-            response = await client.post(
-                "/api/v1/detection/",
-                json={"text": text, "language": language},
-            )
+            async with self._inflight[language]:
+                response = await client.post(
+                    "/api/v1/detection/",
+                    content=to_json({"text": text, "language": language}),
+                    headers=_JSON_HEADERS,
+                )
             response.raise_for_status()
 
             # Attempt to parse robustly — accept a few shapes and fallback safely
             try:
-                data = response.json()
+                data = from_json(response.content)
                 if "data" in data:
                     data = data["data"]
             except Exception:
@@ -95,111 +450,7 @@ class AIDetectionModelService:
                 logger.error("detection_invalid_json", response_text=text_content)
                 return DetectionResult.UNCERTAIN, 0.0
 
-            # Normalize to dict when possible
-            if not isinstance(data, dict):
-                # e.g. some services return a list or other container — log and try to coerce
-                logger.warning(
-                    "detection_unexpected_payload_type",
-                    payload_type=type(data).__name__,
-                    payload_preview=str(data)[:500],
-                )
-
-            # Helper to pull candidate keys (supports nested dot paths)
-            def _extract(data_obj: Any, candidates: Iterable[str]) -> Any:
-                for cand in candidates:
-                    if isinstance(data_obj, dict) and cand in data_obj:
-                        return data_obj[cand]
-                    # nested lookup using dot notation
-                    if "." in cand:
-                        cur = data_obj
-                        parts = cand.split(".")
-                        ok = True
-                        for p in parts:
-                            if isinstance(cur, dict) and p in cur:
-                                cur = cur[p]
-                            else:
-                                ok = False
-                                break
-                        if ok:
-                            return cur
-                    # if data is list and candidate is numeric index
-                    if isinstance(data_obj, list):
-                        try:
-                            idx = int(cand)
-                            if 0 <= idx < len(data_obj):
-                                return data_obj[idx]
-                        except Exception:
-                            pass
-                return None
-
-            # Try a number of likely key names used by different ML services
-            label = _extract(
-                data, ["label", "result", "prediction", "predicted_label", "output.label"]
-            )
-            ai_probability = _extract(
-                data,
-                [
-                    "ai_probability",
-                    "probability",
-                    "ai_prob",
-                    "score",
-                    "prob",
-                    "predicted_probability",
-                ],
-            )
-            certainty = _extract(data, ["certainty", "confidence", "score", "certainty_score"])
-
-            # If keys missing, log response for debugging and try to derive from available fields
-            if label is None:
-                logger.warning("unknown_label_in_response", response_preview=str(data)[:1000])
-
-            # Normalize numeric fields
-            def _to_float(val: Any) -> float | None:
-                if val is None:
-                    return None
-                try:
-                    return float(val)
-                except Exception:
-                    return None
-
-            ai_probability_f = _to_float(ai_probability)
-            certainty_f = _to_float(certainty)
-
-            # Determine result by label first, then by probability fallback
-            if isinstance(label, str):
-                result = self._map_label(label, ai_probability_f or 0.0)
-            else:
-                # Fallback using probability alone
-                if ai_probability_f is not None:
-                    if ai_probability_f > 0.7:
-                        result = DetectionResult.AI_GENERATED
-                    elif ai_probability_f < 0.4:
-                        result = DetectionResult.HUMAN_WRITTEN
-                    else:
-                        result = DetectionResult.UNCERTAIN
-                else:
-                    result = DetectionResult.UNCERTAIN
-
-            # Confidence: prefer explicit certainty, then ai_probability, else 0.0
-            confidence = round(
-                float(
-                    (certainty_f / 100.0)
-                    if certainty_f is not None and certainty_f > 1
-                    else (ai_probability_f if ai_probability_f is not None else 0.0)
-                ),
-                3,
-            )
-
-            logger.info(
-                "detection_complete",
-                result=result.value,
-                confidence=confidence,
-                text_length=len(text),
-                ml_language=language,
-                model_used=_extract(data, ["model", "model_used", "modelName"]),
-            )
-
-            return result, confidence
+            return self._parse_detection(data, text_length=len(text), language=language)
 
         except httpx.HTTPStatusError as e:
             logger.error(
@@ -230,6 +481,58 @@ class AIDetectionModelService:
             )
             return DetectionResult.UNCERTAIN, 0.0
 
+    def _parse_detection(
+        self, data: Any, *, text_length: int, language: DetectionMlLanguage
+    ) -> Tuple[DetectionResult, float]:
+        """Turn one decoded ML API verdict into (DetectionResult, confidence)."""
+        try:
+            verdict = _MlVerdict.model_validate(data)
+        except ValidationError as e:
+            logger.warning(
+                "detection_unexpected_payload",
+                payload_type=type(data).__name__,
+                payload_preview=str(data)[:500],
+                error_count=e.error_count(),
+            )
+            return DetectionResult.UNCERTAIN, 0.0
+
+        ai_probability = verdict.ai_probability
+        certainty = verdict.certainty
+
+        # Determine result by label first, then by probability fallback
+        if verdict.label is not None:
+            result = self._map_label(verdict.label, ai_probability or 0.0)
+        else:
+            logger.warning("unknown_label_in_response", response_preview=str(data)[:1000])
+            if ai_probability is not None:
+                if ai_probability > 0.7:
+                    result = DetectionResult.AI_GENERATED
+                elif ai_probability < 0.4:
+                    result = DetectionResult.HUMAN_WRITTEN
+                else:
+                    result = DetectionResult.UNCERTAIN
+            else:
+                result = DetectionResult.UNCERTAIN
+
+        # Confidence: prefer explicit certainty, then ai_probability, else 0.0
+        confidence = round(
+            (certainty / 100.0)
+            if certainty is not None and certainty > 1
+            else (ai_probability if ai_probability is not None else 0.0),
+            3,
+        )
+
+        logger.info(
+            "detection_complete",
+            result=result.value,
+            confidence=confidence,
+            text_length=text_length,
+            ml_language=language,
+            model_used=verdict.model_used,
+        )
+
+        return result, confidence
+
     def _map_label(self, label: str, ai_probability: float) -> DetectionResult:
         """
         Map ML API label string to DetectionResult enum.
@@ -241,14 +544,9 @@ class AIDetectionModelService:
         Returns:
             DetectionResult enum value
         """
-        normalized = label.lower()
-
-        if normalized in ("ai", "ai_generated", "artificial"):
-            return DetectionResult.AI_GENERATED
-        if normalized in ("human", "human_written"):
-            return DetectionResult.HUMAN_WRITTEN
-        if normalized in ("mixed", "uncertain"):
-            return DetectionResult.UNCERTAIN
+        mapped = _LABEL_MAP.get(label.lower())
+        if mapped is not None:
+            return mapped
 
         # Fallback: derive from probability if label is unrecognized
         logger.warning("unknown_label", label=label)
@@ -268,7 +566,10 @@ class AIDetectionModelService:
         Returns:
             True if text is valid for detection
         """
-        if not text or not text.strip():
+        # Cheap O(1) rejection before stripping (and copying) large inputs.
+        if len(text) < 50:
+            if text and not text.isspace():
+                logger.warning("text_too_short", text_length=len(text))
             return False
 
         if len(text.strip()) < 50:
@@ -278,7 +579,10 @@ class AIDetectionModelService:
         return True
 
     async def close(self):
-        """Close the underlying HTTP clients."""
+        """Close batch dispatchers and the underlying HTTP clients."""
+        for b in self._batchers.values():
+            await b.close()
+        self._batchers.clear()
         for c in self._clients.values():
             await c.aclose()
         self._clients.clear()
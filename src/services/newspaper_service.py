@@ -1,14 +1,21 @@
 """
 Newspaper service for fetching and extracting article text from URLs.
 
-Primary: newspaper4k. Fallback: BeautifulSoup generic + Wikipedia-specific paths.
+Primary: newspaper4k (or BeautifulSoup with URL_PREFER_BS4_EXTRACTION).
+Fallback: BeautifulSoup generic + Wikipedia-specific paths.
 Uses a single httpx download; all parsers run in a thread pool.
 """
 
 from __future__ import annotations
 
 import asyncio
+import codecs
+import multiprocessing
+import os
+import re
 import time
+from collections import OrderedDict
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
 from dataclasses import dataclass
 from urllib.parse import urlparse
 
@@ -19,15 +26,34 @@ from src.core.logging import get_logger
 from src.dtos.ai_detection_dto import ExtractionMethod, NewspaperFetchResultDTO
 from src.services.url_extraction.bs4_generic import extract_generic_text
 from src.services.url_extraction.bs4_wikipedia import extract_wikipedia_text
-from src.services.url_extraction.constants import MAX_HTML_TEXT_LENGTH
-from src.services.url_extraction.domain import is_wikipedia_host, parsed_host
+from src.services.url_extraction.constants import (
+    HTML_CACHE_MAX_ENTRIES,
+    HTML_CACHE_TTL_SECONDS,
+    MAX_HTML_TEXT_LENGTH,
+)
+from src.services.url_extraction.domain import is_wikipedia_host
 from src.services.url_extraction.quality import ExtractionQualityResult, evaluate_text_quality
 
 logger = get_logger(__name__)
 
 REQUEST_TIMEOUT = 30
+
+_DOWNLOAD_HEADERS = {
+    "User-Agent": (
+        "Mozilla/5.0 (compatible; AIDetector/1.0; +https://example.com)"
+    ),
+    "Accept-Language": "ru,kk;q=0.9,en;q=0.8",
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+}
 DEFAULT_LANGUAGE = "ru"
 
+# Common case: http(s)://host[:port] followed by a path, query, fragment or
+# end of string. Anything else (userinfo, IPv6 literals, odd schemes) goes
+# through urlparse for the full check and error message.
+_URL_RE = re.compile(
+    r"^https?://([^/\s:?#@\[\]]+)(?::\d*)?(?:[/?#]|$)", re.IGNORECASE
+)
+
 
 def _build_newspaper_config() -> NewspaperConfig:
     cfg = NewspaperConfig()
@@ -36,6 +62,7 @@ def _build_newspaper_config() -> NewspaperConfig:
     )
     cfg.request_timeout = REQUEST_TIMEOUT
     cfg.fetch_images = False
+    cfg.follow_meta_refresh = False
     cfg.memoize_articles = False
     cfg.language = DEFAULT_LANGUAGE
     return cfg
@@ -43,6 +70,76 @@ def _build_newspaper_config() -> NewspaperConfig:
 
 _NEWSPAPER_CONFIG = _build_newspaper_config()
 
+# HTML parsing is CPU-bound; keep it on its own pool so it doesn't queue
+# behind (or starve) other to_thread work on the default executor.
+_PARSE_POOL = ThreadPoolExecutor(
+    max_workers=os.cpu_count() or 4, thread_name_prefix="url-parse"
+)
+
+# Parse in this many worker processes instead (0 = use the thread pool).
+# Sidesteps the GIL for newspaper's pure-Python heuristics under load.
+URL_PARSE_PROCESSES = max(0, int(os.getenv("URL_PARSE_PROCESSES", "0")))
+_process_pool: ProcessPoolExecutor | None = None
+
+
+def _parse_executor() -> Executor:
+    global _process_pool
+    if not URL_PARSE_PROCESSES:
+        return _PARSE_POOL
+    if _process_pool is None:
+        # spawn, not fork: the parent already runs an event loop and threads.
+        _process_pool = ProcessPoolExecutor(
+            max_workers=URL_PARSE_PROCESSES,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+    return _process_pool
+
+# Put the lxml-backed BeautifulSoup extractor ahead of newspaper4k for
+# non-Wikipedia hosts; newspaper then only runs when BS4 output is rejected.
+PREFER_BS4_EXTRACTION = os.getenv("URL_PREFER_BS4_EXTRACTION", "false").lower() in (
+    "1", "true", "yes",
+)
+
+# Run every extractor once at startup so lazy parser setup (stopword lists,
+# compiled patterns) does not land on the first user's request.
+URL_WARMUP_ON_STARTUP = os.getenv("URL_WARMUP_ON_STARTUP", "true").lower() in (
+    "1", "true", "yes",
+)
+
+# Per extractor: (started, failed, succeeded) log events and rejection-note prefix.
+_STRATEGY_EVENTS: dict[ExtractionMethod, tuple[str, str, str, str]] = {
+    "bs4_wikipedia": (
+        "bs4_wikipedia_started", "bs4_wikipedia_failed", "bs4_wikipedia_succeeded",
+        "wikipedia_bs4",
+    ),
+    "newspaper": (
+        "newspaper_extraction_started", "newspaper_extraction_failed",
+        "newspaper_extraction_succeeded", "newspaper",
+    ),
+    "bs4_generic": (
+        "bs4_generic_started", "bs4_generic_failed", "bs4_generic_succeeded",
+        "generic_bs4",
+    ),
+}
+
+
+def _strategy_order(wikipedia: bool) -> tuple[ExtractionMethod, ...]:
+    if wikipedia:
+        return ("bs4_wikipedia", "newspaper", "bs4_generic")
+    if PREFER_BS4_EXTRACTION:
+        return ("bs4_generic", "newspaper")
+    return ("newspaper", "bs4_generic")
+
+
+@dataclass(frozen=True)
+class _Extracted:
+    """Output of one extraction strategy, before the quality gate."""
+
+    text: str
+    title: str | None
+    authors: list[str]
+    publish_date: str | None
+
 
 @dataclass(frozen=True)
 class DownloadedHtml:
@@ -53,22 +150,177 @@ class DownloadedHtml:
     original_text_length: int
 
 
+_BOMS = (
+    (codecs.BOM_UTF8, "utf-8-sig"),
+    (codecs.BOM_UTF16_LE, "utf-16"),
+    (codecs.BOM_UTF16_BE, "utf-16"),
+)
+_META_CHARSET_RE = re.compile(
+    rb"""<meta[^>]+charset\s*=\s*["']?\s*([a-z0-9_.:-]+)""", re.IGNORECASE
+)
+
+
+def _body_encoding(response: httpx.Response, head: bytes) -> str:
+    """
+    Pick the codec for a streamed body from its first bytes.
+
+    Order follows browsers: byte-order mark, Content-Type charset, then a
+    ``<meta charset>`` in the first 2 KB; unknown names are skipped and
+    UTF-8 is the fallback. Avoids decoding whole pages with the wrong codec
+    on sites that only declare their charset in the markup.
+    """
+    for bom, name in _BOMS:
+        if head.startswith(bom):
+            return name
+    meta = _META_CHARSET_RE.search(head[:2048])
+    for name in (
+        response.charset_encoding,
+        meta.group(1).decode("ascii") if meta else None,
+    ):
+        if not name:
+            continue
+        try:
+            return codecs.lookup(name).name
+        except LookupError:
+            continue
+    return "utf-8"
+
+
+async def _read_capped_text(
+    response: httpx.Response, max_chars: int
+) -> tuple[str, int, bool]:
+    """
+    Decode a streamed body, stopping once more than *max_chars* have arrived.
+
+    Returns:
+        ``(text, chars_read, truncated)``; when truncated, *chars_read* is a
+        lower bound on the full length since the rest is never downloaded.
+    """
+    decoder: codecs.IncrementalDecoder | None = None
+    parts: list[str] = []
+    size = 0
+    async for chunk in response.aiter_bytes(16384):
+        if decoder is None:
+            decoder = codecs.getincrementaldecoder(
+                _body_encoding(response, chunk)
+            )(errors="replace")
+        piece = decoder.decode(chunk)
+        parts.append(piece)
+        size += len(piece)
+        if size > max_chars:
+            return "".join(parts)[:max_chars], size, True
+    if decoder is not None:
+        parts.append(decoder.decode(b"", final=True))
+    text = "".join(parts)
+    return text, len(text), False
+
+
+@dataclass(frozen=True)
+class _CachedHtml:
+    """A downloaded page plus the validators needed to revalidate it."""
+
+    page: DownloadedHtml
+    etag: str | None
+    last_modified: str | None
+    stored_at: float
+
+
+@dataclass
+class _InFlight:
+    """A shared fetch plus the number of callers still waiting on it."""
+
+    task: asyncio.Task[NewspaperFetchResultDTO]
+    waiters: int = 0
+
+
 class NewspaperService:
     """
     Downloads HTML once, then runs extraction strategies (newspaper + BS4 fallbacks).
     """
 
+    def __init__(self):
+        """Initialize service; the pooled HTTP client is created on first download."""
+        self._client: httpx.AsyncClient | None = None
+        self._html_cache: OrderedDict[str, _CachedHtml] = OrderedDict()
+        self._inflight: dict[str, _InFlight] = {}
+
+    def _http_client(self) -> httpx.AsyncClient:
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                timeout=REQUEST_TIMEOUT,
+                follow_redirects=True,
+                headers=_DOWNLOAD_HEADERS,
+                limits=httpx.Limits(
+                    max_connections=100,
+                    max_keepalive_connections=50,
+                ),
+            )
+        return self._client
+
+    async def close(self) -> None:
+        """Close the pooled HTTP client and any parser worker processes."""
+        global _process_pool
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+        if _process_pool is not None:
+            _process_pool.shutdown(wait=False, cancel_futures=True)
+            _process_pool = None
+
+    async def warmup(self) -> None:
+        """
+        Parse a tiny page with every extractor before the first request.
+
+        Runs on the parse executor (once per worker process when
+        URL_PARSE_PROCESSES is set). Failures are logged and swallowed.
+        """
+        if not URL_WARMUP_ON_STARTUP:
+            return
+        loop = asyncio.get_running_loop()
+        executor = _parse_executor()
+        try:
+            await asyncio.gather(*(
+                loop.run_in_executor(executor, _warm_parsers)
+                for _ in range(max(1, URL_PARSE_PROCESSES))
+            ))
+            logger.info("url_parser_warmup_complete")
+        except Exception as e:
+            logger.warning(
+                "url_parser_warmup_failed",
+                error=str(e),
+                error_type=type(e).__name__,
+            )
+
     async def fetch_article(self, url: str) -> NewspaperFetchResultDTO:
         """
         Download *url* and return extracted article text and metadata.
 
+        Concurrent calls for the same URL share one download and parse; the
+        shared fetch is cancelled only once every caller has gone away.
+
         Raises:
             ValueError: URL invalid or empty HTTP body.
             RuntimeError: Network error or all extractors failed quality gates.
         """
-        self._validate_url(url)
+        entry = self._inflight.get(url)
+        if entry is None:
+            entry = _InFlight(asyncio.create_task(self._fetch_article(url)))
+            self._inflight[url] = entry
+            entry.task.add_done_callback(lambda _: self._inflight.pop(url, None))
+        else:
+            logger.debug("url_fetch_coalesced", url=url)
+
+        entry.waiters += 1
+        try:
+            return await asyncio.shield(entry.task)
+        finally:
+            entry.waiters -= 1
+            if not entry.waiters and not entry.task.done():
+                entry.task.cancel()
+
+    async def _fetch_article(self, url: str) -> NewspaperFetchResultDTO:
+        host = self._validate_url(url)
         t0 = time.perf_counter()
-        host = parsed_host(url)
         logger.info("extraction_pipeline_started", url=url, host=host)
 
         downloaded = await self._download_html(url)
@@ -93,7 +345,7 @@ class NewspaperService:
                 max_length=MAX_HTML_TEXT_LENGTH,
             )
 
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
         wikipedia = is_wikipedia_host(host)
         notes: list[str] = []
 
@@ -155,71 +407,42 @@ class NewspaperService:
                 extraction_rejection_notes=notes,
             )
 
-        # ── Wikipedia: BS4 Wikipedia → newspaper → BS4 generic ─────────────
-        if wikipedia:
-            logger.info("bs4_wikipedia_started", url=url, host=host)
-            wiki_text: str = ""
-            wiki_title: str | None = None
+        executor = _parse_executor()
+        for position, method in enumerate(_strategy_order(wikipedia)):
+            started, failed, succeeded, note = _STRATEGY_EVENTS[method]
+            logger.info(started, url=url, host=host)
             try:
-                wiki_text, wiki_title = await loop.run_in_executor(
-                    None, extract_wikipedia_text, html, url
+                extracted = await loop.run_in_executor(
+                    executor, _STRATEGY_RUNNERS[method], url, html
                 )
             except Exception as exc:
                 logger.error(
-                    "bs4_wikipedia_failed",
+                    failed,
                     url=url,
                     host=host,
                     error=str(exc),
                     exc_info=True,
                 )
-                notes.append(f"wikipedia_bs4_exception:{exc!s}")
-            else:
-                if wiki_text.strip():
-                    qr = evaluate_text_quality(wiki_text)
-                    if qr.accepted:
-                        return complete_success(
-                            wiki_text,
-                            wiki_title,
-                            [],
-                            None,
-                            "bs4_wikipedia",
-                            False,
-                            qr,
-                            strategy_success_event="bs4_wikipedia_succeeded",
-                        )
-                    log_quality_eval(qr, "bs4_wikipedia")
-                    notes.append(f"wikipedia_bs4_rejected:{qr.rejection_reason}")
-
-            logger.info("newspaper_extraction_started", url=url, host=host)
-            np_dto: NewspaperFetchResultDTO | None = None
-            try:
-                np_dto = await loop.run_in_executor(
-                    None, self._parse_with_newspaper, url, html
-                )
-            except Exception as exc:
-                logger.error(
-                    "newspaper_extraction_failed",
-                    url=url,
-                    host=host,
-                    error=str(exc),
-                    exc_info=True,
+                notes.append(f"{note}_exception:{exc!s}")
+                continue
+
+            if not extracted.text.strip():
+                continue
+            qr = evaluate_text_quality(extracted.text)
+            if qr.accepted:
+                return complete_success(
+                    extracted.text,
+                    extracted.title,
+                    extracted.authors,
+                    extracted.publish_date,
+                    method,
+                    position > 0,
+                    qr,
+                    strategy_success_event=succeeded,
                 )
-                notes.append(f"newspaper_exception:{exc!s}")
-            else:
-                qr = evaluate_text_quality(np_dto.text)
-                if qr.accepted:
-                    return complete_success(
-                        np_dto.text,
-                        np_dto.title,
-                        np_dto.authors,
-                        np_dto.publish_date,
-                        "newspaper",
-                        True,
-                        qr,
-                        strategy_success_event="newspaper_extraction_succeeded",
-                    )
-                log_quality_eval(qr, "newspaper")
-                notes.append(f"newspaper_rejected:{qr.rejection_reason}")
+            log_quality_eval(qr, method)
+            notes.append(f"{note}_rejected:{qr.rejection_reason}")
+            if method == "newspaper":
                 logger.info(
                     "newspaper_extraction_rejected",
                     url=url,
@@ -228,119 +451,6 @@ class NewspaperService:
                     rejection_reason=qr.rejection_reason,
                 )
 
-            logger.info("bs4_generic_started", url=url, host=host)
-            try:
-                gen_text, gen_title = await loop.run_in_executor(
-                    None, extract_generic_text, html, url
-                )
-            except Exception as exc:
-                logger.error(
-                    "bs4_generic_failed",
-                    url=url,
-                    host=host,
-                    error=str(exc),
-                    exc_info=True,
-                )
-                notes.append(f"generic_bs4_exception:{exc!s}")
-            else:
-                if gen_text.strip():
-                    qr = evaluate_text_quality(gen_text)
-                    if qr.accepted:
-                        return complete_success(
-                            gen_text,
-                            gen_title,
-                            [],
-                            None,
-                            "bs4_generic",
-                            True,
-                            qr,
-                            strategy_success_event="bs4_generic_succeeded",
-                        )
-                    log_quality_eval(qr, "bs4_generic")
-                    notes.append(f"generic_bs4_rejected:{qr.rejection_reason}")
-
-            elapsed_ms = int((time.perf_counter() - t0) * 1000)
-            logger.error(
-                "extraction_pipeline_failed",
-                url=url,
-                host=host,
-                html_truncated=html_truncated,
-                processing_time_ms=elapsed_ms,
-                notes=notes,
-            )
-            raise RuntimeError(
-                f"Could not extract acceptable text from {url} after all strategies."
-            )
-
-        # ── General: newspaper → BS4 generic ──────────────────────────────
-        logger.info("newspaper_extraction_started", url=url, host=host)
-        try:
-            np_dto = await loop.run_in_executor(
-                None, self._parse_with_newspaper, url, html
-            )
-        except Exception as exc:
-            logger.error(
-                "newspaper_extraction_failed",
-                url=url,
-                host=host,
-                error=str(exc),
-                exc_info=True,
-            )
-            notes.append(f"newspaper_exception:{exc!s}")
-        else:
-            qr = evaluate_text_quality(np_dto.text)
-            if qr.accepted:
-                return complete_success(
-                    np_dto.text,
-                    np_dto.title,
-                    np_dto.authors,
-                    np_dto.publish_date,
-                    "newspaper",
-                    False,
-                    qr,
-                    strategy_success_event="newspaper_extraction_succeeded",
-                )
-            log_quality_eval(qr, "newspaper")
-            notes.append(f"newspaper_rejected:{qr.rejection_reason}")
-            logger.info(
-                "newspaper_extraction_rejected",
-                url=url,
-                host=host,
-                extractor="newspaper",
-                rejection_reason=qr.rejection_reason,
-            )
-
-        logger.info("bs4_generic_started", url=url, host=host)
-        try:
-            gen_text, gen_title = await loop.run_in_executor(
-                None, extract_generic_text, html, url
-            )
-        except Exception as exc:
-            logger.error(
-                "bs4_generic_failed",
-                url=url,
-                host=host,
-                error=str(exc),
-                exc_info=True,
-            )
-            notes.append(f"generic_bs4_exception:{exc!s}")
-        else:
-            if gen_text.strip():
-                qr = evaluate_text_quality(gen_text)
-                if qr.accepted:
-                    return complete_success(
-                        gen_text,
-                        gen_title,
-                        [],
-                        None,
-                        "bs4_generic",
-                        True,
-                        qr,
-                        strategy_success_event="bs4_generic_succeeded",
-                    )
-                log_quality_eval(qr, "bs4_generic")
-                notes.append(f"generic_bs4_rejected:{qr.rejection_reason}")
-
         elapsed_ms = int((time.perf_counter() - t0) * 1000)
         logger.error(
             "extraction_pipeline_failed",
@@ -355,26 +465,33 @@ class NewspaperService:
         )
 
     async def _download_html(self, url: str) -> DownloadedHtml:
-        headers = {
-            "User-Agent": (
-                "Mozilla/5.0 (compatible; AIDetector/1.0; +https://example.com)"
-            ),
-            "Accept-Language": "ru,kk;q=0.9,en;q=0.8",
-            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-        }
+        cached = self._cached_html(url)
+        headers: dict[str, str] = {}
+        if cached is not None:
+            if cached.etag:
+                headers["If-None-Match"] = cached.etag
+            if cached.last_modified:
+                headers["If-Modified-Since"] = cached.last_modified
 
         try:
-            async with httpx.AsyncClient(
-                timeout=REQUEST_TIMEOUT,
-                follow_redirects=True,
-                headers=headers,
-            ) as client:
-                response = await client.get(url)
+            async with self._http_client().stream(
+                "GET", url, headers=headers
+            ) as response:
+                if cached is not None and response.status_code == 304:
+                    self._html_cache.move_to_end(url)
+                    logger.info("html_cache_revalidated", url=url)
+                    return cached.page
                 response.raise_for_status()
-                full_text = response.text
-                original_len = len(full_text)
-                truncated = original_len > MAX_HTML_TEXT_LENGTH
-                content = full_text[:MAX_HTML_TEXT_LENGTH]
+                content, original_len, truncated = await _read_capped_text(
+                    response, MAX_HTML_TEXT_LENGTH
+                )
+                logger.debug(
+                    "html_transfer",
+                    url=url,
+                    content_encoding=response.headers.get("content-encoding"),
+                    wire_bytes=response.num_bytes_downloaded,
+                    text_chars=original_len,
+                )
 
         except httpx.HTTPStatusError as exc:
             logger.error(
@@ -394,11 +511,41 @@ class NewspaperService:
         if not content or not content.strip():
             raise ValueError(f"Server returned an empty response for {url}")
 
-        return DownloadedHtml(
+        page = DownloadedHtml(
             content=content,
             truncated=truncated,
             original_text_length=original_len,
         )
+        self._store_html(url, page, response.headers)
+        return page
+
+    def _cached_html(self, url: str) -> _CachedHtml | None:
+        entry = self._html_cache.get(url)
+        if entry is None:
+            return None
+        if time.monotonic() - entry.stored_at > HTML_CACHE_TTL_SECONDS:
+            del self._html_cache[url]
+            return None
+        return entry
+
+    def _store_html(
+        self, url: str, page: DownloadedHtml, headers: httpx.Headers
+    ) -> None:
+        """Keep *page* only if the server gave us something to revalidate with."""
+        etag = headers.get("etag")
+        last_modified = headers.get("last-modified")
+        if not etag and not last_modified:
+            self._html_cache.pop(url, None)
+            return
+        self._html_cache[url] = _CachedHtml(
+            page=page,
+            etag=etag,
+            last_modified=last_modified,
+            stored_at=time.monotonic(),
+        )
+        self._html_cache.move_to_end(url)
+        while len(self._html_cache) > HTML_CACHE_MAX_ENTRIES:
+            self._html_cache.popitem(last=False)
 
     @staticmethod
     def _parse_with_newspaper(url: str, html: str) -> NewspaperFetchResultDTO:
@@ -412,10 +559,6 @@ class NewspaperService:
         authors: list[str] = article.authors or []
         publish_date = article.publish_date
 
-        if not text:
-            article.nlp()
-            text = (article.summary or "").strip()
-
         if not text:
             raise ValueError(
                 f"Newspaper could not extract any readable text from {url}. "
@@ -443,7 +586,17 @@ class NewspaperService:
         )
 
     @staticmethod
-    def _validate_url(url: str) -> None:
+    def _validate_url(url: str) -> str:
+        """
+        Reject anything but absolute http(s) URLs.
+
+        Returns:
+            Lower-cased host name (no port or userinfo)
+        """
+        match = _URL_RE.match(url)
+        if match:
+            return match.group(1).lower()
+
         try:
             parsed = urlparse(url)
         except Exception as exc:
@@ -455,3 +608,43 @@ class NewspaperService:
             )
         if not parsed.netloc:
             raise ValueError(f"URL has no host: {url!r}")
+        return (parsed.hostname or "").lower().strip()
+
+
+# Strategy runners are module-level so they pickle into parser processes;
+# they return plain dataclasses rather than DTOs for the same reason.
+def _run_newspaper(url: str, html: str) -> _Extracted:
+    dto = NewspaperService._parse_with_newspaper(url, html)
+    return _Extracted(dto.text, dto.title, dto.authors, dto.publish_date)
+
+
+def _run_bs4_wikipedia(url: str, html: str) -> _Extracted:
+    text, title = extract_wikipedia_text(html, url)
+    return _Extracted(text, title, [], None)
+
+
+def _run_bs4_generic(url: str, html: str) -> _Extracted:
+    text, title = extract_generic_text(html, url)
+    return _Extracted(text, title, [], None)
+
+
+_STRATEGY_RUNNERS = {
+    "bs4_wikipedia": _run_bs4_wikipedia,
+    "newspaper": _run_newspaper,
+    "bs4_generic": _run_bs4_generic,
+}
+
+_WARMUP_HTML = (
+    "<html><head><title>Warmup</title></head><body><article>"
+    + "<p>Warmup paragraph for the article parsers.</p>" * 5
+    + "</article></body></html>"
+)
+
+
+def _warm_parsers() -> None:
+    for runner in _STRATEGY_RUNNERS.values():
+        try:
+            runner("https://example.com/warmup", _WARMUP_HTML)
+        except ValueError:
+            # Too little text for this extractor; its setup has still run.
+            pass
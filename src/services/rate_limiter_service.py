@@ -2,12 +2,14 @@
 Rate limiter service for enforcing API rate limits.
 """
 
+from dataclasses import replace
 from datetime import datetime, timezone
 
 from src.core.logging import get_logger
 from src.core.redis_config import redis_config
 from src.dtos.rate_limit_dto import (
     RateLimitExceeded,
+    RateLimitInfo,
     RateLimitPeriod,
     RateLimitStatus,
 )
@@ -15,6 +17,20 @@ from src.repositories.rate_limiter_repository import RateLimiterRepository
 
 logger = get_logger(__name__)
 
+# Returned (with the caller's user_id) when rate limiting is disabled
+_PERMISSIVE_INFO = RateLimitInfo(
+    limit=999999,
+    remaining=999999,
+    reset_at=datetime(2099, 1, 1, tzinfo=timezone.utc),
+    period=RateLimitPeriod.MINUTE
+)
+_PERMISSIVE_STATUS = RateLimitStatus(
+    user_id="",
+    is_allowed=True,
+    minute_limit=_PERMISSIVE_INFO,
+    hour_limit=_PERMISSIVE_INFO
+)
+
 
 class RateLimiterService:
     """Service for managing rate limiting logic."""
@@ -44,36 +60,29 @@ class RateLimiterService:
         if not redis_config.RATE_LIMIT_ENABLED:
             logger.debug("rate_limiting_disabled", user_id=user_id)
             # Return permissive status when disabled
-            from src.dtos.rate_limit_dto import RateLimitInfo
-            now = datetime.now(timezone.utc)
-            dummy_info = RateLimitInfo(
-                limit=999999,
-                remaining=999999,
-                reset_at=now,
-                period=RateLimitPeriod.MINUTE
-            )
-            return RateLimitStatus(
-                user_id=user_id,
-                is_allowed=True,
-                minute_limit=dummy_info,
-                hour_limit=dummy_info
-            )
+            return replace(_PERMISSIVE_STATUS, user_id=user_id)
 
-        # Get current status
-        status = await self.repository.get_rate_limit_status(user_id)
+        # Check and count the request in one atomic script
+        if redis_config.RATE_LIMIT_SLIDING_WINDOW:
+            is_allowed, status = await self.repository.check_and_increment_sliding(
+                user_id
+            )
+        else:
+            is_allowed, status = await self.repository.check_and_increment(user_id)
 
-        if not status.is_allowed:
+        if not is_allowed:
             # Determine which limit was hit
+            now = datetime.now(timezone.utc)
             if not status.minute_limit.remaining:
                 limit_info = status.minute_limit
-                retry_after = max(1, int((limit_info.reset_at - datetime.now(timezone.utc)).total_seconds()))
+                retry_after = max(1, int((limit_info.reset_at - now).total_seconds()))
                 message = (
                     f"Rate limit exceeded: {limit_info.limit} requests per minute. "
                     f"Try again in {retry_after} seconds."
                 )
             else:
                 limit_info = status.hour_limit
-                retry_after = max(1, int((limit_info.reset_at - datetime.now(timezone.utc)).total_seconds()))
+                retry_after = max(1, int((limit_info.reset_at - now).total_seconds()))
                 message = (
                     f"Rate limit exceeded: {limit_info.limit} requests per hour. "
                     f"Try again in {retry_after} seconds."
@@ -93,21 +102,14 @@ class RateLimiterService:
                 limit_info=limit_info
             )
 
-        # Increment counters for both periods
-        await self.repository.increment_rate_limit(user_id, RateLimitPeriod.MINUTE)
-        await self.repository.increment_rate_limit(user_id, RateLimitPeriod.HOUR)
-
-        # Get updated status after increment
-        updated_status = await self.repository.get_rate_limit_status(user_id)
-
-        logger.info(
+        logger.debug(
             "rate_limit_incremented",
             user_id=user_id,
-            minute_remaining=updated_status.minute_limit.remaining,
-            hour_remaining=updated_status.hour_limit.remaining
+            minute_remaining=status.minute_limit.remaining,
+            hour_remaining=status.hour_limit.remaining
         )
 
-        return updated_status
+        return status
 
     async def get_status(self, user_id: str) -> RateLimitStatus:
         """
@@ -119,6 +121,8 @@ class RateLimiterService:
         Returns:
             Current RateLimitStatus
         """
+        if redis_config.RATE_LIMIT_SLIDING_WINDOW:
+            return await self.repository.get_sliding_rate_limit_status(user_id)
         return await self.repository.get_rate_limit_status(user_id)
 
     async def reset_limits(self, user_id: str) -> None:
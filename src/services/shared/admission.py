@@ -0,0 +1,66 @@
+"""
+Process-wide admission control for detection work.
+
+Caps how many detections run at once (Gemini + ML calls) and how many of
+those a single user may hold. Requests over the per-user cap are rejected
+immediately; requests over the global cap wait for a free slot.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+from collections import Counter
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
+from src.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+class DetectionAdmission:
+    """Global concurrency semaphore plus a per-user in-flight cap."""
+
+    def __init__(self, max_concurrent: int, max_per_user: int):
+        self._slots = asyncio.Semaphore(max(1, max_concurrent))
+        self._max_per_user = max(1, max_per_user)
+        self._inflight: Counter[str] = Counter()
+
+    @asynccontextmanager
+    async def admit(self, user_id: str) -> AsyncIterator[None]:
+        """
+        Hold one detection slot for *user_id* for the duration of the block.
+
+        Raises:
+            ValueError: If the user already has the maximum number of
+                detections in flight
+        """
+        if self._inflight[user_id] >= self._max_per_user:
+            logger.warning(
+                "detection_admission_rejected",
+                user_id=user_id,
+                in_flight=self._inflight[user_id],
+            )
+            raise ValueError(
+                "Concurrent request limit exceeded. "
+                "Wait for your previous analysis to finish."
+            )
+
+        self._inflight[user_id] += 1
+        try:
+            async with self._slots:
+                yield
+        finally:
+            self._inflight[user_id] -= 1
+            if not self._inflight[user_id]:
+                del self._inflight[user_id]
+
+
+# Shared by every detection service instance in the process (the services
+# themselves are request-scoped): file/text and URL detections, from both
+# the API and the Telegram bot, draw from the same slots.
+detection_admission = DetectionAdmission(
+    max_concurrent=int(os.getenv("MAX_CONCURRENT_DETECTIONS", "16")),
+    max_per_user=int(os.getenv("MAX_CONCURRENT_DETECTIONS_PER_USER", "2")),
+)
@@ -0,0 +1,137 @@
+"""
+In-process cache for the bearer-token authentication hot path.
+
+Every protected request decodes its JWT and loads the user from Postgres.
+Hot tokens repeat both many times a minute, so the resulting
+``AuthenticatedUserDTO`` (or the rejection) is cached briefly, keyed by a
+BLAKE2 digest of the token. Entries never outlive the token's own ``exp``.
+
+The cache is per process: explicit invalidation only reaches the worker
+that made the change, and the TTL bounds staleness everywhere else.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import time
+from collections import OrderedDict
+from typing import Any, NamedTuple, Optional, Union
+
+from fastapi import HTTPException
+
+from src.dtos.user_dto import AuthenticatedUserDTO
+
+
+class CachedRejection(NamedTuple):
+    """The parts of a 401/403 needed to raise it again."""
+
+    status_code: int
+    detail: Any
+    headers: Optional[dict[str, str]]
+
+    def to_exception(self) -> HTTPException:
+        """Build a fresh exception so cache hits never share traceback state."""
+        headers = dict(self.headers) if self.headers is not None else None
+        return HTTPException(
+            status_code=self.status_code, detail=self.detail, headers=headers
+        )
+
+
+CachedAuth = Union[AuthenticatedUserDTO, CachedRejection]
+
+
+class AuthCache:
+    """TTL + LRU map from access-token digest to user or rejection."""
+
+    def __init__(
+        self, maxsize: int, ttl_seconds: float, negative_ttl_seconds: float
+    ):
+        """
+        Initialize auth cache.
+
+        Args:
+            maxsize: Max cached tokens (least recently used are evicted)
+            ttl_seconds: Lifetime of a successful lookup
+            negative_ttl_seconds: Lifetime of a cached 401/403
+        """
+        self._maxsize = max(1, maxsize)
+        self._ttl = ttl_seconds
+        self._negative_ttl = negative_ttl_seconds
+        self._entries: OrderedDict[bytes, tuple[float, CachedAuth]] = OrderedDict()
+
+    @staticmethod
+    def _key(token: str) -> bytes:
+        return hashlib.blake2b(token.encode(), digest_size=16).digest()
+
+    def get(self, token: str) -> Optional[CachedAuth]:
+        """Return the cached user or rejection for *token*, if still fresh."""
+        key = self._key(token)
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def put(
+        self, token: str, user: AuthenticatedUserDTO, token_exp: Optional[float]
+    ) -> None:
+        """
+        Cache a successful lookup, capped at the token's ``exp`` claim.
+
+        Args:
+            token: Raw bearer token
+            user: Authenticated user built for this token
+            token_exp: ``exp`` claim (Unix time), if present
+        """
+        ttl = self._ttl
+        if token_exp is not None:
+            ttl = min(ttl, token_exp - time.time())
+        self._store(token, user, ttl)
+
+    def put_rejection(self, token: str, exc: HTTPException) -> None:
+        """Cache a 401/403 briefly so retry storms skip the database."""
+        headers = dict(exc.headers) if exc.headers is not None else None
+        rejection = CachedRejection(exc.status_code, exc.detail, headers)
+        self._store(token, rejection, self._negative_ttl)
+
+    def invalidate_user(self, user_id: str) -> None:
+        """Drop every cached token for *user_id* (after account changes)."""
+        stale = [
+            key
+            for key, (_, value) in self._entries.items()
+            if isinstance(value, AuthenticatedUserDTO) and value.id == user_id
+        ]
+        for key in stale:
+            del self._entries[key]
+
+    def _store(self, token: str, value: CachedAuth, ttl: float) -> None:
+        if ttl <= 0:
+            return
+        key = self._key(token)
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._maxsize:
+            self._entries.popitem(last=False)
+
+
+_auth_cache: Optional[AuthCache] = None
+
+
+def get_auth_cache(
+    maxsize: int, ttl_seconds: float, negative_ttl_seconds: float
+) -> AuthCache:
+    """Return the process-wide cache, creating it on first use."""
+    global _auth_cache
+    if _auth_cache is None:
+        _auth_cache = AuthCache(maxsize, ttl_seconds, negative_ttl_seconds)
+    return _auth_cache
+
+
+def invalidate_cached_user(user_id: str) -> None:
+    """Forget cached authentications for *user_id* in this process."""
+    if _auth_cache is not None:
+        _auth_cache.invalidate_user(user_id)
@@ -17,12 +17,21 @@ from src.core.logging import get_logger
 from src.core.security import decode_access_token
 from src.dtos.user_dto import AuthenticatedUserDTO
 from src.repositories.auth_repository import AuthRepository
+from src.services.shared.auth_cache import (
+    AuthCache,
+    CachedRejection,
+    get_auth_cache,
+)
 
 if TYPE_CHECKING:
     from dishka import AsyncContainer
 
 logger = get_logger(__name__)
 
+# One shared scheme: requests without a Bearer header get a 401 from this
+# sub-dependency before any Dishka resolution happens.
+_BEARER = HTTPBearer(auto_error=True)
+
 
 async def _build_authenticated_user_dto(
     request: Request,
@@ -39,94 +48,132 @@ async def _build_authenticated_user_dto(
 
     try:
         config: Config = await container.get(Config)
-        auth_repository: AuthRepository = await container.get(AuthRepository)
         token = credentials.credentials
 
-        try:
-            payload = decode_access_token(token, config)
-            user_id: str = payload.get("sub")
-
-            if user_id is None:
-                logger.warning("token_missing_user_id")
-                raise HTTPException(
-                    status_code=status.HTTP_401_UNAUTHORIZED,
-                    detail="Invalid authentication credentials",
-                    headers={"WWW-Authenticate": "Bearer"},
-                )
-
-        except jwt.ExpiredSignatureError:
-            logger.warning("token_expired")
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Token has expired",
-                headers={"WWW-Authenticate": "Bearer"},
+        cache: Optional[AuthCache] = None
+        if config.AUTH_CACHE_TTL_SECONDS > 0:
+            cache = get_auth_cache(
+                config.AUTH_CACHE_SIZE,
+                config.AUTH_CACHE_TTL_SECONDS,
+                config.AUTH_CACHE_NEGATIVE_TTL_SECONDS,
             )
-        except jwt.InvalidTokenError as e:
-            logger.warning("invalid_token", error=str(e))
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Invalid authentication credentials",
-                headers={"WWW-Authenticate": "Bearer"},
+            cached = cache.get(token)
+            if isinstance(cached, CachedRejection):
+                raise cached.to_exception()
+            if cached is not None:
+                return cached
+
+        try:
+            user_dto, token_exp = await _load_authenticated_user(
+                token, config, await container.get(AuthRepository)
             )
+        except HTTPException as e:
+            if cache is not None and e.status_code in (
+                status.HTTP_401_UNAUTHORIZED,
+                status.HTTP_403_FORBIDDEN,
+            ):
+                cache.put_rejection(token, e)
+            raise
+
+        # Unverified users are always re-read so a just-confirmed email takes
+        # effect on every worker, not only the one that handled the link.
+        if cache is not None and user_dto.is_verified:
+            cache.put(token, user_dto, token_exp)
+
+        return user_dto
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error("authentication_error", error=str(e), error_type=type(e).__name__)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Authentication error",
+        )
+
 
-        user_model = await auth_repository.get_user_by_id(user_id)
+async def _load_authenticated_user(
+    token: str,
+    config: Config,
+    auth_repository: AuthRepository,
+) -> tuple[AuthenticatedUserDTO, Optional[float]]:
+    """Verify *token* and load its user; returns the DTO and the ``exp`` claim."""
+    try:
+        payload = decode_access_token(token, config)
+        user_id: str = payload.get("sub")
 
-        if user_model is None:
-            logger.warning("user_not_found", user_id=user_id)
+        if user_id is None:
+            logger.warning("token_missing_user_id")
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="User not found",
+                detail="Invalid authentication credentials",
                 headers={"WWW-Authenticate": "Bearer"},
             )
 
-        if not user_model.is_active:
-            logger.warning("user_inactive", user_id=user_model.id)
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="Inactive user account",
-            )
-
-        oauth_providers = await auth_repository.list_oauth_providers_for_user(
-            user_model.id
+    except jwt.ExpiredSignatureError:
+        logger.warning("token_expired")
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Token has expired",
+            headers={"WWW-Authenticate": "Bearer"},
         )
-        auth_provider_set = set(oauth_providers)
-        if user_model.hashed_password:
-            auth_provider_set.add("password")
-        auth_providers_sorted = sorted(auth_provider_set)
-
-        user_dto = AuthenticatedUserDTO(
-            id=user_model.id,
-            username=user_model.username,
-            email=user_model.email,
-            is_active=user_model.is_active,
-            is_verified=user_model.is_verified,
-            created_at=user_model.created_at,
-            updated_at=user_model.updated_at,
-            has_password=user_model.hashed_password is not None,
-            auth_providers=auth_providers_sorted,
+    except jwt.InvalidTokenError as e:
+        logger.warning("invalid_token", error=str(e))
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid authentication credentials",
+            headers={"WWW-Authenticate": "Bearer"},
         )
 
-        logger.debug(
-            "user_authenticated",
-            user_id=user_dto.id,
-            username=user_dto.username,
-        )
+    user_model = await auth_repository.get_user_by_id(user_id)
 
-        return user_dto
+    if user_model is None:
+        logger.warning("user_not_found", user_id=user_id)
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="User not found",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
 
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error("authentication_error", error=str(e), error_type=type(e).__name__)
+    if not user_model.is_active:
+        logger.warning("user_inactive", user_id=user_model.id)
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Authentication error",
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Inactive user account",
         )
 
+    oauth_providers = await auth_repository.list_oauth_providers_for_user(
+        user_model.id
+    )
+    auth_provider_set = set(oauth_providers)
+    if user_model.hashed_password:
+        auth_provider_set.add("password")
+    auth_providers_sorted = tuple(sorted(auth_provider_set))
+
+    user_dto = AuthenticatedUserDTO(
+        id=user_model.id,
+        username=user_model.username,
+        email=user_model.email,
+        is_active=user_model.is_active,
+        is_verified=user_model.is_verified,
+        created_at=user_model.created_at,
+        updated_at=user_model.updated_at,
+        has_password=user_model.hashed_password is not None,
+        auth_providers=auth_providers_sorted,
+    )
+
+    logger.debug(
+        "user_authenticated",
+        user_id=user_dto.id,
+        username=user_dto.username,
+    )
+
+    return user_dto, payload.get("exp")
+
 
 async def get_authenticated_user_dependency(
     request: Request,
-    credentials: HTTPAuthorizationCredentials = Depends(HTTPBearer()),
+    credentials: HTTPAuthorizationCredentials = Depends(_BEARER),
 ) -> AuthenticatedUserDTO:
     """Authenticate via JWT; allow unverified users (e.g. /me, resend verification)."""
     return await _build_authenticated_user_dto(request, credentials)
@@ -134,7 +181,7 @@ async def get_authenticated_user_dependency(
 
 async def require_verified_user(
     request: Request,
-    credentials: HTTPAuthorizationCredentials = Depends(HTTPBearer()),
+    credentials: HTTPAuthorizationCredentials = Depends(_BEARER),
 ) -> AuthenticatedUserDTO:
     """Authenticate and require a confirmed email for core product routes."""
     user = await _build_authenticated_user_dto(request, credentials)
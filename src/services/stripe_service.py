@@ -23,6 +23,7 @@ from src.core.config import Config
 from src.core.logging import get_logger
 from src.repositories.ai_detection_repository import AIDetectionRepository
 from src.repositories.auth_repository import AuthRepository
+from src.repositories.limit_cache_repository import LimitCacheRepository
 from src.repositories.subscription_repository import SubscriptionRepository
 
 logger = get_logger(__name__)
@@ -53,11 +54,16 @@ class StripeService:
         subscription_repo: SubscriptionRepository,
         ai_detection_repo: AIDetectionRepository,
         auth_repo: AuthRepository,
+        limit_cache: LimitCacheRepository | None = None,
     ):
         self.config = config
         self.subscription_repo = subscription_repo
         self.ai_detection_repo = ai_detection_repo
         self.auth_repo = auth_repo
+        self.limit_cache = limit_cache
+        # Users whose plan limits this event changed; their cached over-quota
+        # verdicts are dropped once the change is committed.
+        self._limits_changed: set[str] = set()
 
         if config.STRIPE_SECRET_KEY:
             stripe.api_key = config.STRIPE_SECRET_KEY
@@ -223,6 +229,7 @@ class StripeService:
 
         logger.info("stripe_event_processing", event_type=event.type, event_id=event.id)
         await handler(event)
+        await self._invalidate_changed_limits()
 
     # ------------------------------------------------------------------
     # Private: event handlers
@@ -395,6 +402,7 @@ class StripeService:
             monthly_limit=PREMIUM_MONTHLY_LIMIT,
             is_premium=True,
         )
+        self._limits_changed.add(user_id)
 
     async def _apply_free(self, user_id: str) -> None:
         await self.ai_detection_repo.update_user_limits(
@@ -403,6 +411,21 @@ class StripeService:
             monthly_limit=FREE_MONTHLY_LIMIT,
             is_premium=False,
         )
+        self._limits_changed.add(user_id)
+
+    async def _invalidate_changed_limits(self) -> None:
+        """Commit the new limits, then drop the users' cached quota verdicts.
+
+        Invalidating before the commit would let a concurrent request re-read
+        the old limits and cache them again.
+        """
+        if not self._limits_changed:
+            return
+        user_ids, self._limits_changed = self._limits_changed, set()
+        await self.auth_repo.session.commit()
+        if self.limit_cache:
+            for user_id in user_ids:
+                await self.limit_cache.invalidate(user_id)
 
 
 def _ts_to_dt(ts: int | None) -> datetime | None:
@@ -7,15 +7,20 @@ Delegates detection and billing to existing domain services.
 from __future__ import annotations
 
 import asyncio
+import io
 
 from aiogram import Bot, Dispatcher
+from aiogram.client.session.aiohttp import AiohttpSession
 from aiogram.fsm.storage.memory import MemoryStorage
+from pydantic_core import from_json
 
 from src.core.config import Config
 from src.core.logging import get_logger
 from src.infrastructure.redis_client import RedisClient
 from src.repositories.ai_detection_repository import AIDetectionRepository
+from src.repositories.article_cache_repository import ArticleCacheRepository
 from src.repositories.auth_repository import AuthRepository
+from src.repositories.limit_cache_repository import LimitCacheRepository
 from src.repositories.rate_limiter_repository import RateLimiterRepository
 from src.repositories.subscription_repository import SubscriptionRepository
 from src.services.ai_detection_service import AIDetectionService
@@ -29,9 +34,17 @@ from src.services.text_normalization_service import TextNormalizationService
 from src.services.url_detection_service import URLDetectionService
 from src.telegram_bot.context import TelegramSessionContext
 from src.telegram_bot.routers import register_telegram_routers
+from src.telegram_bot.throttling import OutgoingThrottleMiddleware
 
 logger = get_logger(__name__)
 
+# Documents larger than this are fetched as concurrent byte ranges.
+_PARALLEL_DOWNLOAD_MIN_BYTES = 1_048_576
+_PARALLEL_DOWNLOAD_PARTS = 4
+
+# Idle keep-alive for Bot API connections (aiohttp's default is 15 s).
+_KEEPALIVE_SECONDS = 60
+
 
 class TelegramBotService:
     """Transport layer for the Telegram bot."""
@@ -55,7 +68,15 @@ class TelegramBotService:
             self._redis = None
             return
 
-        self.bot = Bot(token=app_config.TELEGRAM_BOT_TOKEN)
+        # Decode Bot API responses (incl. every getUpdates batch) with
+        # pydantic-core's Rust JSON parser instead of the stdlib one.
+        session = AiohttpSession(json_loads=from_json)
+        # aiohttp drops idle keep-alive connections after 15 s, so a reply
+        # after a short lull pays a new TLS handshake to api.telegram.org.
+        # AiohttpSession has no public hook for connector options.
+        session._connector_init["keepalive_timeout"] = _KEEPALIVE_SECONDS
+        self.bot = Bot(token=app_config.TELEGRAM_BOT_TOKEN, session=session)
+        self.bot.session.middleware(OutgoingThrottleMiddleware())
         self.dp = Dispatcher(storage=MemoryStorage())
         self._session_factory = session_factory
         self._config = app_config
@@ -71,15 +92,21 @@ class TelegramBotService:
         auth = AuthRepository(session)
         ai_repo = AIDetectionRepository(session)
         sub_repo = SubscriptionRepository(session)
+        limit_cache = (
+            LimitCacheRepository(self._redis) if self._redis is not None else None
+        )
         ai_det = AIDetectionService(
-            self._gemini, self._ml, ai_repo, self._norm
+            self._gemini, self._ml, ai_repo, self._norm, limit_cache
+        )
+        article_cache = (
+            ArticleCacheRepository(self._redis) if self._redis is not None else None
         )
         url_det = URLDetectionService(
-            self._newspaper, self._ml, ai_repo, self._norm
+            self._newspaper, self._ml, ai_repo, self._norm, article_cache
         )
         tg_det = TelegramDetectionService(ai_det, url_det)
         stripe = StripeService(
-            self._config, sub_repo, ai_repo, auth
+            self._config, sub_repo, ai_repo, auth, limit_cache
         )
         rate: RateLimiterService | None = None
         if self._redis is not None:
@@ -103,7 +130,78 @@ class TelegramBotService:
         assert self.bot
         tg_file = await self.bot.get_file(file_id)
         raw = await self.bot.download_file(tg_file.file_path)
-        return raw.read() if hasattr(raw, "read") else bytes(raw)
+        # getvalue() trims BytesIO's buffer in place and hands it over; the
+        # BytesIO the extractor wraps around it shares it too, so the
+        # payload is never copied after download.
+        return raw.getvalue() if isinstance(raw, io.BytesIO) else raw.read()
+
+    async def _download_bytes_parallel(self, file_id: str, size: int | None) -> bytes:
+        """
+        Download a document as concurrent HTTP range requests.
+
+        The first range doubles as a probe: the others are only requested
+        once it comes back as ``206`` with the expected ``Content-Range``.
+        A server that ignores ``Range`` answers ``200`` with the whole file,
+        which is used as-is. Small files and a local Bot API server go
+        straight to the single-stream :meth:`_download_bytes`.
+
+        Args:
+            file_id: Telegram file id
+            size: File size reported in the message, if any
+        """
+        assert self.bot
+        if not size or size <= _PARALLEL_DOWNLOAD_MIN_BYTES or self.bot.session.api.is_local:
+            return await self._download_bytes(file_id)
+
+        tg_file = await self.bot.get_file(file_id)
+        url = self.bot.session.api.file_url(self.bot.token, tg_file.file_path)
+        step = -(-size // _PARALLEL_DOWNLOAD_PARTS)
+        ranges = [(start, min(start + step, size) - 1) for start in range(0, size, step)]
+
+        async def fetch(first: int, last: int) -> bytes:
+            chunks = [
+                chunk
+                async for chunk in self.bot.session.stream_content(
+                    url, headers={"Range": f"bytes={first}-{last}"}
+                )
+            ]
+            return b"".join(chunks)
+
+        first, last = ranges[0]
+        http = await self.bot.session.create_session()
+        async with http.get(
+            url,
+            headers={"Range": f"bytes={first}-{last}"},
+            timeout=30,
+            raise_for_status=True,
+        ) as resp:
+            if resp.status == 200:
+                # Range ignored: this response already is the whole file
+                return await resp.read()
+            content_range = resp.headers.get("Content-Range")
+            if resp.status == 206 and content_range == f"bytes {first}-{last}/{size}":
+                rest = asyncio.ensure_future(
+                    asyncio.gather(*(fetch(a, b) for a, b in ranges[1:]))
+                )
+                try:
+                    parts = [await resp.read(), *await rest]
+                finally:
+                    rest.cancel()
+                if all(len(p) == b - a + 1 for p, (a, b) in zip(parts, ranges)):
+                    return b"".join(parts)
+                received = [len(p) for p in parts]
+            else:
+                received = None
+
+        logger.warning(
+            "telegram_parallel_download_mismatch",
+            file_id=file_id,
+            size=size,
+            status=resp.status,
+            content_range=content_range,
+            received=received,
+        )
+        return await self._download_bytes(file_id)
 
     async def start(self) -> None:
         if not self.bot or not self.dp:
@@ -26,7 +26,7 @@ logger = get_logger(__name__)
 DetectionKind = Literal["text", "file", "image", "url"]
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TelegramDetectionResult:
     """
     Result returned to the Telegram bot handler.
@@ -209,12 +209,15 @@ class TelegramDetectionService:
             language_effective = eff
         else:
             language_effective = str(eff)
+        word_count = meta.get("word_count")
+        if word_count is None:
+            word_count = len(result_dto.text_preview.split())
 
         return TelegramDetectionResult(
             result=result_dto.result,
             confidence=result_dto.confidence,
             processing_time_ms=meta.get("processing_time_ms", 0),
-            word_count=meta.get("word_count", len(result_dto.text_preview.split())),
+            word_count=word_count,
             source_label=source_label,
             file_name=result_dto.file_name,
             daily_remaining=limits_dto.daily_remaining,
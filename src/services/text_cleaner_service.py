@@ -50,14 +50,19 @@ class TextCleanerService:
     _TABLE_ROW    = re.compile(r"^\|.*\|$", re.MULTILINE)
     _TABLE_SEP    = re.compile(r"^[\|\s\-:]+$", re.MULTILINE)
     _MULTI_BLANK  = re.compile(r"\n{3,}")
-    _ONLY_URL     = re.compile(
-        r"^\s*(https?://\S+|www\.\S+)\s*$", re.MULTILINE
-    )
-    _ONLY_PUNCT   = re.compile(r"^\s*[\W_]+\s*$", re.MULTILINE)
-    # Jina sometimes adds metadata lines like "Source: …" at the top
-    _JINA_META    = re.compile(
-        r"^(Source|URL|Title|Description|Published|Author|Date|Tags):\s.*$",
-        re.MULTILINE | re.IGNORECASE,
+    # Whole-line noise, removed in one pass: Jina metadata lines such as
+    # "Source: …", bare URLs, and punctuation-only lines. \s is a subset of
+    # [\W_], so the punctuation branch needs no surrounding \s* (which only
+    # added backtracking, cubic on long space-padded lines).
+    _NOISE_LINE   = re.compile(
+        r"""
+        ^(?:
+            (?i:Source|URL|Title|Description|Published|Author|Date|Tags):\s.*
+          | [^\S\n]*(?:https?://\S+|www\.\S+)[^\S\n]*
+          | [\W_]+
+        )$
+        """,
+        re.MULTILINE | re.VERBOSE,
     )
 
     def clean(self, markdown: str) -> str:
@@ -75,26 +80,37 @@ class TextCleanerService:
         """
         text = markdown
 
-        text = self._FRONT_MATTER.sub("", text)
-        text = self._FENCED_CODE.sub("", text)
-        text = self._INLINE_CODE.sub("", text)
-        text = self._HTML_TAG.sub("", text)
+        # Each pass only runs if its literal trigger occurs in the text: an
+        # ``in`` check is a memchr-speed scan, a regex pass is not.
+        if "---" in text:
+            text = self._FRONT_MATTER.sub("", text)
+        if "`" in text:
+            text = self._FENCED_CODE.sub("", text)
+            text = self._INLINE_CODE.sub("", text)
+        if "<" in text:
+            text = self._HTML_TAG.sub("", text)
 
         # Markdown links/images: keep only the visible label
-        text = self._MD_LINK.sub(lambda m: m.group(1), text)
+        if "](" in text:
+            text = self._MD_LINK.sub(lambda m: m.group(1), text)
 
-        text = self._HEADING.sub("", text)
+        if "#" in text:
+            text = self._HEADING.sub("", text)
 
         # Bold / italic: keep inner text
-        text = self._BOLD_ITALIC.sub(lambda m: m.group(2), text)
-
-        text = self._BLOCKQUOTE.sub("", text)
-        text = self._HR.sub("", text)
-        text = self._TABLE_ROW.sub("", text)
+        if "*" in text or "_" in text:
+            text = self._BOLD_ITALIC.sub(lambda m: m.group(2), text)
+
+        if ">" in text:
+            text = self._BLOCKQUOTE.sub("", text)
+        if "-" in text or "*" in text or "_" in text:
+            text = self._HR.sub("", text)
+        if "|" in text:
+            text = self._TABLE_ROW.sub("", text)
+        # _TABLE_SEP and _NOISE_LINE also match whitespace-only spans, so
+        # they have no trigger character and always run.
         text = self._TABLE_SEP.sub("", text)
-        text = self._JINA_META.sub("", text)
-        text = self._ONLY_URL.sub("", text)
-        text = self._ONLY_PUNCT.sub("", text)
+        text = self._NOISE_LINE.sub("", text)
 
         # Normalise whitespace
         lines = [line.strip() for line in text.splitlines()]
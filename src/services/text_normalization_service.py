@@ -66,7 +66,6 @@ _REPETITION_RATIO = 0.4  # fraction of lines that are duplicates
 
 # ── Compiled patterns (module-level, built once) ────────────────────────────
 
-_NBSP = re.compile(r"\u00a0")
 _HORIZONTAL_WS_RUN = re.compile(r"[ \t]+")
 _TRAILING_WS = re.compile(r"[ \t]+$", re.MULTILINE)
 _MULTI_BLANK = re.compile(r"\n{3,}")
@@ -167,13 +166,11 @@ class TextNormalizationService:
 
     @staticmethod
     def _normalize_whitespace(text: str) -> str:
-        text = _NBSP.sub(" ", text)
+        text = text.replace("\u00a0", " ")
         text = _TRAILING_WS.sub("", text)
-        lines = text.split("\n")
-        normalized: list[str] = []
-        for line in lines:
-            normalized.append(_HORIZONTAL_WS_RUN.sub(" ", line))
-        text = "\n".join(normalized)
+        # [ \t]+ never crosses a newline, so one pass over the whole text
+        # collapses runs exactly as a per-line loop would.
+        text = _HORIZONTAL_WS_RUN.sub(" ", text)
         text = _MULTI_BLANK.sub("\n\n", text)
         return text
 
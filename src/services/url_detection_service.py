@@ -7,6 +7,7 @@ Orchestrates the full pipeline:
 
 from __future__ import annotations
 
+import asyncio
 import time
 from dataclasses import asdict
 
@@ -15,11 +16,18 @@ from src.api.v1.schemas.detection_language import (
     resolve_effective_language,
 )
 from src.core.logging import get_logger
-from src.dtos.ai_detection_dto import AIDetectionResultDTO, DetectionSource
+from src.core.redis_config import redis_config
+from src.dtos.ai_detection_dto import (
+    AIDetectionResultDTO,
+    DetectionSource,
+    NewspaperFetchResultDTO,
+)
 from src.dtos.limits_dto import UserLimitDTO
 from src.repositories.ai_detection_repository import AIDetectionRepository
+from src.repositories.article_cache_repository import ArticleCacheRepository
 from src.services.ml_model_service import AIDetectionModelService
 from src.services.newspaper_service import NewspaperService
+from src.services.shared.admission import detection_admission
 from src.services.text_normalization_service import TextNormalizationService
 
 logger = get_logger(__name__)
@@ -47,11 +55,49 @@ class URLDetectionService:
         ml_model_service: AIDetectionModelService,
         ai_detection_repository: AIDetectionRepository,
         normalization_service: TextNormalizationService,
+        article_cache: ArticleCacheRepository | None = None,
     ) -> None:
         self._newspaper = newspaper_service
         self._model = ml_model_service
         self._repo = ai_detection_repository
         self._normalizer = normalization_service
+        self._article_cache = article_cache
+
+    async def _fetch_article(self, url: str) -> NewspaperFetchResultDTO:
+        """
+        Fetch *url* through the shared article cache when one is configured.
+
+        On a miss, one worker takes the per-URL lock and downloads; the
+        others poll the cache until the result lands or the lock frees up.
+        """
+        cache = self._article_cache
+        if cache is None:
+            return await self._newspaper.fetch_article(url)
+
+        cached = await cache.get(url)
+        if cached is not None:
+            logger.info("article_cache_hit", url=url)
+            return cached
+
+        token = await cache.acquire_lock(url)
+        if token is None:
+            loop = asyncio.get_running_loop()
+            deadline = loop.time() + redis_config.ARTICLE_FETCH_LOCK_SECONDS
+            while token is None and loop.time() < deadline:
+                await asyncio.sleep(0.25)
+                cached = await cache.get(url)
+                if cached is not None:
+                    logger.info("article_cache_hit", url=url, waited=True)
+                    return cached
+                token = await cache.acquire_lock(url)
+
+        try:
+            article = await self._newspaper.fetch_article(url)
+            await cache.set(article, url)
+            return article
+        finally:
+            if token is not None:
+                await cache.release_lock(url, token)
 
     async def detect_from_url(
         self,
@@ -60,8 +106,27 @@ class URLDetectionService:
         *,
         language: DetectionLanguageContext,
     ) -> tuple[AIDetectionResultDTO, UserLimitDTO]:
-        """Run the full URL -> detection pipeline for a user."""
-        start_time = time.time()
+        """
+        Run the full URL -> detection pipeline for a user.
+
+        Holds a process-wide detection slot for the whole run, so URL
+        detections share the concurrency caps with file/text detections.
+
+        Raises:
+            ValueError: Invalid URL, unusable page, or a limit exceeded
+            RuntimeError: Download, extraction or ML failure
+        """
+        async with detection_admission.admit(user_id):
+            return await self._detect_from_url(url, user_id, language=language)
+
+    async def _detect_from_url(
+        self,
+        url: str,
+        user_id: str,
+        *,
+        language: DetectionLanguageContext,
+    ) -> tuple[AIDetectionResultDTO, UserLimitDTO]:
+        start_ns = time.perf_counter_ns()
         logger.info(
             "url_detection_start",
             url=url,
@@ -70,7 +135,7 @@ class URLDetectionService:
             language_effective=language.effective,
         )
 
-        # 1. Check limits
+        # 1. Check limits before anything is downloaded
         can_request, user_limit = await self._repo.can_make_request(user_id)
         if not can_request:
             logger.warning(
@@ -88,7 +153,7 @@ class URLDetectionService:
             )
 
         # 2. Fetch & extract article
-        article = await self._newspaper.fetch_article(url)
+        article = await self._fetch_article(url)
 
         # 3. Normalize
         norm = self._normalizer.normalize(article.text, source_format="url")
@@ -117,10 +182,13 @@ class URLDetectionService:
         )
 
         # 6. ML inference
-        result, confidence = await self._model.detect_ai_text(
+        result, confidence = await self._model.submit(
             plain_text, language=language.effective
         )
-        processing_time_ms = int((time.time() - start_time) * 1000)
+        processing_time_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
+        text_length = len(plain_text)
+        word_count = len(plain_text.split())
+        preview = plain_text[:500]
 
         # 7. Persist
         updated_limit = await self._repo.increment_usage(user_id)
@@ -130,9 +198,9 @@ class URLDetectionService:
             source="url",
             result=result.value,
             confidence=confidence,
-            text_preview=norm.raw_text[:500],
-            text_length=len(plain_text),
-            word_count=len(plain_text.split()),
+            text_preview=preview,
+            text_length=text_length,
+            word_count=word_count,
             file_name=url,
             processing_time_ms=processing_time_ms,
         )
@@ -141,7 +209,7 @@ class URLDetectionService:
         detection_result = AIDetectionResultDTO(
             result=result,
             confidence=confidence,
-            text_preview=plain_text[:200],
+            text_preview=preview[:200],
             source=DetectionSource.URL,
             file_name=url,
             metadata={
@@ -149,8 +217,8 @@ class URLDetectionService:
                 "page_title": article.title,
                 "authors": article.authors,
                 "publish_date": article.publish_date,
-                "text_length": len(plain_text),
-                "word_count": len(plain_text.split()),
+                "text_length": text_length,
+                "word_count": word_count,
                 "processing_time_ms": processing_time_ms,
                 "language_requested": language.requested,
                 "language_effective": language.effective,
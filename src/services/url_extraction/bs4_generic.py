@@ -10,11 +10,7 @@ from src.services.url_extraction.constants import (
     GENERIC_REMOVE_SELECTORS,
     NOISY_TAG_NAMES,
 )
-
-
-def _collapse_ws(text: str) -> str:
-    lines = [ln.strip() for ln in text.splitlines()]
-    return "\n".join(ln for ln in lines if ln).strip()
+from src.services.url_extraction.text import collapse_ws
 
 
 def _extract_title(soup: BeautifulSoup) -> str | None:
@@ -78,4 +74,4 @@ def extract_generic_text(html: str, url: str) -> tuple[str, str | None]:
         return "", title
     _strip_inside_root(root)
     text = _collect_content_text(root)
-    return _collapse_ws(text), title
+    return collapse_ws(text), title
@@ -9,11 +9,7 @@ from src.services.url_extraction.constants import (
     NOISY_TAG_NAMES,
     WIKIPEDIA_REMOVE_SELECTORS,
 )
-
-
-def _collapse_ws(text: str) -> str:
-    lines = [ln.strip() for ln in text.splitlines()]
-    return "\n".join(ln for ln in lines if ln).strip()
+from src.services.url_extraction.text import collapse_ws
 
 
 def _extract_title(soup: BeautifulSoup) -> str | None:
@@ -72,4 +68,4 @@ def extract_wikipedia_text(html: str, url: str) -> tuple[str, str | None]:
         return "", title
     _strip_wikipedia_noise(root)
     text = _collect_content_text(root)
-    return _collapse_ws(text), title
+    return collapse_ws(text), title
@@ -5,6 +5,11 @@ from __future__ import annotations
 # Must match historical newspaper_service cap: single download safety valve.
 MAX_HTML_TEXT_LENGTH = 500_000
 
+# Downloaded pages kept in memory for conditional (ETag / Last-Modified)
+# revalidation, and how long an entry may live before it is refetched.
+HTML_CACHE_MAX_ENTRIES = 256
+HTML_CACHE_TTL_SECONDS = 15 * 24 * 3600
+
 # Stricter than ML pipeline minimum (50 chars) — rejects nav crumbs / summaries.
 MIN_EXTRACTION_CHARS = 200
 MIN_EXTRACTION_WORDS = 40
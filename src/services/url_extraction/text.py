@@ -0,0 +1,9 @@
+"""Plain-text post-processing shared by the BeautifulSoup extractors."""
+
+from __future__ import annotations
+
+
+def collapse_ws(text: str) -> str:
+    """Strip every line and drop blank ones (linear in the input length)."""
+    lines = [ln.strip() for ln in text.splitlines()]
+    return "\n".join(ln for ln in lines if ln).strip()
@@ -0,0 +1,19 @@
+"""Custom message filters for Telegram bot routers (aiogram 3)."""
+
+from __future__ import annotations
+
+from aiogram.filters import BaseFilter
+from aiogram.types import Message
+
+
+class NonCommandText(BaseFilter):
+    """Text messages that are not ``/commands``.
+
+    Same result as ``F.text & ~F.text.startswith("/")`` with one attribute
+    read and a character compare instead of a MagicFilter chain, which is
+    resolved for every incoming message.
+    """
+
+    async def __call__(self, message: Message) -> bool:
+        text = message.text
+        return bool(text) and text[0] != "/"
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import html
 from datetime import datetime
+from functools import lru_cache
 from typing import TYPE_CHECKING
 
 from src.core.billing import (
@@ -20,8 +21,14 @@ if TYPE_CHECKING:
 from src.telegram_bot.i18n import result_label, t, verdict_sentence
 
 
+# Every possible 10-cell bar (confidence is in [0, 1]).
+_BARS: tuple[str, ...] = tuple("█" * i + "░" * (10 - i) for i in range(11))
+
+
 def _confidence_bar(confidence: float, width: int = 10) -> str:
     filled = round(confidence * width)
+    if width == 10 and 0 <= filled <= 10:
+        return _BARS[filled]
     return "█" * filled + "░" * (width - filled)
 
 
@@ -35,37 +42,60 @@ def _plan_display_name(dto: UserLimitDTO, locale: str) -> str:
     return t("usage.plan_name_free", locale)
 
 
-def format_detection_result(r: "TelegramDetectionResult", locale: str) -> str:
-    """HTML-formatted detection reply."""
-    emoji = {
-        "ai_generated": "🤖",
-        "human_written": "✍️",
-        "uncertain": "🤔",
-    }.get(r.result.value, "❓")
-    short_label = result_label(r.result.value, locale)
-    verdict_long = verdict_sentence(r.result.value, locale)
-    bar = _confidence_bar(r.confidence)
-    pct = round(r.confidence * 100)
-
-    kind_key = {
-        "text": "result.kind_text",
-        "file": "result.kind_file",
-        "image": "result.kind_image",
-        "url": "result.kind_url",
-    }.get(r.detection_kind, "result.kind_text")
+_RESULT_EMOJI: dict[str, str] = {
+    "ai_generated": "🤖",
+    "human_written": "✍️",
+    "uncertain": "🤔",
+}
 
-    lines = [
+_KIND_KEYS: dict[str, str] = {
+    "text": "result.kind_text",
+    "file": "result.kind_file",
+    "image": "result.kind_image",
+    "url": "result.kind_url",
+}
+
+
+@lru_cache(maxsize=1024)
+def _detection_result_head(
+    result_value: str,
+    pct: int,
+    bar: str,
+    detection_kind: str,
+    language_requested: str,
+    language_effective: str,
+    locale: str,
+) -> tuple[str, ...]:
+    """Verdict/confidence/kind/language lines; few distinct combinations occur."""
+    emoji = _RESULT_EMOJI.get(result_value, "❓")
+    verdict_long = verdict_sentence(result_value, locale)
+    return (
         t("result.verdict_line", locale, emoji=emoji, verdict=html.escape(verdict_long)),
         t("result.confidence_plain", locale, pct=pct),
-        f"{html.escape(bar)}",
-        t(kind_key, locale),
+        html.escape(bar),
+        t(_KIND_KEYS.get(detection_kind, "result.kind_text"), locale),
         t(
             "result.ml_lang",
             locale,
-            req=html.escape(str(r.language_requested)),
-            eff=html.escape(str(r.language_effective)),
+            req=html.escape(language_requested),
+            eff=html.escape(language_effective),
         ),
-    ]
+    )
+
+
+def format_detection_result(r: "TelegramDetectionResult", locale: str) -> str:
+    """HTML-formatted detection reply."""
+    lines = list(
+        _detection_result_head(
+            r.result.value,
+            round(r.confidence * 100),
+            _confidence_bar(r.confidence),
+            r.detection_kind,
+            str(r.language_requested),
+            str(r.language_effective),
+            locale,
+        )
+    )
     if r.file_name:
         safe_name = html.escape(r.file_name)
         lines.append(f"{t('result.file_label', locale)}: <code>{safe_name}</code>")
@@ -165,18 +195,13 @@ def format_history_page(
             f"{html.escape(t('history.empty_body', locale))}"
         )
 
-    emoji_map = {
-        "ai_generated": "🤖",
-        "human_written": "✍️",
-        "uncertain": "🤔",
-    }
     title = html.escape(t("history.title", locale))
     lines = [f"<b>{title}</b>"]
     for i, rec in enumerate(records, start=offset + 1):
         preview = (rec.text_preview or "")[:80]
         if len(rec.text_preview or "") > 80:
             preview += "…"
-        em = emoji_map.get(rec.result, "❓")
+        em = _RESULT_EMOJI.get(rec.result, "❓")
         lbl = result_label(rec.result, locale)
         card = t(
             "history.card",
@@ -8,6 +8,17 @@ from src.telegram_bot.locales.catalog import MESSAGES, resolve_key
 
 SUPPORTED_UI_LOCALES: tuple[str, ...] = ("ru", "kk", "en")
 
+_RESULT_LABEL_KEYS: dict[str, str] = {
+    "ai_generated": "result.ai",
+    "human_written": "result.human",
+    "uncertain": "result.uncertain",
+}
+_VERDICT_KEYS: dict[str, str] = {
+    "ai_generated": "result.verdict_ai",
+    "human_written": "result.verdict_human",
+    "uncertain": "result.verdict_uncertain",
+}
+
 
 def t(key: str, locale: str, **kwargs: Any) -> str:
     loc = locale if locale in MESSAGES else "en"
@@ -20,18 +31,8 @@ def t(key: str, locale: str, **kwargs: Any) -> str:
 
 
 def result_label(result_value: str, locale: str) -> str:
-    mapping = {
-        "ai_generated": "result.ai",
-        "human_written": "result.human",
-        "uncertain": "result.uncertain",
-    }
-    return t(mapping.get(result_value, "result.uncertain"), locale)
+    return t(_RESULT_LABEL_KEYS.get(result_value, "result.uncertain"), locale)
 
 
 def verdict_sentence(result_value: str, locale: str) -> str:
-    mapping = {
-        "ai_generated": "result.verdict_ai",
-        "human_written": "result.verdict_human",
-        "uncertain": "result.verdict_uncertain",
-    }
-    return t(mapping.get(result_value, "result.verdict_uncertain"), locale)
+    return t(_VERDICT_KEYS.get(result_value, "result.verdict_uncertain"), locale)
@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-import os
+import asyncio
+from contextlib import asynccontextmanager
 
 from aiogram import Dispatcher, F
 from aiogram.filters import Command
@@ -14,6 +15,7 @@ from src.core.logging import get_logger
 from src.dtos.rate_limit_dto import RateLimitExceeded
 from src.services.ml_model_service import KazakhMlApiUnavailableError
 from src.telegram_bot.errors import i18n_key_for_exception, reply_error_message
+from src.telegram_bot.filters import NonCommandText
 from src.telegram_bot.formatting import format_detection_result
 from src.telegram_bot.fsm import AnalyzeFsm
 from src.telegram_bot.i18n import t
@@ -26,6 +28,9 @@ from src.telegram_bot.urlutil import validate_public_url
 logger = get_logger(__name__)
 
 SUPPORTED_EXTENSIONS: frozenset[str] = frozenset(gemini_config.ALLOWED_FILE_EXTENSIONS)
+_MAX_FILE_BYTES: int = gemini_config.MAX_FILE_SIZE_MB * 1024 * 1024
+# Telegram shows a chat action for ~5 s; refresh it a little sooner.
+_CHAT_ACTION_REFRESH_SECONDS = 4.0
 
 
 async def _route_reply_menu_action(
@@ -67,8 +72,7 @@ async def _route_reply_menu_action(
                 if not user:
                     await message.answer(t("error.not_linked", map_fallback_locale(lc)))
                     return True
-                await ctx.auth.ensure_telegram_ui_locale_from_client(user.id, lc)
-                user = await ctx.auth.get_user_by_id(user.id)
+                user = await ctx.auth.ensure_telegram_ui_locale_from_client(user, lc)
                 loc = effective_ui_locale(user, lc)
                 stats = await ctx.ai_repo.get_user_stats(user.id)
                 await message.answer(format_stats(stats, loc), parse_mode="HTML")
@@ -93,8 +97,7 @@ async def _route_reply_menu_action(
                 if not user:
                     await message.answer(t("error.not_linked", map_fallback_locale(lc)))
                     return True
-                await ctx.auth.ensure_telegram_ui_locale_from_client(user.id, lc)
-                user = await ctx.auth.get_user_by_id(user.id)
+                user = await ctx.auth.ensure_telegram_ui_locale_from_client(user, lc)
                 loc = effective_ui_locale(user, lc)
                 rows = await ctx.ai_repo.get_user_history(
                     user.id, limit=page_size + 1, offset=0
@@ -125,8 +128,7 @@ async def _route_reply_menu_action(
                 if not user:
                     await message.answer(t("error.not_linked", map_fallback_locale(lc)))
                     return True
-                await ctx.auth.ensure_telegram_ui_locale_from_client(user.id, lc)
-                user = await ctx.auth.get_user_by_id(user.id)
+                user = await ctx.auth.ensure_telegram_ui_locale_from_client(user, lc)
                 loc = effective_ui_locale(user, lc)
                 dto = await ctx.ai_detection.get_user_limits(user.id)
                 await message.answer(format_usage_card(dto, loc), parse_mode="HTML")
@@ -200,7 +202,7 @@ def register(dp: Dispatcher, svc) -> None:
             return
         await _run_url_detection(svc, message, url)
 
-    @dp.message(F.text & ~F.text.startswith("/"))
+    @dp.message(NonCommandText())
     async def handle_text_routing(message: Message, state: FSMContext) -> None:
         text = (message.text or "").strip()
         if await _route_reply_menu_action(svc, message, state, text):
@@ -224,25 +226,60 @@ def register(dp: Dispatcher, svc) -> None:
         await message.answer(t("unknown", lc))
 
 
+async def _send_chat_action(message: Message, action: str) -> None:
+    try:
+        await message.bot.send_chat_action(chat_id=message.chat.id, action=action)
+    except Exception as exc:
+        logger.warning("telegram_chat_action_failed", action=action, error=str(exc))
+
+
+async def _linked_user(ctx, message: Message, action: str):
+    """Look up the chat's linked user while the chat action goes out."""
+    user, _ = await asyncio.gather(
+        ctx.auth.get_user_by_telegram_chat_id(str(message.chat.id)),
+        _send_chat_action(message, action),
+    )
+    return user
+
+
+@asynccontextmanager
+async def _keep_chat_action(message: Message, action: str):
+    """
+    Re-send *action* while the block runs.
+
+    Telegram clears a chat action after about 5 seconds, and a detection
+    can run much longer. The first action is sent by :func:`_linked_user`.
+    """
+
+    async def refresh() -> None:
+        while True:
+            await asyncio.sleep(_CHAT_ACTION_REFRESH_SECONDS)
+            await _send_chat_action(message, action)
+
+    task = asyncio.create_task(refresh())
+    try:
+        yield
+    finally:
+        task.cancel()
+
+
 async def _run_url_detection(svc, message: Message, url: str) -> None:
-    chat_id = str(message.chat.id)
     lc = message.from_user.language_code if message.from_user else None
     try:
         async with svc._session_factory() as session:
             ctx = svc._build_ctx(session)
-            user = await ctx.auth.get_user_by_telegram_chat_id(chat_id)
+            user = await _linked_user(ctx, message, "typing")
             if not user:
                 await message.answer(t("error.not_linked", map_fallback_locale(lc)))
                 return
-            await ctx.auth.ensure_telegram_ui_locale_from_client(user.id, lc)
-            user = await ctx.auth.get_user_by_id(user.id)
+            user = await ctx.auth.ensure_telegram_ui_locale_from_client(user, lc)
             loc = effective_ui_locale(user, lc)
             lang = detection_language_context_from_user(user)
             await svc._rate_check(ctx, user.id)
-            await message.bot.send_chat_action(chat_id=message.chat.id, action="typing")
-            result = await ctx.telegram_detection.detect_url(
-                url=url, user_id=user.id, language=lang
-            )
+            async with _keep_chat_action(message, "typing"):
+                result = await ctx.telegram_detection.detect_url(
+                    url=url, user_id=user.id, language=lang
+                )
             await session.commit()
         await message.answer(
             format_detection_result(result, loc),
@@ -281,19 +318,18 @@ async def _handle_plain_text(svc, message: Message, text: str) -> None:
     try:
         async with svc._session_factory() as session:
             ctx = svc._build_ctx(session)
-            user = await ctx.auth.get_user_by_telegram_chat_id(chat_id)
+            user = await _linked_user(ctx, message, "typing")
             if not user:
                 await message.answer(t("error.not_linked", map_fallback_locale(lc)))
                 return
-            await ctx.auth.ensure_telegram_ui_locale_from_client(user.id, lc)
-            user = await ctx.auth.get_user_by_id(user.id)
+            user = await ctx.auth.ensure_telegram_ui_locale_from_client(user, lc)
             loc = effective_ui_locale(user, lc)
             lang = detection_language_context_from_user(user)
             await svc._rate_check(ctx, user.id)
-            await message.bot.send_chat_action(chat_id=message.chat.id, action="typing")
-            result = await ctx.telegram_detection.detect_text(
-                text=text, user_id=user.id, language=lang
-            )
+            async with _keep_chat_action(message, "typing"):
+                result = await ctx.telegram_detection.detect_text(
+                    text=text, user_id=user.id, language=lang
+                )
             await session.commit()
         await message.answer(
             format_detection_result(result, loc),
@@ -321,18 +357,18 @@ async def _handle_plain_text(svc, message: Message, text: str) -> None:
 
 
 async def _handle_document(svc, message: Message) -> None:
-    chat_id = str(message.chat.id)
     lc = message.from_user.language_code if message.from_user else None
     doc: Document = message.document
     file_name = doc.file_name or "document"
-    ext = os.path.splitext(file_name)[1].lower()
+    # Same result as os.path.splitext (leading dots don't start a suffix)
+    stem, dot, suffix = file_name.rpartition(".")
+    ext = f".{suffix.lower()}" if dot and stem.strip(".") else ""
 
     loc = await locale_for_chat(svc, message)
     if ext not in SUPPORTED_EXTENSIONS:
         await message.answer(t("error.file.unsupported_type", loc, ext=ext or "—"))
         return
-    max_bytes = gemini_config.MAX_FILE_SIZE_MB * 1024 * 1024
-    if doc.file_size and doc.file_size > max_bytes:
+    if doc.file_size and doc.file_size > _MAX_FILE_BYTES:
         await message.answer(
             t(
                 "error.file.too_large",
@@ -346,27 +382,24 @@ async def _handle_document(svc, message: Message) -> None:
     try:
         async with svc._session_factory() as session:
             ctx = svc._build_ctx(session)
-            user = await ctx.auth.get_user_by_telegram_chat_id(chat_id)
+            user = await _linked_user(ctx, message, "upload_document")
             if not user:
                 await message.answer(t("error.not_linked", map_fallback_locale(lc)))
                 return
-            await ctx.auth.ensure_telegram_ui_locale_from_client(user.id, lc)
-            user = await ctx.auth.get_user_by_id(user.id)
+            user = await ctx.auth.ensure_telegram_ui_locale_from_client(user, lc)
             loc = effective_ui_locale(user, lc)
             lang = detection_language_context_from_user(user)
             await svc._rate_check(ctx, user.id)
-            await message.bot.send_chat_action(
-                chat_id=message.chat.id, action="upload_document"
-            )
-            file_bytes = await svc._download_bytes(doc.file_id)
-            content_type = doc.mime_type or "application/octet-stream"
-            result = await ctx.telegram_detection.detect_file(
-                file_bytes=file_bytes,
-                file_name=file_name,
-                content_type=content_type,
-                user_id=user.id,
-                language=lang,
-            )
+            async with _keep_chat_action(message, "upload_document"):
+                file_bytes = await svc._download_bytes_parallel(doc.file_id, doc.file_size)
+                content_type = doc.mime_type or "application/octet-stream"
+                result = await ctx.telegram_detection.detect_file(
+                    file_bytes=file_bytes,
+                    file_name=file_name,
+                    content_type=content_type,
+                    user_id=user.id,
+                    language=lang,
+                )
             await session.commit()
         await message.answer(
             format_detection_result(result, loc),
@@ -392,32 +425,28 @@ async def _handle_document(svc, message: Message) -> None:
 
 
 async def _handle_photo(svc, message: Message) -> None:
-    chat_id = str(message.chat.id)
     lc = message.from_user.language_code if message.from_user else None
     photo: PhotoSize = message.photo[-1]
     try:
         async with svc._session_factory() as session:
             ctx = svc._build_ctx(session)
-            user = await ctx.auth.get_user_by_telegram_chat_id(chat_id)
+            user = await _linked_user(ctx, message, "upload_photo")
             if not user:
                 await message.answer(t("error.not_linked", map_fallback_locale(lc)))
                 return
-            await ctx.auth.ensure_telegram_ui_locale_from_client(user.id, lc)
-            user = await ctx.auth.get_user_by_id(user.id)
+            user = await ctx.auth.ensure_telegram_ui_locale_from_client(user, lc)
             loc = effective_ui_locale(user, lc)
             lang = detection_language_context_from_user(user)
             await svc._rate_check(ctx, user.id)
-            await message.bot.send_chat_action(
-                chat_id=message.chat.id, action="upload_photo"
-            )
-            file_bytes = await svc._download_bytes(photo.file_id)
-            file_name = f"photo_{photo.file_unique_id}.jpg"
-            result = await ctx.telegram_detection.detect_image(
-                image_bytes=file_bytes,
-                file_name=file_name,
-                user_id=user.id,
-                language=lang,
-            )
+            async with _keep_chat_action(message, "upload_photo"):
+                file_bytes = await svc._download_bytes(photo.file_id)
+                file_name = f"photo_{photo.file_unique_id}.jpg"
+                result = await ctx.telegram_detection.detect_image(
+                    image_bytes=file_bytes,
+                    file_name=file_name,
+                    user_id=user.id,
+                    language=lang,
+                )
             await session.commit()
         await message.answer(
             format_detection_result(result, loc),
@@ -29,8 +29,7 @@ async def answer_premium(svc, message: Message) -> None:
             if not user:
                 await message.answer(t("error.not_linked", map_fallback_locale(lc)))
                 return
-            await ctx.auth.ensure_telegram_ui_locale_from_client(user.id, lc)
-            user = await ctx.auth.get_user_by_id(user.id)
+            user = await ctx.auth.ensure_telegram_ui_locale_from_client(user, lc)
             loc = effective_ui_locale(user, lc)
             limits = await ctx.ai_detection.get_user_limits(user.id)
             upgrade_url: str | None = None
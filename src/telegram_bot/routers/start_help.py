@@ -18,6 +18,8 @@ from src.telegram_bot.preferences import effective_ui_locale
 
 logger = get_logger(__name__)
 
+_SUPPORTED_FORMATS: str = ", ".join(sorted(gemini_config.ALLOWED_FILE_EXTENSIONS))
+
 
 async def answer_help(svc, message: Message) -> None:
     chat_id = str(message.chat.id)
@@ -85,13 +87,11 @@ def register(dp: Dispatcher, svc) -> None:
                     return
 
                 await repo.connect_telegram_account(user.id, chat_id)
-                await repo.ensure_telegram_ui_locale_from_client(user.id, lc)
-                user = await repo.get_user_by_id(user.id)
+                user = await repo.ensure_telegram_ui_locale_from_client(user, lc)
                 await session.commit()
                 loc = effective_ui_locale(user, lc) if user else map_fallback_locale(lc)
-                supported = ", ".join(sorted(gemini_config.ALLOWED_FILE_EXTENSIONS))
                 await message.answer(
-                    t("start.success", loc, formats=supported)
+                    t("start.success", loc, formats=_SUPPORTED_FORMATS)
                     + "\n\n"
                     + t("start.linked_hint", loc),
                     reply_markup=main_menu_reply(loc),
@@ -30,8 +30,7 @@ async def _history_payload(
         user = await ctx.auth.get_user_by_telegram_chat_id(chat_id)
         if not user:
             return None, None, map_fallback_locale(lc)
-        await ctx.auth.ensure_telegram_ui_locale_from_client(user.id, lc)
-        user = await ctx.auth.get_user_by_id(user.id)
+        user = await ctx.auth.ensure_telegram_ui_locale_from_client(user, lc)
         loc = effective_ui_locale(user, lc)
         rows = await ctx.ai_repo.get_user_history(
             user.id, limit=PAGE_SIZE + 1, offset=offset
@@ -59,8 +58,7 @@ def register(dp: Dispatcher, svc) -> None:
                 if not user:
                     await message.answer(t("error.not_linked", map_fallback_locale(lc)))
                     return
-                await ctx.auth.ensure_telegram_ui_locale_from_client(user.id, lc)
-                user = await ctx.auth.get_user_by_id(user.id)
+                user = await ctx.auth.ensure_telegram_ui_locale_from_client(user, lc)
                 loc = effective_ui_locale(user, lc)
                 dto = await ctx.ai_detection.get_user_limits(user.id)
                 await message.answer(format_usage_card(dto, loc), parse_mode="HTML")
@@ -80,8 +78,7 @@ def register(dp: Dispatcher, svc) -> None:
                 if not user:
                     await message.answer(t("error.not_linked", map_fallback_locale(lc)))
                     return
-                await ctx.auth.ensure_telegram_ui_locale_from_client(user.id, lc)
-                user = await ctx.auth.get_user_by_id(user.id)
+                user = await ctx.auth.ensure_telegram_ui_locale_from_client(user, lc)
                 loc = effective_ui_locale(user, lc)
                 stats = await ctx.ai_repo.get_user_stats(user.id)
                 await message.answer(format_stats(stats, loc), parse_mode="HTML")
@@ -0,0 +1,106 @@
+"""
+Outgoing Bot API throttling — keep message sends under Telegram's flood limits.
+
+Telegram allows roughly 30 messages per second per bot and about one per
+second per chat; going over earns 429 / FloodWait responses that stall
+the sender far longer than waiting would have. The middleware holds each
+message-producing call until both the global and the per-chat token
+bucket have a token.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import Any
+
+from aiogram import Bot
+from aiogram.client.session.middlewares.base import (
+    BaseRequestMiddleware,
+    NextRequestMiddlewareType,
+)
+from aiogram.methods import AnswerCallbackQuery, SendChatAction, TelegramMethod
+from aiogram.methods.base import Response, TelegramType
+
+# Calls that don't post or edit a message in a chat are not throttled.
+_UNTHROTTLED = (SendChatAction, AnswerCallbackQuery)
+
+# Idle per-chat buckets are dropped once this many chats are tracked.
+_MAX_CHAT_BUCKETS = 4096
+
+
+class TokenBucket:
+    """Async token bucket: *rate* tokens per second, bursts up to *capacity*."""
+
+    def __init__(self, rate: float, capacity: float):
+        self._rate = rate
+        self._capacity = max(1.0, capacity)
+        self._tokens = self._capacity
+        self._updated = time.monotonic()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(
+            self._capacity, self._tokens + (now - self._updated) * self._rate
+        )
+        self._updated = now
+
+    @property
+    def idle(self) -> bool:
+        """True when the bucket is full, i.e. nobody has used it lately."""
+        self._refill()
+        return self._tokens >= self._capacity
+
+    async def acquire(self) -> None:
+        """Wait until a token is available and take it."""
+        while True:
+            self._refill()
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return
+            await asyncio.sleep((1 - self._tokens) / self._rate)
+
+
+class OutgoingThrottleMiddleware(BaseRequestMiddleware):
+    """Bot session middleware applying a global and a per-chat token bucket."""
+
+    def __init__(
+        self,
+        global_per_second: float = 30,
+        chat_per_second: float = 1,
+        chat_burst: float = 3,
+    ):
+        """
+        Initialize throttle.
+
+        Args:
+            global_per_second: Messages per second across all chats
+            chat_per_second: Sustained messages per second to one chat
+            chat_burst: Messages one chat may receive back-to-back
+        """
+        self._global = TokenBucket(global_per_second, global_per_second)
+        self._chat_rate = chat_per_second
+        self._chat_burst = chat_burst
+        self._chats: dict[Any, TokenBucket] = {}
+
+    def _chat_bucket(self, chat_id: Any) -> TokenBucket:
+        bucket = self._chats.get(chat_id)
+        if bucket is None:
+            if len(self._chats) >= _MAX_CHAT_BUCKETS:
+                self._chats = {k: b for k, b in self._chats.items() if not b.idle}
+            bucket = self._chats[chat_id] = TokenBucket(
+                self._chat_rate, self._chat_burst
+            )
+        return bucket
+
+    async def __call__(
+        self,
+        make_request: NextRequestMiddlewareType[TelegramType],
+        bot: Bot,
+        method: TelegramMethod[TelegramType],
+    ) -> Response[TelegramType]:
+        chat_id = getattr(method, "chat_id", None)
+        if chat_id is not None and not isinstance(method, _UNTHROTTLED):
+            await self._chat_bucket(chat_id).acquire()
+            await self._global.acquire()
+        return await make_request(bot, method)
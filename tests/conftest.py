@@ -0,0 +1,15 @@
+"""
+Shared fixtures for the unit tests.
+"""
+
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.infrastructure.redis_client import RedisClient
+
+
+@pytest.fixture
+def mock_redis_client():
+    """Create mock Redis client."""
+    return AsyncMock(spec=RedisClient)
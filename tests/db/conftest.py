@@ -0,0 +1,23 @@
+"""
+Shared fixtures for the database connectivity tests.
+"""
+
+import pytest_asyncio
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from src.core.config import Config
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def shared_engine():
+    """One pooled engine for the whole session instead of one per test."""
+    config = Config()
+    engine = create_async_engine(
+        config.db_url,
+        echo=False,
+        pool_size=5,
+        pool_pre_ping=True,
+        pool_recycle=3600,
+    )
+    yield engine
+    await engine.dispose()
@@ -1,84 +1,52 @@
 import pytest
 import asyncio
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 from sqlalchemy import text
 
-from src.db.database import AsyncSessionLocal
+from src.db.database import check_db_connection
 from src.core.config import Config
 
 
 class TestDatabaseConnection:
     """Test database connectivity and basic operations."""
 
-    @pytest.mark.asyncio
-    async def test_database_connection_with_engine(self):
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_database_connection_with_engine(self, shared_engine):
         """Test if we can connect to database using the engine."""
-        config = Config()
-        test_engine = create_async_engine(
-            config.db_url,
-            echo=False,
-            pool_pre_ping=True,
-            pool_recycle=3600,
-        )
-        
         try:
-            async with test_engine.begin() as conn:
+            async with shared_engine.begin() as conn:
                 result = await conn.execute(text("SELECT 1"))
                 row = result.fetchone()
                 assert row[0] == 1
         except Exception as e:
             pytest.fail(f"Database connection failed: {e}")
-        finally:
-            await test_engine.dispose()
 
-    @pytest.mark.asyncio
-    async def test_database_connection_with_check_function(self):
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_database_connection_with_check_function(self, shared_engine):
         """Test using the built-in check_db_connection function."""
-        config = Config()
-        test_engine = create_async_engine(config.db_url)
-        
-        try:
-            async with test_engine.begin() as conn:
-                await conn.execute(text("SELECT 1"))
-            connection_successful = True
-        except Exception:
-            connection_successful = False
-        finally:
-            await test_engine.dispose()
-            
+        connection_successful = await check_db_connection(shared_engine)
         assert connection_successful is True, "Database connection check failed"
 
-    @pytest.mark.asyncio
-    async def test_session_creation(self):
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_session_creation(self, shared_engine):
         """Test if we can create and use database sessions."""
-        config = Config()
-        test_engine = create_async_engine(config.db_url)
-        
-        from sqlalchemy.ext.asyncio import async_sessionmaker
         TestSessionLocal = async_sessionmaker(
-            test_engine,
+            shared_engine,
             class_=AsyncSession,
             expire_on_commit=False,
         )
         
-        try:
-            async with TestSessionLocal() as session:
-                result = await session.execute(text("SELECT 1 as test"))
-                row = result.fetchone()
-                assert row[0] == 1
-        finally:
-            await test_engine.dispose()
+        async with TestSessionLocal() as session:
+            result = await session.execute(text("SELECT 1 as test"))
+            row = result.fetchone()
+            assert row[0] == 1
 
-    @pytest.mark.asyncio
-    async def test_get_db_dependency(self):
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_get_db_dependency(self, shared_engine):
         """Test the FastAPI dependency function for database sessions."""
-        # Test the FastAPI dependency pattern with a fresh engine
-        config = Config()
-        test_engine = create_async_engine(config.db_url)
-        
-        from sqlalchemy.ext.asyncio import async_sessionmaker
+        # Test the FastAPI dependency pattern on the shared engine
         TestSessionLocal = async_sessionmaker(
-            test_engine,
+            shared_engine,
             class_=AsyncSession,
             expire_on_commit=False,
         )
@@ -107,9 +75,9 @@ class TestDatabaseConnection:
         except StopAsyncIteration:
             pytest.fail("Database session generator failed")
         finally:
-            await test_engine.dispose()
+            await db_generator.aclose()
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     async def test_database_config(self):
         """Test if database configuration is properly loaded."""
         config = Config()
@@ -127,10 +95,10 @@ class TestDatabaseConnection:
         assert config.DB_HOST in db_url, "Host not in database URL"
         assert config.DB_NAME in db_url, "Database name not in database URL"
 
-    @pytest.mark.asyncio
-    async def test_transaction_rollback(self):
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_transaction_rollback(self, shared_engine):
         """Test if transaction rollback works properly."""
-        async with AsyncSessionLocal() as session:
+        async with AsyncSession(shared_engine) as session:
             try:
                 # Start a transaction
                 await session.execute(text("SELECT 1"))
@@ -147,18 +115,14 @@ class TestDatabaseConnection:
                 row = result.fetchone()
                 assert row[0] == 1
 
-    @pytest.mark.asyncio
-    async def test_multiple_concurrent_connections(self):
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_multiple_concurrent_connections(self, shared_engine):
         """Test if multiple concurrent connections work."""
         async def query_database():
-            config = Config()
-            test_engine = create_async_engine(config.db_url)
-            try:
-                async with test_engine.begin() as conn:
-                    result = await conn.execute(text("SELECT 1 as test"))
-                    return result.fetchone()[0]
-            finally:
-                await test_engine.dispose()
+            # Each task checks out its own connection from the shared pool
+            async with shared_engine.connect() as conn:
+                result = await conn.execute(text("SELECT 1 as test"))
+                return result.fetchone()[0]
 
         # Run multiple concurrent queries
         tasks = [query_database() for _ in range(3)]  # Reduced from 5 to 3
@@ -178,17 +142,13 @@ class TestDatabaseConnection:
         assert "/" in db_url, "URL should contain database name"
 
 
-@pytest.mark.asyncio
-async def test_quick_connection_check():
+@pytest.mark.asyncio(loop_scope="session")
+async def test_quick_connection_check(shared_engine):
     """Quick standalone test for database connectivity."""
-    config = Config()
-    test_engine = create_async_engine(config.db_url)
     try:
-        async with test_engine.begin() as conn:
+        async with shared_engine.begin() as conn:
             await conn.execute(text("SELECT NOW()"))
         print("✅ Database connection successful!")
     except Exception as e:
         print(f"❌ Database connection failed: {e}")
-        raise
-    finally:
-        await test_engine.dispose()
\ No newline at end of file
+        raise
\ No newline at end of file
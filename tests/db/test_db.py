@@ -12,28 +12,23 @@ import pytest
 # Add the src directory to the Python path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
-@pytest.mark.asyncio
-async def test_db_connection():
-    """Quick database connection test."""
+async def _check_database(engine) -> bool:
+    """Run the connectivity checks against *engine*, printing progress."""
     try:
-        from src.db.database import check_db_connection, engine
         from sqlalchemy import text
         
         print("🔄 Testing database connection...")
         
-        is_connected = await check_db_connection()
-        if is_connected:
-            print("✅ Database connection check passed!")
-        else:
+        # One round-trip: liveness and a real query in the same statement
+        async with engine.connect() as conn:
+            result = await conn.execute(
+                text("SELECT 1 AS alive, 'Hello Database!' AS message, NOW() AS timestamp")
+            )
+            row = result.fetchone()
+        if row.alive != 1:
             print("❌ Database connection check failed!")
             return False
-            
-        # Test 2: Direct query
-        print("🔄 Testing direct query...")
-        async with engine.begin() as conn:
-            result = await conn.execute(text("SELECT 'Hello Database!' as message, NOW() as timestamp"))
-            row = result.fetchone()
-            print(f"✅ Query successful: {row.message} at {row.timestamp}")
+        print(f"✅ Query successful: {row.message} at {row.timestamp}")
             
         print("🎉 All database tests passed!")
         return True
@@ -48,6 +43,24 @@ async def test_db_connection():
         print("   DB_NAME=your_database")
         return False
 
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_db_connection(shared_engine):
+    """Quick database connection test."""
+    assert await _check_database(shared_engine)
+
+
+async def _main() -> bool:
+    from sqlalchemy.ext.asyncio import create_async_engine
+    from src.core.config import Config
+
+    engine = create_async_engine(Config().db_url)
+    try:
+        return await _check_database(engine)
+    finally:
+        await engine.dispose()
+
+
 if __name__ == "__main__":
-    success = asyncio.run(test_db_connection())
+    success = asyncio.run(_main())
     sys.exit(0 if success else 1)
\ No newline at end of file
@@ -0,0 +1,43 @@
+"""
+Tests for the shared URL article cache.
+"""
+
+import pytest
+
+from src.dtos.ai_detection_dto import NewspaperFetchResultDTO
+from src.repositories.article_cache_repository import ArticleCacheRepository
+
+
+class TestArticleCacheRepository:
+    """Test the shared URL article cache."""
+
+    @pytest.mark.asyncio
+    async def test_round_trips_article(self, mock_redis_client):
+        """A stored article decodes back to an equal DTO."""
+        cache = ArticleCacheRepository(mock_redis_client)
+        article = NewspaperFetchResultDTO(
+            text="Body", url="https://example.com/a", authors=["A. Author"]
+        )
+
+        await cache.set(article, article.url)
+        stored = mock_redis_client.set.call_args.args[1]
+        mock_redis_client.get.return_value = stored
+
+        assert await cache.get(article.url) == article
+
+    @pytest.mark.asyncio
+    async def test_lock_is_single_flight(self, mock_redis_client):
+        """Only the first caller gets a token; release is a compare-and-delete."""
+        cache = ArticleCacheRepository(mock_redis_client)
+        mock_redis_client.set.side_effect = [True, False]
+
+        token = await cache.acquire_lock("https://example.com/a")
+        assert token is not None
+        assert await cache.acquire_lock("https://example.com/a") is None
+        assert mock_redis_client.set.call_args.kwargs["nx"] is True
+
+        await cache.release_lock("https://example.com/a", token)
+        call = mock_redis_client.run_script.call_args
+        assert call.kwargs["keys"] == [cache._lock_key("https://example.com/a")]
+        assert call.kwargs["args"] == [token]
+        mock_redis_client.delete.assert_not_called()
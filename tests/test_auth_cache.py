@@ -0,0 +1,72 @@
+"""
+Tests for the bearer-token authentication cache.
+"""
+
+import time
+from datetime import datetime, timezone
+
+from fastapi import HTTPException
+
+from src.dtos.user_dto import AuthenticatedUserDTO
+from src.services.shared.auth_cache import AuthCache
+
+
+def _user(user_id: str = "user-1") -> AuthenticatedUserDTO:
+    now = datetime.now(timezone.utc)
+    return AuthenticatedUserDTO(
+        id=user_id,
+        username="alice",
+        email="alice@example.com",
+        is_active=True,
+        is_verified=True,
+        created_at=now,
+        updated_at=now,
+    )
+
+
+def test_hit_until_invalidated():
+    cache = AuthCache(maxsize=10, ttl_seconds=60, negative_ttl_seconds=5)
+    user = _user()
+
+    cache.put("token-a", user, time.time() + 600)
+    assert cache.get("token-a") is user
+    assert cache.get("token-b") is None
+
+    cache.invalidate_user("user-1")
+    assert cache.get("token-a") is None
+
+
+def test_never_outlives_token_exp():
+    cache = AuthCache(maxsize=10, ttl_seconds=60, negative_ttl_seconds=5)
+
+    cache.put("expired", _user(), time.time() - 1)
+
+    assert cache.get("expired") is None
+
+
+def test_rejections_and_lru_eviction():
+    cache = AuthCache(maxsize=2, ttl_seconds=60, negative_ttl_seconds=5)
+    rejection = HTTPException(status_code=401, detail="User not found")
+
+    cache.put_rejection("bad", rejection)
+    cache.put("t1", _user("u1"), None)
+    cache.put("t2", _user("u2"), None)
+
+    assert cache.get("bad") is None
+    assert cache.get("t1") is not None
+
+
+def test_rejection_raised_as_fresh_exception():
+    cache = AuthCache(maxsize=10, ttl_seconds=60, negative_ttl_seconds=5)
+    headers = {"WWW-Authenticate": "Bearer"}
+    cache.put_rejection("bad", HTTPException(401, "Invalid token", headers))
+    headers["X-Mutated"] = "1"
+
+    first = cache.get("bad").to_exception()
+    second = cache.get("bad").to_exception()
+
+    assert first is not second
+    assert (first.status_code, first.detail) == (401, "Invalid token")
+    assert first.headers == {"WWW-Authenticate": "Bearer"}
+    first.headers["X-Other"] = "1"
+    assert second.headers == {"WWW-Authenticate": "Bearer"}
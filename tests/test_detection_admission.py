@@ -0,0 +1,45 @@
+"""
+Tests for detection admission control.
+"""
+
+import asyncio
+
+import pytest
+
+from src.services.shared.admission import DetectionAdmission
+
+
+@pytest.mark.asyncio
+async def test_rejects_user_over_per_user_cap():
+    admission = DetectionAdmission(max_concurrent=4, max_per_user=1)
+
+    async with admission.admit("user-1"):
+        with pytest.raises(ValueError, match="limit exceeded"):
+            async with admission.admit("user-1"):
+                pass
+        # Other users are unaffected
+        async with admission.admit("user-2"):
+            pass
+
+    # Slot is released once the first detection finishes
+    async with admission.admit("user-1"):
+        pass
+
+
+@pytest.mark.asyncio
+async def test_global_cap_queues_instead_of_rejecting():
+    admission = DetectionAdmission(max_concurrent=1, max_per_user=2)
+    running = 0
+    peak = 0
+
+    async def work(user_id: str) -> None:
+        nonlocal running, peak
+        async with admission.admit(user_id):
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+
+    await asyncio.gather(work("a"), work("b"), work("c"))
+
+    assert peak == 1
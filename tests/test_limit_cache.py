@@ -0,0 +1,33 @@
+"""
+Tests for the cached over-quota verdicts.
+"""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from src.repositories.limit_cache_repository import LimitCacheRepository
+
+
+class TestLimitCacheRepository:
+    """Test cached over-quota verdicts."""
+
+    @pytest.mark.asyncio
+    async def test_mark_exhausted_caps_ttl(self, mock_redis_client):
+        """TTL never exceeds LIMIT_CACHE_TTL_SECONDS even for a distant reset."""
+        cache = LimitCacheRepository(mock_redis_client)
+        reset_at = datetime.now(timezone.utc) + timedelta(days=1)
+
+        await cache.mark_exhausted("test_user", "Request limit exceeded.", reset_at)
+
+        mock_redis_client.set.assert_called_once_with(
+            "user_limit:exhausted:test_user", "Request limit exceeded.", expire=60
+        )
+
+    @pytest.mark.asyncio
+    async def test_get_exhausted_treats_redis_error_as_miss(self, mock_redis_client):
+        """A Redis failure falls through to the database check."""
+        mock_redis_client.get.side_effect = ConnectionError("redis down")
+        cache = LimitCacheRepository(mock_redis_client)
+
+        assert await cache.get_exhausted("test_user") is None
@@ -0,0 +1,22 @@
+"""Tests for the structlog JSON serializer."""
+
+import json
+
+from structlog.processors import JSONRenderer
+
+from src.core.logging import _dumps
+
+
+def test_dumps_uses_fast_path_for_plain_values():
+    assert json.loads(_dumps({"event": "x", "n": 1})) == {"event": "x", "n": 1}
+
+
+def test_renderer_handles_lone_surrogate_and_non_utf8_bytes():
+    renderer = JSONRenderer(serializer=_dumps)
+
+    rendered = renderer(None, "info", {"event": "bad", "text": "a\ud800", "raw": b"\xff\xfe"})
+
+    decoded = json.loads(rendered)
+    assert decoded["event"] == "bad"
+    assert decoded["text"] == "a\ud800"
+    assert decoded["raw"] == repr(b"\xff\xfe")
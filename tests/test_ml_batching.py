@@ -0,0 +1,80 @@
+"""
+Tests for the ML micro-batching dispatcher.
+"""
+
+import asyncio
+
+import pytest
+
+from src.services.ml_batching import MlBatchingDispatcher
+
+
+@pytest.mark.asyncio
+async def test_concurrent_submits_share_one_batch():
+    calls: list[list[str]] = []
+
+    async def batch_fn(texts):
+        calls.append(list(texts))
+        return [t.upper() for t in texts]
+
+    dispatcher = MlBatchingDispatcher(batch_fn, max_batch_size=8, window_ms=20)
+    try:
+        results = await asyncio.gather(
+            dispatcher.submit("a"), dispatcher.submit("b"), dispatcher.submit("a")
+        )
+    finally:
+        await dispatcher.close()
+
+    assert results == ["A", "B", "A"]
+    assert calls == [["a", "b"]]
+
+
+@pytest.mark.asyncio
+async def test_batch_error_propagates_to_every_caller():
+    async def batch_fn(texts):
+        raise RuntimeError("ml down")
+
+    dispatcher = MlBatchingDispatcher(batch_fn, window_ms=5)
+    try:
+        results = await asyncio.gather(
+            dispatcher.submit("a"), dispatcher.submit("b"), return_exceptions=True
+        )
+    finally:
+        await dispatcher.close()
+
+    assert all(isinstance(r, RuntimeError) for r in results)
+
+
+@pytest.mark.asyncio
+async def test_short_batch_result_fails_batch_but_worker_survives():
+    calls = 0
+
+    async def batch_fn(texts):
+        nonlocal calls
+        calls += 1
+        return [] if calls == 1 else [t.upper() for t in texts]
+
+    dispatcher = MlBatchingDispatcher(batch_fn, window_ms=5)
+    try:
+        with pytest.raises(RuntimeError):
+            await dispatcher.submit("a")
+        assert await asyncio.wait_for(dispatcher.submit("b"), 1) == "B"
+    finally:
+        await dispatcher.close()
+
+
+@pytest.mark.asyncio
+async def test_per_item_exception_only_fails_its_caller():
+    async def batch_fn(texts):
+        return [ValueError(t) if t == "bad" else t.upper() for t in texts]
+
+    dispatcher = MlBatchingDispatcher(batch_fn, window_ms=20)
+    try:
+        good, bad = await asyncio.gather(
+            dispatcher.submit("good"), dispatcher.submit("bad"), return_exceptions=True
+        )
+    finally:
+        await dispatcher.close()
+
+    assert good == "GOOD"
+    assert isinstance(bad, ValueError)
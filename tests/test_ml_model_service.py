@@ -0,0 +1,180 @@
+"""
+Tests for the ML model service client.
+"""
+
+from unittest.mock import AsyncMock
+
+import httpx
+import pytest
+
+from src.dtos.ai_detection_dto import DetectionResult
+from src.services.ml_model_service import (
+    AIDetectionModelService,
+    _aggregate_windows,
+    _split_windows,
+)
+
+
+@pytest.fixture
+async def model_service():
+    service = AIDetectionModelService()
+    yield service
+    await service.close()
+
+
+@pytest.mark.asyncio
+async def test_submit_reuses_cached_result(model_service):
+    model_service.detect_ai_text = AsyncMock(
+        return_value=(DetectionResult.AI_GENERATED, 0.91)
+    )
+
+    first = await model_service.submit("same text " * 10, language="ru")
+    second = await model_service.submit("same text " * 10, language="ru")
+
+    assert first == second == (DetectionResult.AI_GENERATED, 0.91)
+    model_service.detect_ai_text.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_submit_does_not_cache_fallback_result(model_service):
+    model_service.detect_ai_text = AsyncMock(
+        return_value=(DetectionResult.UNCERTAIN, 0.0)
+    )
+
+    await model_service.submit("flaky text " * 10, language="ru")
+    await model_service.submit("flaky text " * 10, language="ru")
+
+    assert model_service.detect_ai_text.await_count == 2
+
+
+def test_split_windows_covers_text_with_overlap():
+    text = " ".join(f"w{i}" for i in range(300))
+
+    windows = _split_windows(text, size=200, overlap=20)
+
+    assert windows[0] == text[: len(windows[0])]
+    assert windows[-1].endswith("w299")
+    assert all(len(w) <= 200 for w in windows)
+    assert len(windows) > 1
+
+
+def test_split_windows_advances_when_cut_lands_on_overlap_boundary():
+    # The only space sits exactly at start + size // 2 == start + overlap
+    text = "a" * 150 + " " + "b" * 400
+
+    windows = _split_windows(text, size=300, overlap=200)
+
+    assert windows[0] == text[:300]
+    assert text.endswith(windows[-1])
+    assert len(windows) == 3
+
+
+def test_aggregate_windows_weights_by_length():
+    outcomes = [
+        (DetectionResult.AI_GENERATED, 0.9),
+        (DetectionResult.HUMAN_WRITTEN, 0.8),
+        (DetectionResult.AI_GENERATED, 0.7),
+    ]
+
+    assert _aggregate_windows(outcomes, [100, 150, 100]) == (
+        DetectionResult.AI_GENERATED,
+        0.8,
+    )
+    assert _aggregate_windows(outcomes[:2], [100, 100])[0] == DetectionResult.UNCERTAIN
+
+
+@pytest.mark.asyncio
+async def test_batch_falls_back_to_single_calls_without_batch_endpoint(
+    model_service, monkeypatch
+):
+    monkeypatch.setattr("src.services.ml_model_service.ML_API_BATCH_PATH", "/batch")
+    paths: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        paths.append(request.url.path)
+        if request.url.path == "/batch":
+            return httpx.Response(404)
+        return httpx.Response(200, json={"label": "ai", "ai_probability": 0.9})
+
+    await model_service._clients["ru"].aclose()
+    model_service._clients["ru"] = httpx.AsyncClient(
+        base_url="http://ml", transport=httpx.MockTransport(handler)
+    )
+
+    first = await model_service.detect_ai_text_batch(["a", "b"], language="ru")
+    second = await model_service.detect_ai_text_batch(["c"], language="ru")
+
+    assert first == [(DetectionResult.AI_GENERATED, 0.9)] * 2
+    assert second == [(DetectionResult.AI_GENERATED, 0.9)]
+    assert paths.count("/batch") == 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "batch_response",
+    [httpx.Response(503), httpx.Response(200, content=b"not json")],
+)
+async def test_batch_failure_falls_back_without_disabling_endpoint(
+    model_service, monkeypatch, batch_response
+):
+    monkeypatch.setattr("src.services.ml_model_service.ML_API_BATCH_PATH", "/batch")
+    paths: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        paths.append(request.url.path)
+        if request.url.path == "/batch":
+            return batch_response
+        return httpx.Response(200, json={"label": "ai", "ai_probability": 0.9})
+
+    await model_service._clients["ru"].aclose()
+    model_service._clients["ru"] = httpx.AsyncClient(
+        base_url="http://ml", transport=httpx.MockTransport(handler)
+    )
+
+    first = await model_service.detect_ai_text_batch(["a", "b"], language="ru")
+    await model_service.detect_ai_text_batch(["c"], language="ru")
+
+    assert first == [(DetectionResult.AI_GENERATED, 0.9)] * 2
+    assert paths.count("/batch") == 2
+    assert "ru" not in model_service._batch_unsupported
+
+
+def test_parse_detection_reads_aliased_fields(model_service):
+    parse = model_service._parse_detection
+
+    assert parse(
+        {"output": {"label": "human"}, "certainty": 87}, text_length=0, language="ru"
+    ) == (DetectionResult.HUMAN_WRITTEN, 0.87)
+    assert parse({"probability": "0.8"}, text_length=0, language="ru") == (
+        DetectionResult.AI_GENERATED,
+        0.8,
+    )
+    assert parse(["not", "a", "dict"], text_length=0, language="ru") == (
+        DetectionResult.UNCERTAIN,
+        0.0,
+    )
+
+
+def test_parse_detection_tolerates_malformed_optional_fields(model_service):
+    parse = model_service._parse_detection
+
+    assert parse(
+        {"label": "ai", "ai_probability": 0.9, "model": {"name": "x"}},
+        text_length=0,
+        language="ru",
+    ) == (DetectionResult.AI_GENERATED, 0.9)
+    assert parse(
+        {"label": "human", "ai_probability": 0.2, "certainty": "n/a"},
+        text_length=0,
+        language="ru",
+    ) == (DetectionResult.HUMAN_WRITTEN, 0.2)
+    assert parse(
+        {"label": 1, "ai_probability": 0.9},
+        text_length=0,
+        language="ru",
+    ) == (DetectionResult.AI_GENERATED, 0.9)
+    assert parse(
+        {"label": "human", "ai_probability": "n/a"},
+        text_length=0,
+        language="ru",
+    ) == (DetectionResult.HUMAN_WRITTEN, 0.0)
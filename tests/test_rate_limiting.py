@@ -3,8 +3,8 @@ Tests for rate limiting functionality.
 """
 
 import pytest
-from datetime import datetime, timezone
-from unittest.mock import AsyncMock, MagicMock
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock
 
 from src.dtos.rate_limit_dto import (
     RateLimitExceeded,
@@ -12,16 +12,15 @@ from src.dtos.rate_limit_dto import (
     RateLimitPeriod,
     RateLimitStatus,
 )
-from src.infrastructure.redis_client import RedisClient
+from src.core.redis_config import redis_config
 from src.repositories.rate_limiter_repository import RateLimiterRepository
 from src.services.rate_limiter_service import RateLimiterService
 
 
 @pytest.fixture
-def mock_redis_client():
-    """Create mock Redis client."""
-    client = AsyncMock(spec=RedisClient)
-    return client
+def now():
+    """One clock reading shared by every limit built in a test."""
+    return datetime.now(timezone.utc)
 
 
 @pytest.fixture
@@ -40,153 +39,169 @@ class TestRateLimiterRepository:
     """Test rate limiter repository."""
 
     @pytest.mark.asyncio
-    async def test_check_rate_limit_within_limit(self, rate_limiter_repository, mock_redis_client):
-        """Test checking rate limit when within limit."""
-        # Mock Redis to return current count of 5
-        mock_redis_client.get.return_value = "5"
+    async def test_get_rate_limit_status(self, rate_limiter_repository, mock_redis_client):
+        """Test getting complete rate limit status."""
+        # Mock minute and hour counts
+        mock_redis_client.mget.return_value = ["3", "25"]  # minute, hour
 
         user_id = "test_user"
-        is_allowed, limit_info = await rate_limiter_repository.check_rate_limit(
-            user_id, RateLimitPeriod.MINUTE
-        )
+        status = await rate_limiter_repository.get_rate_limit_status(user_id)
 
-        assert is_allowed is True
-        assert limit_info.limit == 10  # Default limit
-        assert limit_info.remaining == 5  # 10 - 5
-        assert limit_info.period == RateLimitPeriod.MINUTE
+        assert status.user_id == user_id
+        assert status.is_allowed is True
+        assert status.minute_limit.remaining == 7  # 10 - 3
+        assert status.hour_limit.remaining == 75  # 100 - 25
+        # Both counters come back from a single MGET
+        mock_redis_client.mget.assert_awaited_once()
+        mock_redis_client.get.assert_not_called()
 
     @pytest.mark.asyncio
-    async def test_check_rate_limit_at_limit(self, rate_limiter_repository, mock_redis_client):
-        """Test checking rate limit when at limit."""
-        # Mock Redis to return current count of 10
-        mock_redis_client.get.return_value = "10"
+    async def test_get_rate_limit_status_minute_exceeded(self, rate_limiter_repository, mock_redis_client):
+        """Test status when minute limit exceeded."""
+        # Mock minute limit exceeded
+        mock_redis_client.mget.return_value = ["10", "25"]  # minute at limit, hour ok
 
         user_id = "test_user"
-        is_allowed, limit_info = await rate_limiter_repository.check_rate_limit(
-            user_id, RateLimitPeriod.MINUTE
-        )
+        status = await rate_limiter_repository.get_rate_limit_status(user_id)
 
-        assert is_allowed is False
-        assert limit_info.remaining == 0
+        assert status.is_allowed is False  # Minute limit hit
+        assert status.minute_limit.remaining == 0
 
     @pytest.mark.asyncio
-    async def test_check_rate_limit_no_previous_requests(self, rate_limiter_repository, mock_redis_client):
-        """Test checking rate limit with no previous requests."""
-        # Mock Redis to return None (no key exists)
-        mock_redis_client.get.return_value = None
+    async def test_check_and_increment_admits(self, rate_limiter_repository, mock_redis_client):
+        """One script call checks and counts both windows."""
+        mock_redis_client.run_script.return_value = [1, 3, 7]
 
-        user_id = "test_user"
-        is_allowed, limit_info = await rate_limiter_repository.check_rate_limit(
-            user_id, RateLimitPeriod.MINUTE
-        )
+        is_allowed, status = await rate_limiter_repository.check_and_increment("test_user")
 
         assert is_allowed is True
-        assert limit_info.remaining == 10  # Full limit
+        assert status.minute_limit.remaining == redis_config.RATE_LIMIT_PER_MINUTE - 3
+        assert status.hour_limit.remaining == redis_config.RATE_LIMIT_PER_HOUR - 7
+        mock_redis_client.run_script.assert_awaited_once()
+        assert mock_redis_client.run_script.call_args.kwargs["args"][2:] == [60, 3600]
 
     @pytest.mark.asyncio
-    async def test_increment_rate_limit_first_time(self, rate_limiter_repository, mock_redis_client):
-        """Test incrementing rate limit for first time."""
-        # Mock Redis incr to return 1 (first increment)
-        mock_redis_client.incr.return_value = 1
+    async def test_check_and_increment_rejects(self, rate_limiter_repository, mock_redis_client):
+        """A rejected request reports the unchanged counters."""
+        limit = redis_config.RATE_LIMIT_PER_MINUTE
+        mock_redis_client.run_script.return_value = [0, limit, 4]
 
-        user_id = "test_user"
-        count = await rate_limiter_repository.increment_rate_limit(
-            user_id, RateLimitPeriod.MINUTE
-        )
+        is_allowed, status = await rate_limiter_repository.check_and_increment("test_user")
 
-        assert count == 1
-        # Verify expire was called
-        mock_redis_client.expire.assert_called_once()
+        assert is_allowed is False
+        assert status.minute_limit.remaining == 0
 
     @pytest.mark.asyncio
-    async def test_increment_rate_limit_subsequent(self, rate_limiter_repository, mock_redis_client):
-        """Test incrementing rate limit for subsequent requests."""
-        # Mock Redis incr to return 5 (not first increment)
-        mock_redis_client.incr.return_value = 5
+    async def test_check_and_increment_sliding_admits(self, rate_limiter_repository, mock_redis_client):
+        """One script call checks and records both sliding logs."""
+        mock_redis_client.run_script.return_value = [1, 3, 7, 1_000, 2_000]
 
-        user_id = "test_user"
-        count = await rate_limiter_repository.increment_rate_limit(
-            user_id, RateLimitPeriod.MINUTE
-        )
+        is_allowed, status = await rate_limiter_repository.check_and_increment_sliding("test_user")
 
-        assert count == 5
-        # Expire should not be called for subsequent increments
-        mock_redis_client.expire.assert_not_called()
+        assert is_allowed is True
+        assert status.minute_limit.remaining == redis_config.RATE_LIMIT_PER_MINUTE - 3
+        assert status.hour_limit.remaining == redis_config.RATE_LIMIT_PER_HOUR - 7
+        kwargs = mock_redis_client.run_script.call_args.kwargs
+        assert kwargs["keys"] == [
+            "rate_limit:test_user:sliding:60",
+            "rate_limit:test_user:sliding:3600",
+        ]
+        # ARGV: now_ms, minute_window_ms, hour_window_ms, limits, unique member
+        assert kwargs["args"][1:3] == [60_000, 3_600_000]
+        assert kwargs["args"][5].startswith(f"{kwargs['args'][0]}:")
 
     @pytest.mark.asyncio
-    async def test_get_rate_limit_status(self, rate_limiter_repository, mock_redis_client):
-        """Test getting complete rate limit status."""
-        # Mock minute and hour counts
-        mock_redis_client.get.side_effect = ["3", "25"]  # minute, hour
+    async def test_check_and_increment_sliding_resets_when_oldest_expires(
+        self, rate_limiter_repository, mock_redis_client
+    ):
+        """reset_at is when the oldest logged request leaves its window."""
+        limit = redis_config.RATE_LIMIT_PER_MINUTE
+        mock_redis_client.run_script.return_value = [0, limit, 4, 1_700_000_000_000, 1_699_999_000_000]
 
-        user_id = "test_user"
-        status = await rate_limiter_repository.get_rate_limit_status(user_id)
+        is_allowed, status = await rate_limiter_repository.check_and_increment_sliding("test_user")
 
-        assert status.user_id == user_id
-        assert status.is_allowed is True
-        assert status.minute_limit.remaining == 7  # 10 - 3
-        assert status.hour_limit.remaining == 75  # 100 - 25
+        assert is_allowed is False
+        assert status.minute_limit.remaining == 0
+        assert status.minute_limit.reset_at.timestamp() == 1_700_000_060
+        assert status.hour_limit.reset_at.timestamp() == 1_699_999_000 + 3600
 
     @pytest.mark.asyncio
-    async def test_get_rate_limit_status_minute_exceeded(self, rate_limiter_repository, mock_redis_client):
-        """Test status when minute limit exceeded."""
-        # Mock minute limit exceeded
-        mock_redis_client.get.side_effect = ["10", "25"]  # minute at limit, hour ok
+    async def test_get_sliding_rate_limit_status(self, rate_limiter_repository, mock_redis_client):
+        """Status in sliding mode is read from the logs without recording a request."""
+        limit = redis_config.RATE_LIMIT_PER_MINUTE
+        mock_redis_client.run_script.return_value = [limit, 4, 1_700_000_000_000, 1_699_999_000_000]
 
-        user_id = "test_user"
-        status = await rate_limiter_repository.get_rate_limit_status(user_id)
+        status = await rate_limiter_repository.get_sliding_rate_limit_status("test_user")
 
-        assert status.is_allowed is False  # Minute limit hit
+        assert status.is_allowed is False
         assert status.minute_limit.remaining == 0
+        assert status.hour_limit.remaining == redis_config.RATE_LIMIT_PER_HOUR - 4
+        assert status.minute_limit.reset_at.timestamp() == 1_700_000_060
+        kwargs = mock_redis_client.run_script.call_args.kwargs
+        assert kwargs["keys"] == [
+            "rate_limit:test_user:sliding:60",
+            "rate_limit:test_user:sliding:3600",
+        ]
+        assert len(kwargs["args"]) == 3  # now, both windows; no member to add
+        mock_redis_client.mget.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_reset_rate_limits(self, rate_limiter_repository, mock_redis_client):
         """Test resetting rate limits."""
-        mock_redis_client.delete.return_value = 3
+        mock_redis_client.unlink_matching.return_value = 3
 
         user_id = "test_user"
         await rate_limiter_repository.reset_rate_limits(user_id)
 
-        mock_redis_client.delete.assert_called_once()
+        mock_redis_client.unlink_matching.assert_called_once_with("rate_limit:test_user:*")
 
 
 class TestRateLimiterService:
     """Test rate limiter service."""
 
     @pytest.mark.asyncio
-    async def test_check_and_increment_success(self, rate_limiter_service, rate_limiter_repository):
+    async def test_check_and_increment_success(self, rate_limiter_service, rate_limiter_repository, now):
         """Test successful rate limit check and increment."""
         # Mock repository to return allowed status
-        mock_status = MagicMock(spec=RateLimitStatus)
-        mock_status.is_allowed = True
-        mock_status.minute_limit = MagicMock(remaining=5)
-        mock_status.hour_limit = MagicMock(remaining=50)
+        mock_status = RateLimitStatus(
+            user_id="test_user",
+            is_allowed=True,
+            minute_limit=RateLimitInfo(
+                limit=10, remaining=5, reset_at=now, period=RateLimitPeriod.MINUTE
+            ),
+            hour_limit=RateLimitInfo(
+                limit=100, remaining=50, reset_at=now, period=RateLimitPeriod.HOUR
+            ),
+        )
 
-        rate_limiter_repository.get_rate_limit_status = AsyncMock(return_value=mock_status)
-        rate_limiter_repository.increment_rate_limit = AsyncMock()
+        rate_limiter_repository.check_and_increment = AsyncMock(
+            return_value=(True, mock_status)
+        )
+        rate_limiter_repository.get_rate_limit_status = AsyncMock()
 
         user_id = "test_user"
         result = await rate_limiter_service.check_and_increment(user_id)
 
-        assert result.is_allowed is True
-        # Verify increment was called for both periods
-        assert rate_limiter_repository.increment_rate_limit.call_count == 2
+        assert result is mock_status
+        # Check and increment happen in one atomic call; status is not re-read
+        rate_limiter_repository.check_and_increment.assert_awaited_once_with(user_id)
+        rate_limiter_repository.get_rate_limit_status.assert_not_called()
 
     @pytest.mark.asyncio
-    async def test_check_and_increment_minute_exceeded(self, rate_limiter_service, rate_limiter_repository):
+    async def test_check_and_increment_minute_exceeded(self, rate_limiter_service, rate_limiter_repository, now):
         """Test rate limit exceeded for minute period."""
         # Create mock limit info for minute
         mock_minute_limit = RateLimitInfo(
             limit=10,
             remaining=0,
-            reset_at=datetime.now(timezone.utc),
+            reset_at=now,
             period=RateLimitPeriod.MINUTE
         )
 
         mock_hour_limit = RateLimitInfo(
             limit=100,
             remaining=50,
-            reset_at=datetime.now(timezone.utc),
+            reset_at=now,
             period=RateLimitPeriod.HOUR
         )
 
@@ -197,7 +212,9 @@ class TestRateLimiterService:
             hour_limit=mock_hour_limit
         )
 
-        rate_limiter_repository.get_rate_limit_status = AsyncMock(return_value=mock_status)
+        rate_limiter_repository.check_and_increment = AsyncMock(
+            return_value=(False, mock_status)
+        )
 
         user_id = "test_user"
         with pytest.raises(RateLimitExceeded) as exc_info:
@@ -207,19 +224,19 @@ class TestRateLimiterService:
         assert exc_info.value.retry_after > 0
 
     @pytest.mark.asyncio
-    async def test_check_and_increment_hour_exceeded(self, rate_limiter_service, rate_limiter_repository):
+    async def test_check_and_increment_hour_exceeded(self, rate_limiter_service, rate_limiter_repository, now):
         """Test rate limit exceeded for hour period."""
         mock_minute_limit = RateLimitInfo(
             limit=10,
             remaining=5,
-            reset_at=datetime.now(timezone.utc),
+            reset_at=now,
             period=RateLimitPeriod.MINUTE
         )
 
         mock_hour_limit = RateLimitInfo(
             limit=100,
             remaining=0,
-            reset_at=datetime.now(timezone.utc),
+            reset_at=now,
             period=RateLimitPeriod.HOUR
         )
 
@@ -230,7 +247,9 @@ class TestRateLimiterService:
             hour_limit=mock_hour_limit
         )
 
-        rate_limiter_repository.get_rate_limit_status = AsyncMock(return_value=mock_status)
+        rate_limiter_repository.check_and_increment = AsyncMock(
+            return_value=(False, mock_status)
+        )
 
         user_id = "test_user"
         with pytest.raises(RateLimitExceeded) as exc_info:
@@ -239,18 +258,64 @@ class TestRateLimiterService:
         assert "hour" in str(exc_info.value.message).lower()
 
     @pytest.mark.asyncio
-    async def test_get_status(self, rate_limiter_service, rate_limiter_repository):
+    async def test_sliding_retry_after_waits_for_oldest_entry(
+        self, rate_limiter_service, rate_limiter_repository, monkeypatch, now
+    ):
+        """Sliding mode reports the time until a slot frees, not a full window."""
+        monkeypatch.setattr(redis_config, "RATE_LIMIT_SLIDING_WINDOW", True)
+        minute_limit = RateLimitInfo(
+            limit=10, remaining=0, reset_at=now + timedelta(seconds=12), period=RateLimitPeriod.MINUTE
+        )
+        hour_limit = RateLimitInfo(
+            limit=100, remaining=50, reset_at=now + timedelta(seconds=900), period=RateLimitPeriod.HOUR
+        )
+        rate_limiter_repository.check_and_increment_sliding = AsyncMock(
+            return_value=(False, RateLimitStatus("test_user", False, minute_limit, hour_limit))
+        )
+
+        with pytest.raises(RateLimitExceeded) as exc_info:
+            await rate_limiter_service.check_and_increment("test_user")
+
+        assert 10 <= exc_info.value.retry_after <= 12
+        assert exc_info.value.limit_info.period == RateLimitPeriod.MINUTE
+
+    @pytest.mark.asyncio
+    async def test_get_status(self, rate_limiter_service, rate_limiter_repository, now):
         """Test getting rate limit status without incrementing."""
-        mock_status = MagicMock(spec=RateLimitStatus)
+        mock_status = RateLimitStatus(
+            user_id="test_user",
+            is_allowed=True,
+            minute_limit=RateLimitInfo(
+                limit=10, remaining=5, reset_at=now, period=RateLimitPeriod.MINUTE
+            ),
+            hour_limit=RateLimitInfo(
+                limit=100, remaining=50, reset_at=now, period=RateLimitPeriod.HOUR
+            ),
+        )
         rate_limiter_repository.get_rate_limit_status = AsyncMock(return_value=mock_status)
-        rate_limiter_repository.increment_rate_limit = AsyncMock()
+        rate_limiter_repository.check_and_increment = AsyncMock()
 
         user_id = "test_user"
         result = await rate_limiter_service.get_status(user_id)
 
-        assert result == mock_status
+        assert result is mock_status
+        assert result.requests_remaining == 5
         # Verify no increment was called
-        rate_limiter_repository.increment_rate_limit.assert_not_called()
+        rate_limiter_repository.check_and_increment.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_get_status_sliding_reads_logs(
+        self, rate_limiter_service, rate_limiter_repository, monkeypatch
+    ):
+        """In sliding mode the status comes from the sliding logs, not the counters."""
+        monkeypatch.setattr(redis_config, "RATE_LIMIT_SLIDING_WINDOW", True)
+        rate_limiter_repository.get_sliding_rate_limit_status = AsyncMock()
+        rate_limiter_repository.get_rate_limit_status = AsyncMock()
+
+        await rate_limiter_service.get_status("test_user")
+
+        rate_limiter_repository.get_sliding_rate_limit_status.assert_awaited_once_with("test_user")
+        rate_limiter_repository.get_rate_limit_status.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_reset_limits(self, rate_limiter_service, rate_limiter_repository):
@@ -266,19 +331,19 @@ class TestRateLimiterService:
 class TestRateLimitDTO:
     """Test rate limit DTOs."""
 
-    def test_rate_limit_status_requests_remaining(self):
+    def test_rate_limit_status_requests_remaining(self, now):
         """Test requests_remaining property."""
         minute_limit = RateLimitInfo(
             limit=10,
             remaining=3,
-            reset_at=datetime.now(timezone.utc),
+            reset_at=now,
             period=RateLimitPeriod.MINUTE
         )
 
         hour_limit = RateLimitInfo(
             limit=100,
             remaining=50,
-            reset_at=datetime.now(timezone.utc),
+            reset_at=now,
             period=RateLimitPeriod.HOUR
         )
 
@@ -292,12 +357,12 @@ class TestRateLimitDTO:
         # Should return minimum (most restrictive)
         assert status.requests_remaining == 3
 
-    def test_rate_limit_exceeded_exception(self):
+    def test_rate_limit_exceeded_exception(self, now):
         """Test RateLimitExceeded exception."""
         limit_info = RateLimitInfo(
             limit=10,
             remaining=0,
-            reset_at=datetime.now(timezone.utc),
+            reset_at=now,
             period=RateLimitPeriod.MINUTE
         )
 
@@ -310,4 +375,3 @@ class TestRateLimitDTO:
         assert exc.message == "Rate limit exceeded"
         assert exc.retry_after == 60
         assert exc.limit_info == limit_info
-
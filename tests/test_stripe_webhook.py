@@ -211,6 +211,34 @@ class TestSubscriptionUpsert:
             is_premium=True,
         )
 
+    @pytest.mark.asyncio
+    async def test_limit_cache_invalidated_after_commit(
+        self, mock_subscription_repo, mock_ai_detection_repo, mock_auth_repo
+    ):
+        calls: list[str] = []
+        mock_auth_repo.session.commit.side_effect = lambda: calls.append("commit")
+        limit_cache = AsyncMock()
+        limit_cache.invalidate.side_effect = lambda user_id: calls.append(f"invalidate:{user_id}")
+        service = StripeService(
+            config=_make_config(),
+            subscription_repo=mock_subscription_repo,
+            ai_detection_repo=mock_ai_detection_repo,
+            auth_repo=mock_auth_repo,
+            limit_cache=limit_cache,
+        )
+        event = _make_event("customer.subscription.updated", "evt_upd", {
+            "id": "sub_123",
+            "customer": "cus_123",
+            "status": "active",
+            "current_period_end": int(time.time()) + 86400 * 30,
+            "cancel_at_period_end": False,
+            "metadata": {"user_id": "user_01"},
+        })
+
+        await service.handle_event(event)
+
+        assert calls == ["commit", "invalidate:user_01"]
+
     @pytest.mark.asyncio
     async def test_past_due_subscription_reverts_to_free(self, stripe_service, mock_subscription_repo, mock_ai_detection_repo):
         event = _make_event("customer.subscription.updated", "evt_past", {
@@ -0,0 +1,143 @@
+"""
+Tests for Telegram document downloads and chat-action upkeep.
+"""
+
+import asyncio
+import io
+from types import SimpleNamespace
+
+import pytest
+
+from src.services.telegram_bot_service import TelegramBotService
+
+
+class _FakeResponse:
+    def __init__(self, status: int, headers: dict[str, str], body: bytes):
+        self.status = status
+        self.headers = headers
+        self.body = body
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def read(self) -> bytes:
+        return self.body
+
+
+class _FakeSession:
+    def __init__(self, payload: bytes, honour_range: bool = True):
+        self.payload = payload
+        self.honour_range = honour_range
+        self.ranges: list[str] = []
+        self.api = SimpleNamespace(
+            is_local=False, file_url=lambda token, path: f"https://files/{path}"
+        )
+
+    def _body(self, header: str) -> bytes:
+        self.ranges.append(header)
+        first, last = (int(x) for x in header.removeprefix("bytes=").split("-"))
+        return self.payload[first : last + 1] if self.honour_range else self.payload
+
+    async def create_session(self):
+        return self
+
+    def get(self, url, headers=None, timeout=None, raise_for_status=False):
+        header = headers["Range"]
+        body = self._body(header)
+        if not self.honour_range:
+            return _FakeResponse(200, {}, body)
+        first, last = header.removeprefix("bytes=").split("-")
+        content_range = f"bytes {first}-{last}/{len(self.payload)}"
+        return _FakeResponse(206, {"Content-Range": content_range}, body)
+
+    async def stream_content(self, url, headers=None):
+        body = self._body(headers["Range"])
+        for i in range(0, len(body), 1000):
+            yield body[i : i + 1000]
+
+
+class _FakeBot:
+    token = "123:abc"
+
+    def __init__(self, session: _FakeSession):
+        self.session = session
+        self.single_downloads = 0
+
+    async def get_file(self, file_id):
+        return SimpleNamespace(file_path=f"documents/{file_id}.pdf")
+
+    async def download_file(self, file_path):
+        self.single_downloads += 1
+        return io.BytesIO(self.session.payload)
+
+
+def _service(session: _FakeSession) -> TelegramBotService:
+    svc = TelegramBotService.__new__(TelegramBotService)
+    svc.bot = _FakeBot(session)
+    return svc
+
+
+@pytest.mark.asyncio
+async def test_large_document_downloaded_in_ranges():
+    payload = bytes(range(256)) * 8193  # just over 2 MB
+    session = _FakeSession(payload)
+    svc = _service(session)
+
+    data = await svc._download_bytes_parallel("f1", len(payload))
+
+    assert data == payload
+    assert len(session.ranges) == 4
+    assert svc.bot.single_downloads == 0
+
+
+@pytest.mark.asyncio
+async def test_range_ignored_and_small_files_fall_back():
+    payload = b"x" * 2_000_000
+    session = _FakeSession(payload, honour_range=False)
+    svc = _service(session)
+
+    assert await svc._download_bytes_parallel("f1", len(payload)) == payload
+    # The probe's full 200 body is used; no further ranges or re-download
+    assert len(session.ranges) == 1
+    assert svc.bot.single_downloads == 0
+    assert await svc._download_bytes_parallel("f2", 10) == payload
+    assert svc.bot.single_downloads == 1
+
+
+@pytest.mark.asyncio
+async def test_stale_file_size_falls_back_after_probe():
+    payload = b"y" * 3_000_000
+    session = _FakeSession(payload)
+    svc = _service(session)
+
+    # The message reports a size the file no longer has
+    assert await svc._download_bytes_parallel("f1", 2_000_000) == payload
+    assert len(session.ranges) == 1
+    assert svc.bot.single_downloads == 1
+
+
+@pytest.mark.asyncio
+async def test_chat_action_refreshed_until_block_exits(monkeypatch):
+    from src.telegram_bot.routers import analyze
+
+    monkeypatch.setattr(analyze, "_CHAT_ACTION_REFRESH_SECONDS", 0.01)
+    sent = []
+
+    async def send_chat_action(chat_id, action):
+        sent.append(action)
+
+    message = SimpleNamespace(
+        chat=SimpleNamespace(id=1),
+        bot=SimpleNamespace(send_chat_action=send_chat_action),
+    )
+
+    async with analyze._keep_chat_action(message, "typing"):
+        await asyncio.sleep(0.055)
+    count = len(sent)
+    await asyncio.sleep(0.03)
+
+    assert count >= 3
+    assert len(sent) == count
@@ -0,0 +1,38 @@
+"""
+Tests for outgoing Telegram API throttling.
+"""
+
+import time
+
+import pytest
+from aiogram.methods import SendChatAction, SendMessage
+
+from src.telegram_bot.throttling import OutgoingThrottleMiddleware, TokenBucket
+
+
+@pytest.mark.asyncio
+async def test_bucket_allows_burst_then_paces():
+    bucket = TokenBucket(rate=50, capacity=2)
+    start = time.monotonic()
+
+    for _ in range(4):
+        await bucket.acquire()
+
+    # Two tokens are immediate, the next two wait ~1/50 s each
+    assert 0.03 <= time.monotonic() - start < 0.5
+
+
+@pytest.mark.asyncio
+async def test_middleware_throttles_per_chat_only_for_messages():
+    middleware = OutgoingThrottleMiddleware(chat_per_second=1000, chat_burst=1)
+    sent = []
+
+    async def make_request(bot, method):
+        sent.append(method)
+        return "ok"
+
+    await middleware(make_request, None, SendMessage(chat_id=1, text="a"))
+    await middleware(make_request, None, SendChatAction(chat_id=2, action="typing"))
+
+    assert len(sent) == 2
+    assert set(middleware._chats) == {1}
@@ -0,0 +1,27 @@
+"""
+Tests for Markdown → plain-text cleaning.
+"""
+
+from src.services.text_cleaner_service import TextCleanerService
+
+
+def test_markup_and_noise_lines_removed():
+    markdown = (
+        "# Title\n"
+        "Some **bold** text with a [link](https://example.com).\n"
+        "  ---  \n"
+        "!!! ...\n"
+        "https://example.com/page\n"
+        "Last line."
+    )
+
+    assert TextCleanerService().clean(markdown) == (
+        "Title\nSome bold text with a link.\n\nLast line."
+    )
+
+
+def test_long_space_padded_line_is_cleaned_in_linear_time():
+    # The old punctuation-only pattern backtracked cubically on this input.
+    text = "Intro.\n" + " " * 20_000 + "word"
+
+    assert TextCleanerService().clean(text) == "Intro.\nword"
@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import asyncio
+
+import httpx
 import pytest
 
 from src.dtos.ai_detection_dto import NewspaperFetchResultDTO
@@ -11,6 +14,7 @@ from src.services.url_extraction.domain import is_wikipedia_host, parsed_host
 from src.services.url_extraction.quality import evaluate_text_quality
 from src.services.url_extraction.bs4_generic import extract_generic_text
 from src.services.url_extraction.bs4_wikipedia import extract_wikipedia_text
+from src.services.url_extraction.text import collapse_ws
 
 
 def _long_paragraph() -> str:
@@ -62,6 +66,17 @@ class TestDomain:
     def test_parsed_host(self) -> None:
         assert parsed_host("https://EN.WIKIPEDIA.org/wiki/X") == "en.wikipedia.org"
 
+    def test_validate_url_fast_path_matches_urlparse(self) -> None:
+        for url in (
+            "https://EN.WIKIPEDIA.org/wiki/X",
+            "http://example.kz:8080?q=1",
+            "https://user:pw@example.com/a",
+        ):
+            assert NewspaperService._validate_url(url) == parsed_host(url)
+        for url in ("ftp://example.com/", "https://", "example.com"):
+            with pytest.raises(ValueError):
+                NewspaperService._validate_url(url)
+
 
 class TestBs4Extractors:
     def test_generic_extracts_main(self) -> None:
@@ -234,3 +249,167 @@ class TestNewspaperServiceOrchestration:
         svc = NewspaperService()
         dto = await svc.fetch_article("https://example.com/big")
         assert dto.html_truncated is True
+
+    async def test_prefer_bs4_skips_newspaper_when_bs4_accepted(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        html = _html_article_main()
+
+        async def dl(self, url: str) -> DownloadedHtml:
+            return DownloadedHtml(
+                content=html,
+                truncated=False,
+                original_text_length=len(html),
+            )
+
+        monkeypatch.setattr(NewspaperService, "_download_html", dl)
+        monkeypatch.setattr("src.services.newspaper_service.PREFER_BS4_EXTRACTION", True)
+
+        def fail_np(url: str, raw: str) -> NewspaperFetchResultDTO:
+            raise RuntimeError("newspaper should not run")
+
+        monkeypatch.setattr(
+            NewspaperService, "_parse_with_newspaper", staticmethod(fail_np)
+        )
+
+        svc = NewspaperService()
+        dto = await svc.fetch_article("https://example.com/news/2")
+        assert dto.extraction_method == "bs4_generic"
+        assert dto.fallback_used is False
+
+
+@pytest.mark.asyncio
+class TestInFlightFetch:
+    async def test_concurrent_fetches_share_one_download(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        html = _html_article_main()
+        calls: list[str] = []
+
+        async def slow_download(self, url: str) -> DownloadedHtml:
+            calls.append(url)
+            await asyncio.sleep(0.01)
+            return DownloadedHtml(
+                content=html, truncated=False, original_text_length=len(html)
+            )
+
+        monkeypatch.setattr(NewspaperService, "_download_html", slow_download)
+
+        svc = NewspaperService()
+        first, second = await asyncio.gather(
+            svc.fetch_article("https://example.com/news/1"),
+            svc.fetch_article("https://example.com/news/1"),
+        )
+        assert calls == ["https://example.com/news/1"]
+        assert first is second
+
+        await svc.fetch_article("https://example.com/news/1")
+        assert len(calls) == 2
+
+    async def test_cancelled_caller_does_not_cancel_shared_fetch(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        html = _html_article_main()
+
+        async def slow_download(self, url: str) -> DownloadedHtml:
+            await asyncio.sleep(0.02)
+            return DownloadedHtml(
+                content=html, truncated=False, original_text_length=len(html)
+            )
+
+        monkeypatch.setattr(NewspaperService, "_download_html", slow_download)
+
+        svc = NewspaperService()
+        quitter = asyncio.create_task(svc.fetch_article("https://example.com/news/1"))
+        stayer = asyncio.create_task(svc.fetch_article("https://example.com/news/1"))
+        await asyncio.sleep(0)
+        quitter.cancel()
+
+        dto = await stayer
+        assert "Lorem ipsum" in dto.text
+
+
+@pytest.mark.asyncio
+class TestDownloadCache:
+    async def test_revalidates_with_etag_and_serves_cached_on_304(self) -> None:
+        seen: list[str | None] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen.append(request.headers.get("if-none-match"))
+            if request.headers.get("if-none-match") == '"v1"':
+                return httpx.Response(304)
+            return httpx.Response(200, text="<p>page</p>", headers={"ETag": '"v1"'})
+
+        svc = NewspaperService()
+        svc._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        try:
+            first = await svc._download_html("https://example.com/a")
+            second = await svc._download_html("https://example.com/a")
+        finally:
+            await svc.close()
+
+        assert seen == [None, '"v1"']
+        assert second is first
+
+    async def test_pages_without_validators_are_not_cached(self) -> None:
+        seen: list[str | None] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen.append(request.headers.get("if-none-match"))
+            return httpx.Response(200, text="<p>page</p>")
+
+        svc = NewspaperService()
+        svc._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        try:
+            await svc._download_html("https://example.com/a")
+            await svc._download_html("https://example.com/a")
+        finally:
+            await svc.close()
+
+        assert seen == [None, None]
+        assert svc._html_cache == {}
+
+    async def test_stops_reading_past_the_cap(self) -> None:
+        body = "ж" * (MAX_HTML_TEXT_LENGTH + 50_000)
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(
+                200, content=body.encode(), headers={"Content-Type": "text/html; charset=utf-8"}
+            )
+
+        svc = NewspaperService()
+        svc._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        try:
+            page = await svc._download_html("https://example.com/big")
+        finally:
+            await svc.close()
+
+        assert page.truncated is True
+        assert page.content == body[:MAX_HTML_TEXT_LENGTH]
+        assert MAX_HTML_TEXT_LENGTH < page.original_text_length <= len(body)
+
+    async def test_decodes_with_meta_charset_when_header_has_none(self) -> None:
+        body = '<html><head><meta charset="windows-1251"></head><p>Привет</p></html>'
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(
+                200, content=body.encode("cp1251"), headers={"Content-Type": "text/html"}
+            )
+
+        svc = NewspaperService()
+        svc._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        try:
+            page = await svc._download_html("https://example.com/cp1251")
+        finally:
+            await svc.close()
+
+        assert page.content == body
+
+
+def test_collapse_ws_strips_lines_and_drops_blanks():
+    assert collapse_ws("  a  \n\n \t\r\n b \u2028 c\n   ") == "a\nb\nc"
+
+
+def test_collapse_ws_long_whitespace_run_is_fast():
+    text = "x" + " " * 200_000 + "y"
+    assert collapse_ws(text) == text
@@ -0,0 +1,36 @@
+"""
+Tests for the URL detection pipeline.
+"""
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.api.v1.schemas.detection_language import DetectionLanguageContext
+from src.services.url_detection_service import URLDetectionService
+
+
+@pytest.mark.asyncio
+async def test_over_quota_user_never_triggers_a_download():
+    newspaper = MagicMock()
+    newspaper.fetch_article = AsyncMock()
+    repo = MagicMock()
+    repo.can_make_request = AsyncMock(
+        return_value=(
+            False,
+            SimpleNamespace(
+                daily_used=5, daily_limit=5, monthly_used=5, monthly_limit=100
+            ),
+        )
+    )
+    svc = URLDetectionService(newspaper, MagicMock(), repo, MagicMock())
+
+    with pytest.raises(ValueError, match="Request limit exceeded"):
+        await svc.detect_from_url(
+            "https://example.com/a",
+            "user-1",
+            language=DetectionLanguageContext(effective="en", requested="auto"),
+        )
+
+    newspaper.fetch_article.assert_not_called()